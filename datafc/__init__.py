@@ -9,10 +9,21 @@ from .exceptions import (
     APIError,
     RateLimitError,
     ServerError,
+    CacheMissError,
+    CircuitOpenError,
     DataNotAvailableError,
 )
 from .utils._cache import DiskCache, get_default_cache, set_default_cache
-from .utils._save_files import save_parquet
+from .utils._circuit import set_circuit_breaker, reset_circuit_breakers
+from .utils._failover import set_failover
+from .utils._proxy import ProxyPool, get_default_proxy_pool, set_default_proxy_pool
+from .sofascore._bridge import get_sync_engine, set_sync_engine, shutdown_sync_engine
+from .utils._executor import get_parse_executor, set_parse_executor
+from .utils._backend import get_default_backend, set_default_backend
+from .utils._save_files import save_npz, save_parquet
+from .utils._spill import SpilledDataset
+from .utils._spatial import SpatialStore
+from .sofascore._heatmap import HeatmapGrids
 from .utils._config import (
     get_tournament_url_patterns,
     set_tournament_url_patterns,
@@ -73,13 +84,38 @@ __all__ = [
     "APIError",
     "RateLimitError",
     "ServerError",
+    "CacheMissError",
+    "CircuitOpenError",
     "DataNotAvailableError",
     # Cache
     "DiskCache",
     "get_default_cache",
     "set_default_cache",
+    # Circuit breaker
+    "set_circuit_breaker",
+    "reset_circuit_breakers",
+    # Mirror failover
+    "set_failover",
+    # Proxy pool
+    "ProxyPool",
+    "get_default_proxy_pool",
+    "set_default_proxy_pool",
+    # Sync engine
+    "get_sync_engine",
+    "set_sync_engine",
+    "shutdown_sync_engine",
+    # Parse executor
+    "get_parse_executor",
+    "set_parse_executor",
+    # Output backend
+    "get_default_backend",
+    "set_default_backend",
     # Export utilities
     "save_parquet",
+    "save_npz",
+    "SpilledDataset",
+    "HeatmapGrids",
+    "SpatialStore",
     # Config
     "get_tournament_url_patterns",
     "set_tournament_url_patterns",
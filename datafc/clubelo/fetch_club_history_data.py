@@ -5,12 +5,14 @@ import pandas as pd
 from datafc.clubelo._client import ClubEloClient
 from datafc.clubelo._parsers import parse_club_history
 from datafc.exceptions import InvalidParameterError
+from datafc.utils._backend import output_backend
 from datafc.utils._config import get_clubelo_base_url
 
 if TYPE_CHECKING:
     from datafc.utils._cache import DiskCache
 
 
+@output_backend
 def club_history_data(
     club: str,
     rate_limit: float = 2.0,
@@ -6,6 +6,7 @@ import pandas as pd
 from datafc.clubelo._client import ClubEloClient
 from datafc.clubelo._parsers import parse_daily_ranking
 from datafc.exceptions import InvalidParameterError
+from datafc.utils._backend import output_backend
 from datafc.utils._config import get_clubelo_base_url
 
 if TYPE_CHECKING:
@@ -27,6 +28,7 @@ def _coerce_date(value: Union[str, _date_cls]) -> str:
     )
 
 
+@output_backend
 def daily_ranking_data(
     date: Union[str, _date_cls],
     rate_limit: float = 2.0,
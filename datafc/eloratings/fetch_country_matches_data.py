@@ -5,12 +5,14 @@ import pandas as pd
 from datafc.eloratings._client import EloRatingsClient
 from datafc.eloratings._parsers import parse_country_matches
 from datafc.exceptions import InvalidParameterError
+from datafc.utils._backend import output_backend
 from datafc.utils._config import get_eloratings_base_url
 
 if TYPE_CHECKING:
     from datafc.utils._cache import DiskCache
 
 
+@output_backend
 def country_matches_data(
     country: str,
     rate_limit: float = 2.0,
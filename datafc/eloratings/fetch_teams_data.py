@@ -4,12 +4,14 @@ import pandas as pd
 
 from datafc.eloratings._client import EloRatingsClient
 from datafc.eloratings._parsers import parse_teams
+from datafc.utils._backend import output_backend
 from datafc.utils._config import get_eloratings_base_url
 
 if TYPE_CHECKING:
     from datafc.utils._cache import DiskCache
 
 
+@output_backend
 def teams_data(
     rate_limit: float = 2.0,
     cache: Optional["DiskCache"] = None,
@@ -42,5 +42,26 @@ class ServerError(APIError):
     """Raised when the API returns a 5xx error after all retries."""
 
 
+class CacheMissError(DataFCError):
+    """Raised in offline mode when a URL is not in the cache (no request is made).
+
+    Not an ``APIError``: the per-match loops log and skip API errors, but a
+    cache miss in offline mode must stop the run rather than return a
+    silently partial frame.
+    """
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        super().__init__(f"Not in cache (offline mode): {url}")
+
+
+class CircuitOpenError(APIError):
+    """Raised without sending a request while the host's circuit breaker is open."""
+
+    def __init__(self, url: str, retry_after: float = 0.0) -> None:
+        self.retry_after = retry_after
+        super().__init__(0, url, f"circuit open, failing fast (retry in {retry_after:.0f}s)")
+
+
 class DataNotAvailableError(DataFCError):
     """Raised when the API returns successfully but contains no usable data."""
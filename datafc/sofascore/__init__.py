@@ -1,5 +1,5 @@
 from .fetch_match_data import match_data
-from .fetch_match_stats_data import match_stats_data
+from .fetch_match_stats_data import match_stats_data, stat_column_index
 from .fetch_standings_data import standings_data
 from .fetch_shots_data import shots_data
 from .fetch_goal_networks_data import goal_networks_data
@@ -33,6 +33,7 @@ from .fetch_player_data import player_data
 from .fetch_player_attribute_overviews_data import player_attribute_overviews_data
 from .fetch_team_data import team_data
 from .fetch_season_rounds_data import season_rounds_data
+from ._stream import iter_data
 from . import aio
 
 __all__ = [
@@ -81,6 +82,10 @@ __all__ = [
     "player_attribute_overviews_data",
     # Team profile
     "team_data",
+    # Reshaping
+    "stat_column_index",
+    # Streaming
+    "iter_data",
     # Async API
     "aio",
 ]
@@ -0,0 +1,167 @@
+"""
+Sync facade over the ``aio`` engine.
+
+The sync ``fetch_*_data`` functions fetch rows one after another (or on a
+thread pool with ``max_workers``). With the ``"aio"`` engine selected they
+instead run their ``aio`` counterpart on a persistent background event loop and
+block until it finishes, so sync callers get the async fan-out without managing
+an event loop — which also works inside Jupyter or a WSGI worker, where a loop
+may already be running in the calling thread.
+
+The background loop lives in a daemon thread started on first use and keeps a
+single ``AsyncSession`` (opened on the first network request) for its lifetime,
+so connections are reused across calls instead of being re-established per
+function.
+
+Usage:
+    from datafc import set_sync_engine
+    from datafc.sofascore import lineups_data
+
+    set_sync_engine("aio")
+    df = lineups_data(match_df)   # runs aio.lineups_data on the background loop
+
+    set_sync_engine("sync")       # default
+"""
+
+import asyncio
+import atexit
+import functools
+import inspect
+import logging
+import threading
+from typing import Any, Callable, Optional, TypeVar
+
+from datafc.exceptions import InvalidParameterError
+from datafc.utils._async_client import LazyAsyncSession, shared_session
+
+logger = logging.getLogger(__name__)
+
+ALLOWED_ENGINES = ("sync", "aio")
+
+# Sync-only parameters that have no aio counterpart (the aio engine is concurrent anyway).
+_SYNC_ONLY_PARAMS = ("max_workers", "processes")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class _BackgroundLoop:
+    """An event loop running forever in a daemon thread, with one shared AsyncSession."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._session: Optional[LazyAsyncSession] = None
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="datafc-aio-engine", daemon=True,
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def in_loop_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    async def _run_with_session(self, coro_fn: Callable, args: tuple, kwargs: dict) -> Any:
+        if self._session is None:
+            self._session = LazyAsyncSession()
+        token = shared_session.set(self._session)
+        try:
+            return await coro_fn(*args, **kwargs)
+        finally:
+            shared_session.reset(token)
+
+    def run(self, coro_fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Run ``coro_fn(*args, **kwargs)`` on the background loop and wait for the result."""
+        loop = self._ensure_started()
+        future = asyncio.run_coroutine_threadsafe(
+            self._run_with_session(coro_fn, args, kwargs), loop,
+        )
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def shutdown(self) -> None:
+        """Close the shared session and stop the loop thread."""
+        with self._lock:
+            loop, thread, session = self._loop, self._thread, self._session
+            self._loop = self._thread = self._session = None
+        if loop is None:
+            return
+        if session is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(session.close(), loop).result(timeout=5)
+            except Exception as exc:
+                logger.debug("Error closing shared AsyncSession: %s", exc)
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+        loop.close()
+
+
+_background = _BackgroundLoop()
+atexit.register(_background.shutdown)
+
+# ---------------------------------------------------------------------------
+# Module-level engine setting
+# ---------------------------------------------------------------------------
+
+_sync_engine: str = "sync"
+
+
+def get_sync_engine() -> str:
+    """Return the engine used by the sync fetch functions (``"sync"`` or ``"aio"``)."""
+    return _sync_engine
+
+
+def set_sync_engine(engine: str) -> None:
+    """
+    Select how the sync ``fetch_*_data`` functions run.
+
+    Args:
+        engine: ``"sync"`` (default) fetches in the calling thread.
+            ``"aio"`` runs the matching ``datafc.sofascore.aio`` function on a
+            persistent background event loop with a shared HTTP session.
+
+    Raises:
+        InvalidParameterError: If engine is not one of ``ALLOWED_ENGINES``.
+    """
+    global _sync_engine
+    if engine not in ALLOWED_ENGINES:
+        raise InvalidParameterError(
+            f"Invalid engine '{engine}'. Must be one of: {', '.join(ALLOWED_ENGINES)}."
+        )
+    _sync_engine = engine
+
+
+def shutdown_sync_engine() -> None:
+    """Stop the background loop and close its session (restarted on next use)."""
+    _background.shutdown()
+
+
+def sync_engine_dispatch(fn: F) -> F:
+    """Decorate a sync fetch function so the ``"aio"`` engine can take it over.
+
+    The aio counterpart is looked up by name in ``datafc.sofascore.aio`` and
+    must accept the same parameters, minus sync-only ones like ``max_workers``.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if _sync_engine != "aio" or _background.in_loop_thread():
+            return fn(*args, **kwargs)
+        from datafc.sofascore import aio
+
+        arguments = inspect.signature(fn).bind(*args, **kwargs).arguments
+        for name in _SYNC_ONLY_PARAMS:
+            arguments.pop(name, None)
+        return _background.run(getattr(aio, fn.__name__), **arguments)
+
+    return wrapper  # type: ignore[return-value]
@@ -4,33 +4,51 @@ Shared control-flow helpers for sync fetch modules and the async mirror (aio.py)
 Every helper here is internal (underscore-prefixed package) and is consumed by the
 thin sync wrappers in ``datafc/sofascore/fetch_*_data.py`` and by ``aio.py``.
 
-The helpers fall into three groups:
-
-* ``_export_df`` — DataFrame -> JSON/Excel export block shared by every fetch.
-* ``iter_per_match_sync`` / ``iter_per_match_async`` — generic per-match iterators
-  parameterised by URL builder, response parser, error policy and record shape.
-* ``resolve_world_cup_week_sync`` / ``_async`` — World Cup knockout round lookup.
-
-Pure record-builder functions for endpoints that are not in ``_parsers.py``
-(squad rosters, player profiles, transfers, etc.) are also kept here so that the
-sync and async versions share the same row schema.
-
-No exception class or behaviour is changed by this module; helpers preserve
-exactly the error policy used in the original duplicated code (per-function
-divergence around ``APIError`` is encoded in the ``catch_api_error`` flags).
+The helpers fall into five groups:
+
+* Export — ``export_df`` is the DataFrame -> JSON/Excel block shared by every
+  fetch; ``finish_spill`` is its counterpart for ``spill_dir`` runs.
+* Thread pool — ``map_rows_sync`` / ``imap_rows_sync`` are an ordered per-row map
+  for the sync per-team / per-player loops, run on a thread pool when
+  ``max_workers > 1``.
+* Per-match iterators — ``iter_per_match_sync`` / ``iter_per_match_async`` fetch
+  an endpoint per match row, parameterised by URL builder, response parser,
+  error policy and record shape. Their options change how records are produced:
+  ``processes`` shards cache reads + parsing across a process pool
+  (``_parse_cached_in_processes``), ``sink`` hands each match's records to a
+  ``RecordSpiller`` instead of accumulating them, and ``compact`` interns
+  repeated strings as records arrive.
+* World Cup — ``resolve_world_cup_week_sync`` / ``_async`` look up the knockout
+  round of a World Cup week.
+* Record builders — pure functions for endpoints that are not in
+  ``_parsers.py`` (squad rosters, player profiles, transfers, heatmaps, etc.),
+  kept here so that the sync and async versions share the same row schema.
+
+The error policy of the original duplicated code is preserved (per-function
+divergence around ``APIError`` is encoded in the ``catch_api_error`` flags),
+but the helpers are not behaviour-neutral: ``max_workers`` and ``processes``
+change where fetching and parsing run (record order is kept), ``sink`` changes
+what the caller receives, and ``compact`` changes the returned dtypes.
 """
 
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextvars import ContextVar
 from datetime import datetime, timezone
-from typing import Any, Callable, Optional, Union
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
 
 import pandas as pd
 
 from datafc.exceptions import APIError, DataNotAvailableError
+from datafc.utils._columns import ColumnBatch
 from datafc.utils._config import API_URLS, WORLD_CUP_KNOCKOUT_SLUGS
+from datafc.utils._executor import run_parser
 from datafc.utils._helpers import _ts_to_age
 from datafc.utils._save_files import save_excel, save_json
 
@@ -124,6 +142,79 @@ def export_df(
         save_excel(data=df, **kwargs, output_dir=output_dir)
 
 
+def finish_spill(spiller, not_found: str, **export_kwargs):
+    """Flush a ``RecordSpiller`` run and export it if requested.
+
+    Raises ``DataNotAvailableError(not_found)`` (and removes the empty spill
+    directory) when no record was written. JSON/Excel export needs the whole
+    frame, so it loads the dataset into memory.
+    """
+    dataset = spiller.finish()
+    if not dataset.num_rows:
+        dataset.remove()
+        raise DataNotAvailableError(not_found)
+    if export_kwargs.get("enable_json_export") or export_kwargs.get("enable_excel_export"):
+        export_df(dataset.to_pandas(), **export_kwargs)
+    return dataset
+
+
+# ---------------------------------------------------------------------------
+# Threaded row map
+# ---------------------------------------------------------------------------
+
+
+def map_rows_sync(
+    rows: pd.DataFrame,
+    client,
+    fn: Callable[[Any, pd.Series], Any],
+    max_workers: int = 1,
+) -> list:
+    """Return ``[fn(client, row) for each row]`` in row order.
+
+    With ``max_workers > 1`` rows are processed on a thread pool sharing
+    ``client``, which keeps one HTTP session per thread and a process-wide rate
+    limiter, so network round trips overlap while the request rate stays within
+    the configured limit.
+
+    An exception raised by ``fn`` cancels the rows not yet started and is
+    re-raised once the running ones finish.
+    """
+    return list(imap_rows_sync(rows, client, fn, max_workers=max_workers))
+
+
+def imap_rows_sync(
+    rows: pd.DataFrame,
+    client,
+    fn: Callable[[Any, pd.Series], Any],
+    max_workers: int = 1,
+) -> Iterator[Any]:
+    """Lazy ``map_rows_sync``: yield each row's result in row order as it is ready.
+
+    At most ``2 * max_workers`` rows are in flight; the next row is submitted
+    as each result is taken. Results are released once yielded, so a consumer
+    that writes them out (e.g. a ``RecordSpiller``) keeps memory bounded.
+    """
+    if max_workers <= 1 or len(rows) <= 1:
+        for _, row in rows.iterrows():
+            yield fn(client, row)
+        return
+
+    items = (row for _, row in rows.iterrows())
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(rows))) as pool:
+        futures = deque(pool.submit(fn, client, row) for row in islice(items, 2 * max_workers))
+        try:
+            while futures:
+                result = futures.popleft().result()
+                row = next(items, None)
+                if row is not None:
+                    futures.append(pool.submit(fn, client, row))
+                yield result
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
 # ---------------------------------------------------------------------------
 # Per-match generic iterators
 # ---------------------------------------------------------------------------
@@ -133,6 +224,10 @@ def export_df(
 EndpointSpec = Union[str, Callable[[pd.Series, str], str]]
 RecordsParser = Callable[..., Union[list, dict, None]]
 
+# Set by ``DataStream`` so a unit whose rows fail with ``APIError`` is reported
+# as a stream failure instead of being logged and skipped (``catch_api_error``).
+raise_api_errors: ContextVar[bool] = ContextVar("raise_api_errors", default=False)
+
 
 def _build_url(endpoint: EndpointSpec, row: pd.Series, base: str) -> str:
     if isinstance(endpoint, str):
@@ -140,6 +235,66 @@ def _build_url(endpoint: EndpointSpec, row: pd.Series, base: str) -> str:
     return endpoint(row, base)
 
 
+def _as_records(result, single_record: bool) -> list:
+    if single_record:
+        return [result] if result is not None else []
+    return result or []
+
+
+def _interned(records):
+    return records.intern_strings() if isinstance(records, ColumnBatch) else records
+
+
+def _parse_cached_shard(cache, ignore_ttl: bool, parser, single_record: bool, tasks: list) -> list:
+    """Process-pool worker: read each task's URL from the disk cache and parse it.
+
+    Returns ``[(position, records or None)]``; None marks a cache miss.
+    """
+    out = []
+    for pos, url, args in tasks:
+        data = cache.get(url, ignore_ttl=ignore_ttl)
+        out.append((pos, None if data is None else _as_records(parser(data, *args), single_record)))
+    return out
+
+
+def _parse_cached_in_processes(
+    match_df: pd.DataFrame,
+    cache,
+    ignore_ttl: bool,
+    base: str,
+    endpoint: EndpointSpec,
+    parser: RecordsParser,
+    extra_args_fn: Optional[Callable[[pd.Series], tuple]],
+    single_record: bool,
+    processes: int,
+) -> list:
+    """Parse every cached match of ``match_df`` on a process pool.
+
+    URLs and parser arguments are built in the parent, so ``endpoint`` and
+    ``extra_args_fn`` may be closures; ``parser`` must be a module-level function.
+    Work is split into a few contiguous shards per process so each task carries
+    many matches. Returns one entry per row: its records, or None if the
+    response is not cached.
+    """
+    tasks = []
+    for pos, (_, row) in enumerate(match_df.iterrows()):
+        extra = extra_args_fn(row) if extra_args_fn else ()
+        args = tuple(row[["country", "tournament", "season", "week", "game_id"]]) + tuple(extra)
+        tasks.append((pos, _build_url(endpoint, row, base), args))
+
+    n_shards = min(len(tasks), processes * 4)
+    size = -(-len(tasks) // n_shards)
+    shards = [tasks[i:i + size] for i in range(0, len(tasks), size)]
+    worker = functools.partial(_parse_cached_shard, cache, ignore_ttl, parser, single_record)
+
+    results: list = [None] * len(tasks)
+    with ProcessPoolExecutor(max_workers=min(processes, len(shards))) as pool:
+        for shard in pool.map(worker, shards):
+            for pos, records in shard:
+                results[pos] = records
+    return results
+
+
 def iter_per_match_sync(
     match_df: pd.DataFrame,
     client,
@@ -151,8 +306,12 @@ def iter_per_match_sync(
     single_record: bool = False,
     catch_api_error: bool = True,
     log_label: str = "data",
-) -> list:
-    """Iterate ``match_df`` sequentially, fetching ``endpoint`` per row.
+    max_workers: int = 1,
+    processes: int = 1,
+    sink=None,
+    compact: bool = False,
+) -> ColumnBatch:
+    """Iterate ``match_df``, fetching ``endpoint`` per row.
 
     Args:
         match_df: DataFrame with country/tournament/season/week/game_id columns.
@@ -161,17 +320,34 @@ def iter_per_match_sync(
         endpoint: Format string with ``{base}`` and ``{game_id}``, or a callable
             ``(row, base) -> url`` for endpoints that need other row fields.
         parser: Either ``(data, country, tournament, season, week, game_id, *extra)
-            -> list`` (default) or ``-> dict | None`` when ``single_record=True``.
+            -> ColumnBatch | list`` (default) or ``-> dict | None`` when
+            ``single_record=True``.
         extra_args_fn: Optional callable ``(row) -> tuple`` of extra parser args.
         single_record: If True, parser returns one record (or None to skip).
         catch_api_error: When True, log + continue on APIError. When False,
             propagate the exception (matches behaviour of e.g. match_h2h_data,
-            match_odds_data).
+            match_odds_data). Always False while ``raise_api_errors`` is set.
         log_label: Human-readable label inserted into the warning message.
+        max_workers: Number of threads fetching matches concurrently (see
+            ``map_rows_sync``). 1 keeps the sequential loop. Record order is the
+            same either way.
+        processes: Batch mode for warm caches. With ``processes > 1`` and a
+            client cache, cached matches are read and parsed on a process pool
+            (see ``_parse_cached_in_processes``); only the misses are fetched
+            here, using ``max_workers`` threads.
+        sink: Optional ``RecordSpiller``. Records are passed to ``sink.extend``
+            as each match finishes instead of being returned.
+        compact: Intern the string values of each match's records before they
+            are accumulated (see ``ColumnBatch.intern_strings``).
+
+    Returns:
+        A ``ColumnBatch`` of all records in row order (empty when ``sink`` is
+        set); ``pd.DataFrame(records)`` builds the frame.
     """
     base = API_URLS[data_source]
-    records: list = []
-    for _, row in match_df.iterrows():
+    catch_api_error = catch_api_error and not raise_api_errors.get()
+
+    def fetch(client, row: pd.Series) -> list:
         country, tournament, season, week, game_id = row[
             ["country", "tournament", "season", "week", "game_id"]
         ]
@@ -182,14 +358,35 @@ def iter_per_match_sync(
             if not catch_api_error:
                 raise
             logger.warning("Failed to fetch %s for game_id=%s: %s", log_label, game_id, exc)
-            continue
+            return []
         extra = extra_args_fn(row) if extra_args_fn else ()
-        result = parser(data, country, tournament, season, week, game_id, *extra)
-        if single_record:
-            if result is not None:
-                records.append(result)
-        else:
-            records.extend(result or [])
+        return _as_records(
+            parser(data, country, tournament, season, week, game_id, *extra), single_record,
+        )
+
+    cache = getattr(client, "cache", None)
+    results: Iterable[Any]
+    if processes > 1 and cache is not None and len(match_df) > 1:
+        parsed = _parse_cached_in_processes(
+            match_df, cache, getattr(client, "offline", False), base, endpoint, parser,
+            extra_args_fn, single_record, processes,
+        )
+        misses = [pos for pos, result in enumerate(parsed) if result is None]
+        if misses:
+            logger.debug(
+                "%d of %d %s responses not cached, fetching.", len(misses), len(parsed), log_label,
+            )
+            fetched = map_rows_sync(match_df.iloc[misses], client, fetch, max_workers=max_workers)
+            for pos, result in zip(misses, fetched):
+                parsed[pos] = result
+        results = parsed
+    else:
+        results = imap_rows_sync(match_df, client, fetch, max_workers=max_workers)
+
+    records = ColumnBatch()
+    out = records if sink is None else sink
+    for result in results:
+        out.extend(_interned(result) if compact else result)
     return records
 
 
@@ -204,13 +401,18 @@ async def iter_per_match_async(
     single_record: bool = False,
     catch_api_error: bool = True,
     log_label: str = "data",
-) -> list:
+    sink=None,
+    compact: bool = False,
+) -> ColumnBatch:
     """Async mirror of ``iter_per_match_sync`` — all rows fetched in parallel.
 
     Behaviour is identical to the sync version, except requests are dispatched
-    concurrently via ``asyncio.gather``.
+    concurrently via ``asyncio.gather`` and parsers run in the parse executor
+    when one is set (see ``set_parse_executor``). With a ``sink``, records are
+    handed over in completion order rather than row order.
     """
     base = API_URLS[data_source]
+    catch_api_error = catch_api_error and not raise_api_errors.get()
 
     async def _one(row: pd.Series):
         country, tournament, season, week, game_id = row[
@@ -225,11 +427,17 @@ async def iter_per_match_async(
             logger.warning("Failed to fetch %s for game_id=%s: %s", log_label, game_id, exc)
             return None if single_record else []
         extra = extra_args_fn(row) if extra_args_fn else ()
-        return parser(data, country, tournament, season, week, game_id, *extra)
+        result = await run_parser(parser, data, country, tournament, season, week, game_id, *extra)
+        if compact:
+            result = _interned(result)
+        if sink is not None:
+            sink.extend(_as_records(result, single_record))
+            return None
+        return result
 
     raw = await asyncio.gather(*[_one(row) for _, row in match_df.iterrows()])
 
-    records: list = []
+    records = ColumnBatch()
     for item in raw:
         if single_record:
             if item is not None:
@@ -726,92 +934,22 @@ def past_match_record_from_event(event: dict) -> dict:
 
 
 # ---------------------------------------------------------------------------
-# goal_networks post-processor
+# coordinates_data heatmap parser
 # ---------------------------------------------------------------------------
 
+# Per-player columns of coordinates_data, ahead of x / y.
+HEATMAP_KEYS = (
+    "country", "tournament", "season", "week", "game_id", "team", "player_id", "player_name",
+)
 
-def _coord(coords, key):
-    return coords.get(key) if isinstance(coords, dict) else None
-
-
-def goal_networks_post_process(incidents_df: pd.DataFrame) -> pd.DataFrame:
-    """Pivot the incidents -> footballPassingNetworkAction long-format frame."""
-    from datafc.utils._helpers import _safe_apply
 
-    if "footballPassingNetworkAction" not in incidents_df.columns:
-        raise DataNotAvailableError("No passing network actions found in incident data.")
-
-    actions_list = []
-    for _, row in incidents_df[
-        ["id", "footballPassingNetworkAction", "country", "tournament", "season", "week", "game_id"]
-    ].iterrows():
-        if not isinstance(row["footballPassingNetworkAction"], list):
-            continue
-        for event in row["footballPassingNetworkAction"]:
-            event = dict(event)
-            event["id"] = row["id"]
-            event.update({
-                "country": row["country"],
-                "tournament": row["tournament"],
-                "season": row["season"],
-                "week": row["week"],
-                "game_id": row["game_id"],
-            })
-            actions_list.append(event)
-
-    if not actions_list:
-        raise DataNotAvailableError("No passing network actions found.")
-
-    raw_df = pd.DataFrame(actions_list)
-    result_df = raw_df.assign(
-        player_name=raw_df["player"].apply(lambda p: p.get("name") if isinstance(p, dict) else None),
-        player_id=raw_df["player"].apply(lambda p: p.get("id") if isinstance(p, dict) else None),
-        event_type=raw_df["eventType"],
-        player_x=raw_df["playerCoordinates"].apply(lambda c: _coord(c, "x")),
-        player_y=raw_df["playerCoordinates"].apply(lambda c: _coord(c, "y")),
-        pass_end_x=_safe_apply(raw_df, "passEndCoordinates", lambda c: _coord(c, "x")),
-        pass_end_y=_safe_apply(raw_df, "passEndCoordinates", lambda c: _coord(c, "y")),
-        is_assist=_safe_apply(raw_df, "isAssist"),
-        goalkeeper_x=_safe_apply(raw_df, "gkCoordinates", lambda c: _coord(c, "x")),
-        goalkeeper_y=_safe_apply(raw_df, "gkCoordinates", lambda c: _coord(c, "y")),
-        goal_shot_x=_safe_apply(raw_df, "goalShotCoordinates", lambda c: _coord(c, "x")),
-        goal_shot_y=_safe_apply(raw_df, "goalShotCoordinates", lambda c: _coord(c, "y")),
-        goal_mouth_x=_safe_apply(raw_df, "goalMouthCoordinates", lambda c: _coord(c, "x")),
-        goal_mouth_y=_safe_apply(raw_df, "goalMouthCoordinates", lambda c: _coord(c, "y")),
-        goalkeeper_name=_safe_apply(
-            raw_df, "goalkeeper", lambda gk: gk.get("name") if isinstance(gk, dict) else None
-        ),
-        goalkeeper_id=_safe_apply(
-            raw_df, "goalkeeper", lambda gk: gk.get("id") if isinstance(gk, dict) else None
-        ),
-    )[[
-        "country", "tournament", "season", "week", "game_id",
-        "player_name", "player_id", "event_type",
-        "player_x", "player_y", "pass_end_x", "pass_end_y",
-        "is_assist", "id",
-        "goalkeeper_x", "goalkeeper_y",
-        "goal_shot_x", "goal_shot_y",
-        "goal_mouth_x", "goal_mouth_y",
-        "goalkeeper_name", "goalkeeper_id",
-    ]]
-    return result_df
-
-
-def heatmap_records(data: dict, row: pd.Series) -> list:
+def heatmap_records(data: dict, row: pd.Series) -> ColumnBatch:
     """coordinates_data per-player heatmap parser."""
-    return [
-        {
-            "country": row["country"],
-            "tournament": row["tournament"],
-            "season": row["season"],
-            "week": row["week"],
-            "game_id": row["game_id"],
-            "team": row["team"],
-            "player_id": row["player_id"],
-            "player_name": row["player_name"],
-            "x": point["x"],
-            "y": point["y"],
-        }
-        for point in data.get("heatmap", [])
+    points = [
+        point for point in data.get("heatmap", [])
         if isinstance(point, dict) and "x" in point and "y" in point
     ]
+    out = ColumnBatch(HEATMAP_KEYS)
+    out["x"] = [point["x"] for point in points]
+    out["y"] = [point["y"] for point in points]
+    return out.broadcast(**{key: row[key] for key in HEATMAP_KEYS})
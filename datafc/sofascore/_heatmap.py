@@ -0,0 +1,247 @@
+"""
+Binned heatmap grids: the array-backed alternative output of ``coordinates_data``.
+
+A heatmap response is a list of touch points on Sofascore's 0–100 × 0–100
+pitch. ``coordinates_data`` normally returns one row per point, repeating the
+eight player/match columns on every row, which for a league season means tens
+of millions of rows. With ``bins`` set, each response is histogrammed with
+``np.histogram2d`` as it arrives instead, and the points are dropped: a player
+match becomes one small ``ny × nx`` count grid. With ``per="season"`` the
+match grids are then summed per player and season.
+
+The result is a ``HeatmapGrids``: a ``keys`` DataFrame with one row per grid
+and a ``grids`` array of shape ``(len(keys), ny, nx)``. It can be saved as a
+single ``.npz`` file or as a directory whose ``grids.npy`` is memory-mapped
+on load, so grids for many seasons can be sliced without reading them all.
+
+Usage:
+    grids = coordinates_data(lineups_df, bins=(20, 13), per="season")
+    grids.lookup(player_id=12994)          # (13, 20) counts
+    grids.save("heatmaps/")                # grids.npy + keys.json
+    grids = HeatmapGrids.load("heatmaps/") # grids memory-mapped, read-only
+"""
+
+import json
+import os
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from datafc.exceptions import DataNotAvailableError, InvalidParameterError
+from datafc.sofascore._schemas import SCHEMAS, _dtype, _typed
+from datafc.utils._save_files import save_npz
+
+# Sofascore heatmap coordinates: (x_min, x_max, y_min, y_max).
+PITCH_EXTENT = (0.0, 100.0, 0.0, 100.0)
+
+ALLOWED_GRID_PER = ("match", "season")
+
+# Key columns of a grid, by ``per``.
+MATCH_GRID_KEYS = (
+    "country", "tournament", "season", "week", "game_id", "team", "player_id", "player_name",
+)
+SEASON_GRID_KEYS = ("country", "tournament", "season", "player_id", "player_name")
+
+GRID_DTYPE = np.uint32
+
+
+def validate_grid_params(
+    bins: Optional[Union[int, Sequence[int]]], per: str,
+) -> Optional[Tuple[int, int]]:
+    """Return ``bins`` as ``(nx, ny)``, or None when no grid is requested.
+
+    Raises:
+        InvalidParameterError: If bins is not a positive int or a pair of them,
+            per is not one of ``ALLOWED_GRID_PER``, or per is ``"season"``
+            without bins.
+    """
+    if per not in ALLOWED_GRID_PER:
+        raise InvalidParameterError(
+            f"Invalid per: {per!r}. Must be one of {ALLOWED_GRID_PER}."
+        )
+    if bins is None:
+        if per != "match":
+            raise InvalidParameterError(f"per={per!r} requires bins.")
+        return None
+
+    def _positive_int(n) -> bool:
+        return bool(
+            isinstance(n, (int, np.integer)) and not isinstance(n, (bool, np.bool_)) and n > 0
+        )
+
+    pair: Optional[Tuple[int, ...]]
+    if isinstance(bins, (str, bytes)) or not isinstance(bins, (int, np.integer, Sequence, np.ndarray)):
+        pair = None
+    elif isinstance(bins, (int, np.integer)):
+        pair = (bins, bins)
+    else:
+        pair = tuple(bins)
+    if pair is None or len(pair) != 2 or not all(_positive_int(n) for n in pair):
+        raise InvalidParameterError(
+            f"Invalid bins: {bins!r}. Must be a positive int or an (nx, ny) pair of them."
+        )
+    return int(pair[0]), int(pair[1])
+
+
+def heatmap_grid(
+    data: dict, row: pd.Series, bins: Tuple[int, int],
+) -> Optional[Tuple[dict, np.ndarray]]:
+    """coordinates_data grid parser: the row's keys and its ``(ny, nx)`` count grid.
+
+    Returns None when the response has no points.
+    """
+    points = [
+        (point["x"], point["y"]) for point in data.get("heatmap", [])
+        if isinstance(point, dict) and "x" in point and "y" in point
+    ]
+    if not points:
+        return None
+    xy = np.asarray(points, dtype=np.float64)
+    x_min, x_max, y_min, y_max = PITCH_EXTENT
+    nx, ny = bins
+    counts, _, _ = np.histogram2d(
+        xy[:, 1], xy[:, 0], bins=(ny, nx), range=((y_min, y_max), (x_min, x_max)),
+    )
+    return {key: row[key] for key in MATCH_GRID_KEYS}, counts.astype(GRID_DTYPE)
+
+
+def _typed_keys(keys: pd.DataFrame) -> pd.DataFrame:
+    schema = SCHEMAS["coordinates_data"]
+    return pd.DataFrame(
+        {column: _typed(keys[column], _dtype(schema, column), column) for column in keys.columns},
+        index=keys.index,
+    )
+
+
+def collect_grids(results: list, bins: Tuple[int, int], per: str) -> "HeatmapGrids":
+    """Stack ``heatmap_grid`` results into a ``HeatmapGrids``, summed per season if asked.
+
+    Raises:
+        DataNotAvailableError: If no player had heatmap points.
+    """
+    results = [result for result in results if result is not None]
+    if not results:
+        raise DataNotAvailableError("No heatmap data found for the specified players.")
+    keys = pd.DataFrame([key for key, _ in results], columns=list(MATCH_GRID_KEYS))
+    grids = np.stack([grid for _, grid in results])
+    if per == "season":
+        by = list(SEASON_GRID_KEYS)
+        codes = keys.groupby(by, sort=False, dropna=False).ngroup().to_numpy()
+        summed = np.zeros((codes.max() + 1,) + grids.shape[1:], dtype=GRID_DTYPE)
+        np.add.at(summed, codes, grids)
+        first = keys.assign(_code=codes).drop_duplicates("_code")
+        keys = first[by].reset_index(drop=True)
+        keys["matches"] = np.bincount(codes)
+        grids = summed
+    return HeatmapGrids(_typed_keys(keys), grids, bins=bins, per=per)
+
+
+def export_grids(grids: "HeatmapGrids", data_source: str, output_dir: str, first_row: pd.Series) -> None:
+    """Save ``coordinates_data`` grids as ``..._coordinates_data_grid.npz``."""
+    save_npz(
+        grids, fn_name="coordinates_data_grid", data_source=data_source,
+        country=first_row.get("country", ""), tournament=first_row.get("tournament", ""),
+        season=first_row.get("season"), output_dir=output_dir,
+    )
+
+
+class HeatmapGrids:
+    """
+    Heatmap count grids with one key row per grid.
+
+    ``grids[i]`` is the ``(ny, nx)`` grid of ``keys.iloc[i]``: row ``j`` covers
+    y from ``j * 100 / ny`` upwards and column ``k`` covers x likewise, so
+    ``grids[i]`` can be passed to ``imshow(origin="lower")`` as is.
+
+    Args:
+        keys: One row per grid: the player/match columns of ``coordinates_data``,
+            or for ``per="season"`` the player/season columns plus ``matches``.
+        grids: Array of shape ``(len(keys), ny, nx)``.
+        bins: ``(nx, ny)``.
+        per: ``"match"`` or ``"season"``.
+        extent: Pitch bounds ``(x_min, x_max, y_min, y_max)`` of the grids.
+    """
+
+    def __init__(
+        self,
+        keys: pd.DataFrame,
+        grids: np.ndarray,
+        bins: Tuple[int, int],
+        per: str = "match",
+        extent: Tuple[float, float, float, float] = PITCH_EXTENT,
+    ) -> None:
+        if len(keys) != len(grids):
+            raise InvalidParameterError(
+                f"keys has {len(keys)} rows but grids has {len(grids)} grids."
+            )
+        self.keys = keys.reset_index(drop=True)
+        self.grids = grids
+        self.bins = (int(bins[0]), int(bins[1]))
+        self.per = per
+        self.extent = tuple(float(v) for v in extent)
+
+    def __len__(self) -> int:
+        return len(self.grids)
+
+    def __repr__(self) -> str:
+        nx, ny = self.bins
+        return f"HeatmapGrids(per={self.per!r}, grids={len(self)}, bins=({nx}, {ny}))"
+
+    def lookup(self, player_id: int, game_id: Optional[int] = None, season=None) -> np.ndarray:
+        """Sum of the grids matching ``player_id`` (and ``game_id`` / ``season`` if given).
+
+        Raises:
+            DataNotAvailableError: If no grid matches.
+        """
+        mask = (self.keys["player_id"] == player_id).to_numpy(dtype=bool, na_value=False)
+        for column, value in (("game_id", game_id), ("season", season)):
+            if value is not None:
+                if column not in self.keys:
+                    raise InvalidParameterError(f"{self.per} grids have no {column} key.")
+                mask &= (self.keys[column] == value).to_numpy(dtype=bool, na_value=False)
+        if not mask.any():
+            raise DataNotAvailableError(f"No heatmap grid for player_id={player_id}.")
+        total: np.ndarray = self.grids[mask].sum(axis=0, dtype=np.uint64)
+        return total.astype(self.grids.dtype)
+
+    def _meta(self) -> str:
+        return json.dumps({
+            "bins": list(self.bins), "per": self.per, "extent": list(self.extent),
+            "keys": json.loads(self.keys.to_json(orient="split", index=False)),
+        })
+
+    def save(self, path: str) -> None:
+        """Write to ``path``: one ``.npz`` file if it ends in ``.npz``, else a directory.
+
+        A directory holds ``grids.npy`` (memory-mappable, see ``load``) and
+        ``keys.json``; a ``.npz`` file holds the same two entries uncompressed.
+        """
+        if path.endswith(".npz"):
+            np.savez(path, grids=np.asarray(self.grids), meta=np.array(self._meta()))
+            return
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, "grids.npy"), np.asarray(self.grids))
+        with open(os.path.join(path, "keys.json"), "w", encoding="utf-8") as f:
+            f.write(self._meta())
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "HeatmapGrids":
+        """Read grids written by ``save``.
+
+        From a directory, ``grids`` is a read-only ``np.memmap`` unless
+        ``mmap=False``; an ``.npz`` file is always read into memory.
+        """
+        if path.endswith(".npz"):
+            with np.load(path, allow_pickle=False) as npz:
+                grids, meta = npz["grids"], json.loads(str(npz["meta"]))
+        else:
+            grids = np.load(os.path.join(path, "grids.npy"), mmap_mode="r" if mmap else None)
+            with open(os.path.join(path, "keys.json"), encoding="utf-8") as f:
+                meta = json.load(f)
+        split = meta["keys"]
+        keys = pd.DataFrame(split["data"], columns=split["columns"])
+        return cls(
+            _typed_keys(keys), grids,
+            bins=tuple(meta["bins"]), per=meta["per"], extent=tuple(meta["extent"]),
+        )
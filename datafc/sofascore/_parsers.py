@@ -1,32 +1,104 @@
 """
 Pure data-transformation functions shared by sync fetch modules and aio.py.
 
-Each function takes raw API response data and returns either a list of records
-(dicts) or a DataFrame. No HTTP calls, no side effects.
+Each function takes raw API response data and returns a ``ColumnBatch``
+(column-oriented records, see ``datafc/utils/_columns.py``), a single record
+dict, a list of records, or a DataFrame. No HTTP calls, no side effects.
+
+The per-match parsers, which handle the largest volumes, fill per-column lists
+directly instead of building one dict per row; ``pd.DataFrame(batch)`` then
+builds the frame column by column.
 
 Keeping parsing logic here means a schema change only needs to be made in one
 place instead of twice (once in the sync file, once in aio.py).
 """
 
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Callable, Collection, Optional, Sequence, Tuple
 import pandas as pd
+from datafc.utils._columns import ColumnBatch
 from datafc.utils._validate import safe_get
 from datafc.exceptions import DataNotAvailableError
 
+# Leading columns of every per-match record, constant within one response.
+MATCH_KEYS = ("country", "tournament", "season", "week", "game_id")
+
+
+def _match_batch(*columns: str) -> ColumnBatch:
+    return ColumnBatch(MATCH_KEYS + columns)
+
+
+def _with_match_keys(
+    batch: ColumnBatch, country: str, tournament: str, season, week, game_id
+) -> ColumnBatch:
+    return batch.broadcast(
+        country=country, tournament=tournament, season=season, week=week, game_id=game_id,
+    )
+
+
+# Field tables of the wide parsers: (output column, getter) in output order.
+Fields = Sequence[Tuple[str, Callable[[dict], Any]]]
+
+
+def _projected_batch(
+    fields: Fields,
+    items: list,
+    columns: Optional[Collection[str]],
+    keys: Optional[dict] = None,
+) -> ColumnBatch:
+    """Build a batch from ``fields`` over ``items``, extracting only ``columns``.
+
+    ``keys`` are constant leading columns (the match keys), repeated per item.
+    With ``columns=None`` every field is extracted; otherwise fields not
+    requested are never looked up.
+    """
+    out = ColumnBatch()
+    n = len(items)
+    for column, value in (keys or {}).items():
+        if columns is None or column in columns:
+            out[column] = [value] * n
+    for column, get in fields:
+        if columns is None or column in columns:
+            out[column] = [get(item) for item in items]
+    return out
+
+
+def _match_keys(country: str, tournament: str, season, week, game_id) -> dict:
+    return dict(zip(MATCH_KEYS, (country, tournament, season, week, game_id)))
+
 
 # ---------------------------------------------------------------------------
 # Match-level parsers
 # ---------------------------------------------------------------------------
 
-def parse_match_events(events: list) -> pd.DataFrame:
-    """
-    Build the standard match DataFrame from a list of Sofascore event objects.
-
-    Raises:
-        DataNotAvailableError: If a critical identity field (game_id, team name/id)
-            is missing, indicating a Sofascore schema change.
-    """
-    records = []
+_EVENT_FIELDS: Fields = (
+    ("country", lambda ev: ev.get("tournament", {}).get("category", {}).get("name", "")),
+    ("tournament", lambda ev: ev.get("tournament", {}).get("name", "")),
+    ("season", lambda ev: ev.get("season", {}).get("year", "")),
+    ("week", lambda ev: ev.get("roundInfo", {}).get("round", "")),
+    ("game_id", lambda ev: ev.get("id")),
+    ("home_team", lambda ev: ev["homeTeam"]["name"]),
+    ("home_team_id", lambda ev: ev["homeTeam"]["id"]),
+    ("away_team", lambda ev: ev["awayTeam"]["name"]),
+    ("away_team_id", lambda ev: ev["awayTeam"]["id"]),
+    ("injury_time_1", lambda ev: ev.get("time", {}).get("injuryTime1")),
+    ("injury_time_2", lambda ev: ev.get("time", {}).get("injuryTime2")),
+    ("start_timestamp", lambda ev: ev.get("startTimestamp")),
+    ("status", lambda ev: ev.get("status", {}).get("description", "")),
+    ("home_score_current", lambda ev: ev.get("homeScore", {}).get("current")),
+    ("home_score_display", lambda ev: ev.get("homeScore", {}).get("display")),
+    ("home_score_period1", lambda ev: ev.get("homeScore", {}).get("period1")),
+    ("home_score_period2", lambda ev: ev.get("homeScore", {}).get("period2")),
+    ("home_score_normaltime", lambda ev: ev.get("homeScore", {}).get("normaltime")),
+    ("away_score_current", lambda ev: ev.get("awayScore", {}).get("current")),
+    ("away_score_display", lambda ev: ev.get("awayScore", {}).get("display")),
+    ("away_score_period1", lambda ev: ev.get("awayScore", {}).get("period1")),
+    ("away_score_period2", lambda ev: ev.get("awayScore", {}).get("period2")),
+    ("away_score_normaltime", lambda ev: ev.get("awayScore", {}).get("normaltime")),
+)
+
+
+def _check_event_identity(events: list) -> None:
     for idx, ev in enumerate(events):
         game_id = ev.get("id")
         if not game_id:
@@ -34,193 +106,307 @@ def parse_match_events(events: list) -> pd.DataFrame:
                 f"Event at index {idx} is missing required field 'id'. "
                 "Sofascore schema may have changed."
             )
-        home_team = ev.get("homeTeam", {})
-        away_team = ev.get("awayTeam", {})
-        home_name = home_team.get("name", "")
-        home_id = home_team.get("id", "")
-        away_name = away_team.get("name", "")
-        away_id = away_team.get("id", "")
-        if not home_name:
-            raise DataNotAvailableError(
-                f"Event {game_id}: missing 'homeTeam.name'. Sofascore schema may have changed."
-            )
-        if not home_id:
-            raise DataNotAvailableError(
-                f"Event {game_id}: missing 'homeTeam.id'. Sofascore schema may have changed."
-            )
-        if not away_name:
-            raise DataNotAvailableError(
-                f"Event {game_id}: missing 'awayTeam.name'. Sofascore schema may have changed."
-            )
-        if not away_id:
-            raise DataNotAvailableError(
-                f"Event {game_id}: missing 'awayTeam.id'. Sofascore schema may have changed."
-            )
-        records.append({
-            "country":               ev.get("tournament", {}).get("category", {}).get("name", ""),
-            "tournament":            ev.get("tournament", {}).get("name", ""),
-            "season":                ev.get("season", {}).get("year", ""),
-            "week":                  ev.get("roundInfo", {}).get("round", ""),
-            "game_id":               game_id,
-            "home_team":             home_name,
-            "home_team_id":          home_id,
-            "away_team":             away_name,
-            "away_team_id":          away_id,
-            "injury_time_1":         ev.get("time", {}).get("injuryTime1"),
-            "injury_time_2":         ev.get("time", {}).get("injuryTime2"),
-            "start_timestamp":       ev.get("startTimestamp"),
-            "status":                ev.get("status", {}).get("description", ""),
-            "home_score_current":    ev.get("homeScore", {}).get("current"),
-            "home_score_display":    ev.get("homeScore", {}).get("display"),
-            "home_score_period1":    ev.get("homeScore", {}).get("period1"),
-            "home_score_period2":    ev.get("homeScore", {}).get("period2"),
-            "home_score_normaltime": ev.get("homeScore", {}).get("normaltime"),
-            "away_score_current":    ev.get("awayScore", {}).get("current"),
-            "away_score_display":    ev.get("awayScore", {}).get("display"),
-            "away_score_period1":    ev.get("awayScore", {}).get("period1"),
-            "away_score_period2":    ev.get("awayScore", {}).get("period2"),
-            "away_score_normaltime": ev.get("awayScore", {}).get("normaltime"),
-        })
-    return pd.DataFrame(records)
+        for side in ("homeTeam", "awayTeam"):
+            team = ev.get(side, {})
+            for key in ("name", "id"):
+                if not team.get(key, ""):
+                    raise DataNotAvailableError(
+                        f"Event {game_id}: missing '{side}.{key}'. Sofascore schema may have changed."
+                    )
+
+
+def parse_match_events_records(
+    events: list, columns: Optional[Collection[str]] = None,
+) -> ColumnBatch:
+    """
+    Build the standard match records from a list of Sofascore event objects.
+
+    Args:
+        events: Event objects from a round/events response.
+        columns: Optional output columns to extract; others are never looked up.
+
+    Raises:
+        DataNotAvailableError: If a critical identity field (game_id, team name/id)
+            is missing, indicating a Sofascore schema change.
+    """
+    _check_event_identity(events)
+    return _projected_batch(_EVENT_FIELDS, events, columns)
+
+
+def parse_match_events(events: list, columns: Optional[Collection[str]] = None) -> pd.DataFrame:
+    """DataFrame form of ``parse_match_events_records``."""
+    return pd.DataFrame(parse_match_events_records(events, columns))
 
 
 def parse_match_stats_records(
     data: dict, country: str, tournament: str, season, week, game_id
-) -> list:
+) -> ColumnBatch:
     """Extract match statistics records from a single event's statistics response."""
-    records = []
+    out = _match_batch(
+        "period", "group_name", "stat_name", "home_team_stat", "away_team_stat",
+    )
+    periods, groups, names, homes, aways = out.column_lists(
+        "period", "group_name", "stat_name", "home_team_stat", "away_team_stat",
+    )
+    for period_data in data.get("statistics", []):
+        period = period_data.get("period")
+        for group in period_data.get("groups", []):
+            items = group.get("statisticsItems", [])
+            periods.extend([period] * len(items))
+            groups.extend([group.get("groupName")] * len(items))
+            names.extend([item.get("name") for item in items])
+            homes.extend([item.get("home") for item in items])
+            aways.extend([item.get("away") for item in items])
+    return _with_match_keys(out, country, tournament, season, week, game_id)
+
+
+@lru_cache(maxsize=4096)
+def parse_stat_text(text: str) -> Tuple[Optional[float], Optional[float]]:
+    """Parse a statistic's display string into ``(value, total)``.
+
+    ``"55%"`` gives ``(55.0, None)``, ``"412/500 (82%)"`` gives
+    ``(412.0, 500.0)`` and ``"1.23"`` gives ``(1.23, None)``; text that is not
+    a number gives ``(None, None)``. Memoized, as the same few hundred strings
+    recur in every match.
+    """
+    text = text.strip()
+    slash = text.find("/")
+    try:
+        if slash >= 0:
+            return float(text[:slash]), float(text[slash + 1:].split(" ", 1)[0])
+        return float(text[:-1] if text.endswith("%") else text), None
+    except ValueError:
+        return None, None
+
+
+_NAN = float("nan")
+
+
+def _stat_numbers(item: dict, side: str) -> Tuple[Optional[float], Optional[float]]:
+    # Prefer the numeric homeValue/homeTotal fields; parse the text only without them.
+    value = item.get(f"{side}Value")
+    if isinstance(value, (int, float)):
+        total = item.get(f"{side}Total")
+        return float(value), float(total) if isinstance(total, (int, float)) else None
+    text = item.get(side)
+    if isinstance(text, (int, float)):
+        return float(text), None
+    if isinstance(text, str):
+        return parse_stat_text(text)
+    return None, None
+
+
+def parse_match_stats_wide_record(
+    data: dict, country: str, tournament: str, season, week, game_id
+) -> Optional[dict]:
+    """Extract one numeric record per match from a single event's statistics response.
+
+    Columns are named ``{period}_{stat}_{side}`` (e.g. ``ALL_ballPossession_home``),
+    with the stat's ``key`` (its name when there is none); fraction stats such as
+    accurate passes add ``{period}_{stat}Total_{side}``. A stat listed in several
+    groups keeps its first value. Returns None if there are no statistics.
+    """
+    record = _match_keys(country, tournament, season, week, game_id)
     for period_data in data.get("statistics", []):
+        period = period_data.get("period")
         for group in period_data.get("groups", []):
             for item in group.get("statisticsItems", []):
-                records.append({
-                    "country": country, "tournament": tournament,
-                    "season": season, "week": week, "game_id": game_id,
-                    "period": period_data.get("period"),
-                    "group_name": group.get("groupName"),
-                    "stat_name": item.get("name"),
-                    "home_team_stat": item.get("home"),
-                    "away_team_stat": item.get("away"),
-                })
-    return records
+                stat = item.get("key") or item.get("name")
+                for side in ("home", "away"):
+                    value, total = _stat_numbers(item, side)
+                    # NaN rather than None keeps every stat column float64.
+                    record.setdefault(f"{period}_{stat}_{side}", _NAN if value is None else value)
+                    if total is not None:
+                        record.setdefault(f"{period}_{stat}Total_{side}", total)
+    return record if len(record) > len(MATCH_KEYS) else None
+
+
+def _path(*keys: str) -> Callable[[dict], Any]:
+    return lambda shot: safe_get(shot, *keys)
+
+
+def _shot_fields() -> Fields:
+    fields = [
+        ("player_name", _path("player", "name")),
+        ("player_id", _path("player", "id")),
+        ("player_position", _path("player", "position")),
+    ]
+    for column, key in (
+        ("is_home", "isHome"),
+        ("incident_type", "incidentType"),
+        ("shot_type", "shotType"),
+        ("body_part", "bodyPart"),
+        ("goal_type", "goalType"),
+        ("situation", "situation"),
+        ("goal_mouth_location", "goalMouthLocation"),
+        ("xg", "xg"),
+        ("xgot", "xgot"),
+    ):
+        fields.append((column, _path(key)))
+    for prefix, key in (
+        ("player_coordinates", "playerCoordinates"),
+        ("goal_mouth_coordinates", "goalMouthCoordinates"),
+    ):
+        for axis in "xyz":
+            fields.append((f"{prefix}_{axis}", _path(key, axis)))
+    for point in ("start", "end", "goal"):
+        for axis in "xy":
+            fields.append((f"draw_{point}_{axis}", _path("draw", point, axis)))
+    for axis in "xyz":
+        fields.append((f"block_coordinates_{axis}", _path("blockCoordinates", axis)))
+    fields += [
+        ("time", _path("time")),
+        ("time_seconds", _path("timeSeconds")),
+        ("added_time", _path("addedTime")),
+    ]
+    return tuple(fields)
+
+
+_SHOT_FIELDS = _shot_fields()
 
 
 def parse_shots_records(
-    data: dict, country: str, tournament: str, season, week, game_id
-) -> list:
-    """Extract shot map records from a single event's shotmap response."""
-    records = []
-    for shot in data.get("shotmap", []):
-        records.append({
-            "country": country, "tournament": tournament,
-            "season": season, "week": week, "game_id": game_id,
-            "player_name": safe_get(shot, "player", "name"),
-            "player_id": safe_get(shot, "player", "id"),
-            "player_position": safe_get(shot, "player", "position"),
-            "is_home": shot.get("isHome"),
-            "incident_type": shot.get("incidentType"),
-            "shot_type": shot.get("shotType"),
-            "body_part": shot.get("bodyPart"),
-            "goal_type": shot.get("goalType"),
-            "situation": shot.get("situation"),
-            "goal_mouth_location": shot.get("goalMouthLocation"),
-            "xg": shot.get("xg"),
-            "xgot": shot.get("xgot"),
-            "player_coordinates_x": safe_get(shot, "playerCoordinates", "x"),
-            "player_coordinates_y": safe_get(shot, "playerCoordinates", "y"),
-            "player_coordinates_z": safe_get(shot, "playerCoordinates", "z"),
-            "goal_mouth_coordinates_x": safe_get(shot, "goalMouthCoordinates", "x"),
-            "goal_mouth_coordinates_y": safe_get(shot, "goalMouthCoordinates", "y"),
-            "goal_mouth_coordinates_z": safe_get(shot, "goalMouthCoordinates", "z"),
-            "draw_start_x": safe_get(shot, "draw", "start", "x"),
-            "draw_start_y": safe_get(shot, "draw", "start", "y"),
-            "draw_end_x": safe_get(shot, "draw", "end", "x"),
-            "draw_end_y": safe_get(shot, "draw", "end", "y"),
-            "draw_goal_x": safe_get(shot, "draw", "goal", "x"),
-            "draw_goal_y": safe_get(shot, "draw", "goal", "y"),
-            "block_coordinates_x": safe_get(shot, "blockCoordinates", "x"),
-            "block_coordinates_y": safe_get(shot, "blockCoordinates", "y"),
-            "block_coordinates_z": safe_get(shot, "blockCoordinates", "z"),
-            "time": shot.get("time"),
-            "time_seconds": shot.get("timeSeconds"),
-            "added_time": shot.get("addedTime"),
-        })
-    return records
+    data: dict, country: str, tournament: str, season, week, game_id,
+    columns: Optional[Collection[str]] = None,
+) -> ColumnBatch:
+    """Extract shot map records from a single event's shotmap response.
+
+    With ``columns``, only those output columns are extracted.
+    """
+    return _projected_batch(
+        _SHOT_FIELDS, data.get("shotmap", []), columns,
+        _match_keys(country, tournament, season, week, game_id),
+    )
 
 
 def parse_momentum_records(
     data: dict, country: str, tournament: str, season, week, game_id
-) -> list:
+) -> ColumnBatch:
     """Extract momentum graph records from a single event's graph response."""
-    return [
-        {
-            "country": country, "tournament": tournament,
-            "season": season, "week": week, "game_id": game_id,
-            "minute": point.get("minute"),
-            "value": point.get("value"),
-        }
-        for point in data.get("graphPoints", [])
-    ]
+    points = data.get("graphPoints", [])
+    out = _match_batch()
+    out["minute"] = [point.get("minute") for point in points]
+    out["value"] = [point.get("value") for point in points]
+    return _with_match_keys(out, country, tournament, season, week, game_id)
 
 
 def parse_formations_records(
     data: dict, country: str, tournament: str, season, week, game_id
-) -> list:
+) -> ColumnBatch:
     """Extract home and away formation records from a single event's lineups response."""
-    records = []
+    out = _match_batch("team", "formation")
+    teams, formations = out.column_lists("team", "formation")
     for team_key in ("home", "away"):
-        team_data = data.get(team_key, {})
-        formation = team_data.get("formation")
+        formation = data.get(team_key, {}).get("formation")
         if formation is not None:
-            records.append({
-                "country": country, "tournament": tournament,
-                "season": season, "week": week, "game_id": game_id,
-                "team": team_key,
-                "formation": formation,
-            })
-    return records
+            teams.append(team_key)
+            formations.append(formation)
+    return _with_match_keys(out, country, tournament, season, week, game_id)
 
 
 def parse_lineups_records(
     data: dict, country: str, tournament: str, season, week, game_id
-) -> list:
+) -> ColumnBatch:
     """Extract per-player lineup statistics records from a single event's lineups response."""
-    records = []
+    out = _match_batch("team", "player_name", "player_id", "stat_name", "stat_value")
+    teams, player_names, player_ids, stat_names, stat_values = out.column_lists(
+        "team", "player_name", "player_id", "stat_name", "stat_value",
+    )
     for team_key in ("home", "away"):
         for player in data.get(team_key, {}).get("players", []):
             player_info = player.get("player", {})
-            for stat_name, stat_value in player.get("statistics", {}).items():
-                if stat_name == "ratingVersions" and isinstance(stat_value, dict):
-                    stat_value = stat_value.get("original", stat_value)
-                records.append({
-                    "country": country, "tournament": tournament,
-                    "season": season, "week": week, "game_id": game_id,
-                    "team": team_key,
-                    "player_name": player_info.get("name"),
-                    "player_id": player_info.get("id"),
-                    "stat_name": stat_name,
-                    "stat_value": stat_value,
-                })
-    return records
+            stats = player.get("statistics", {})
+            n = len(stats)
+            teams.extend([team_key] * n)
+            player_names.extend([player_info.get("name")] * n)
+            player_ids.extend([player_info.get("id")] * n)
+            stat_names.extend(stats)
+            stat_values.extend(stats.values())
+            versions = stats.get("ratingVersions")
+            if isinstance(versions, dict):
+                # Keep the original rating rather than the per-version dict.
+                pos = len(stat_names) - n + list(stats).index("ratingVersions")
+                stat_values[pos] = versions.get("original", versions)
+    return _with_match_keys(out, country, tournament, season, week, game_id)
+
+
+# Player statistics of the wide lineups layout, in column order. Other keys of
+# a player's "statistics" object are only available in the long layout.
+LINEUP_STATS = (
+    "minutesPlayed", "rating", "touches",
+    # attacking
+    "goals", "goalAssist", "expectedGoals", "expectedAssists",
+    "onTargetScoringAttempt", "shotOffTarget", "blockedScoringAttempt", "hitWoodwork",
+    "bigChanceCreated", "bigChanceMissed", "totalOffside",
+    # passing
+    "totalPass", "accuratePass", "keyPass", "totalLongBalls", "accurateLongBalls",
+    "totalCross", "accurateCross",
+    "totalOwnHalfPasses", "accurateOwnHalfPasses",
+    "totalOppositionHalfPasses", "accurateOppositionHalfPasses",
+    # possession and duels
+    "totalContest", "wonContest", "dispossessed", "possessionLostCtrl",
+    "duelWon", "duelLost", "aerialWon", "aerialLost", "challengeLost",
+    "fouls", "wasFouled",
+    # defending
+    "totalTackle", "wonTackle", "lastManTackle", "interceptionWon", "ballRecovery",
+    "totalClearance", "clearanceOffLine", "outfielderBlock",
+    "errorLeadToAShot", "errorLeadToAGoal", "ownGoals",
+    "penaltyWon", "penaltyConceded", "penaltyMiss",
+    # goalkeeping
+    "saves", "savedShotsFromInsideTheBox", "punches", "goodHighClaim",
+    "totalKeeperSweeper", "accurateKeeperSweeper", "goalsPrevented", "penaltySave",
+)
+
+_LINEUP_STAT_INDEX = {name: pos for pos, name in enumerate(LINEUP_STATS)}
+
+
+def parse_lineups_wide_records(
+    data: dict, country: str, tournament: str, season, week, game_id
+) -> ColumnBatch:
+    """Extract one record per player from a single event's lineups response.
+
+    Each ``LINEUP_STATS`` entry is a column; a statistic the player does not
+    have, or whose value is not a number, is None. Players without statistics
+    (unused substitutes) are skipped, as in the long layout.
+    """
+    out = _match_batch("team", "player_name", "player_id", *LINEUP_STATS)
+    teams, player_names, player_ids = out.column_lists("team", "player_name", "player_id")
+    stat_lists = out.column_lists(*LINEUP_STATS)
+    index = _LINEUP_STAT_INDEX
+    for team_key in ("home", "away"):
+        for player in data.get(team_key, {}).get("players", []):
+            stats = player.get("statistics") or {}
+            if not stats:
+                continue
+            row: list = [None] * len(LINEUP_STATS)
+            for name, value in stats.items():
+                pos = index.get(name)
+                if pos is not None and isinstance(value, (int, float)):
+                    row[pos] = value
+            player_info = player.get("player", {})
+            teams.append(team_key)
+            player_names.append(player_info.get("name"))
+            player_ids.append(player_info.get("id"))
+            for values, value in zip(stat_lists, row):
+                values.append(value)
+    return _with_match_keys(out, country, tournament, season, week, game_id)
 
 
 def parse_substitutions_records(
     data: dict, country: str, tournament: str, season, week, game_id
-) -> list:
+) -> ColumnBatch:
     """Extract substitution event records from a single event's incidents response."""
-    records = []
-    for incident in data.get("incidents", []):
-        if incident.get("incidentType") != "substitution":
-            continue
-        records.append({
-            "country": country, "tournament": tournament,
-            "season": season, "week": week, "game_id": game_id,
-            "time": incident.get("time"),
-            "player_in": incident.get("playerIn", {}).get("name"),
-            "player_in_id": incident.get("playerIn", {}).get("id"),
-            "player_out": incident.get("playerOut", {}).get("name"),
-            "player_out_id": incident.get("playerOut", {}).get("id"),
-        })
-    return records
+    subs = [
+        incident for incident in data.get("incidents", [])
+        if incident.get("incidentType") == "substitution"
+    ]
+    out = _match_batch()
+    out["time"] = [incident.get("time") for incident in subs]
+    out["player_in"] = [incident.get("playerIn", {}).get("name") for incident in subs]
+    out["player_in_id"] = [incident.get("playerIn", {}).get("id") for incident in subs]
+    out["player_out"] = [incident.get("playerOut", {}).get("name") for incident in subs]
+    out["player_out_id"] = [incident.get("playerOut", {}).get("id") for incident in subs]
+    return _with_match_keys(out, country, tournament, season, week, game_id)
 
 
 def parse_match_details_records(
@@ -310,78 +496,82 @@ def parse_team_match_history_records(data: dict, seen_game_ids: set) -> list:
     return records
 
 
+_SUPPORTED_INCIDENTS = {"goal", "card", "varDecision"}
+
+_INCIDENT_FIELDS: Fields = (
+    ("incident_type", lambda incident: incident.get("incidentType")),
+    ("incident_class", lambda incident: incident.get("incidentClass")),
+    ("time", lambda incident: incident.get("time")),
+    ("added_time", lambda incident: incident.get("addedTime")),
+    ("is_home", lambda incident: incident.get("isHome")),
+    ("player_id", lambda incident: (incident.get("player", {}) or {}).get("id")),
+    ("player_name", lambda incident: (incident.get("player", {}) or {}).get("name")),
+    # goal-specific
+    ("home_score", lambda incident: incident.get("homeScore")),
+    ("away_score", lambda incident: incident.get("awayScore")),
+    ("goal_from", lambda incident: incident.get("from")),
+    # card-specific
+    ("card_reason", lambda incident: incident.get("reason")),
+    ("rescinded", lambda incident: incident.get("rescinded")),
+    # varDecision-specific
+    ("var_confirmed", lambda incident: incident.get("confirmed")),
+)
+
+
 def parse_incidents_records(
-    data: dict, country: str, tournament: str, season, week, game_id
-) -> list:
-    """Extract goal, card and VAR decision records from a single event's incidents response."""
-    _SUPPORTED = {"goal", "card", "varDecision"}
-    records = []
-    for incident in data.get("incidents", []):
-        incident_type = incident.get("incidentType")
-        if incident_type not in _SUPPORTED:
-            continue
-        player = incident.get("player", {}) or {}
-        records.append({
-            "country":        country,
-            "tournament":     tournament,
-            "season":         season,
-            "week":           week,
-            "game_id":        game_id,
-            "incident_type":  incident_type,
-            "incident_class": incident.get("incidentClass"),
-            "time":           incident.get("time"),
-            "added_time":     incident.get("addedTime"),
-            "is_home":        incident.get("isHome"),
-            "player_id":      player.get("id"),
-            "player_name":    player.get("name"),
-            # goal-specific
-            "home_score":     incident.get("homeScore"),
-            "away_score":     incident.get("awayScore"),
-            "goal_from":      incident.get("from"),
-            # card-specific
-            "card_reason":    incident.get("reason"),
-            "rescinded":      incident.get("rescinded"),
-            # varDecision-specific
-            "var_confirmed":  incident.get("confirmed"),
-        })
-    return records
+    data: dict, country: str, tournament: str, season, week, game_id,
+    columns: Optional[Collection[str]] = None,
+) -> ColumnBatch:
+    """Extract goal, card and VAR decision records from a single event's incidents response.
+
+    With ``columns``, only those output columns are extracted.
+    """
+    incidents = [
+        incident for incident in data.get("incidents", [])
+        if incident.get("incidentType") in _SUPPORTED_INCIDENTS
+    ]
+    return _projected_batch(
+        _INCIDENT_FIELDS, incidents, columns,
+        _match_keys(country, tournament, season, week, game_id),
+    )
 
 
 def parse_match_odds_records(
     data: dict, country: str, tournament: str, season, week, game_id
-) -> list:
+) -> ColumnBatch:
     """Extract betting odds records from a single event's odds response."""
-    records = []
+    columns = (
+        "market_name", "market_id", "is_live", "choice_name",
+        "initial_fractional_value", "current_fractional_value", "winning", "change",
+    )
+    out = _match_batch(*columns)
+    (market_names, market_ids, is_live, choice_names,
+     initial_values, current_values, winning, change) = out.column_lists(*columns)
     for market in data.get("markets", []):
-        for choice in market.get("choices", []):
-            records.append({
-                "country": country, "tournament": tournament,
-                "season": season, "week": week, "game_id": game_id,
-                "market_name": market.get("marketName", "Unknown"),
-                "market_id": market.get("marketId"),
-                "is_live": market.get("isLive", False),
-                "choice_name": choice.get("name", ""),
-                "initial_fractional_value": choice.get("initialFractionalValue", ""),
-                "current_fractional_value": choice.get("fractionalValue", ""),
-                "winning": choice.get("winning", False),
-                "change": choice.get("change", 0),
-            })
-    return records
+        choices = market.get("choices", [])
+        n = len(choices)
+        market_names.extend([market.get("marketName", "Unknown")] * n)
+        market_ids.extend([market.get("marketId")] * n)
+        is_live.extend([market.get("isLive", False)] * n)
+        choice_names.extend([choice.get("name", "") for choice in choices])
+        initial_values.extend([choice.get("initialFractionalValue", "") for choice in choices])
+        current_values.extend([choice.get("fractionalValue", "") for choice in choices])
+        winning.extend([choice.get("winning", False) for choice in choices])
+        change.extend([choice.get("change", 0) for choice in choices])
+    return _with_match_keys(out, country, tournament, season, week, game_id)
 
 
 def parse_best_players_records(
     data: dict, country: str, tournament: str, season, week, game_id
-) -> list:
+) -> ColumnBatch:
     """Extract best-player records from a single event's best-players response."""
-    records = []
+    out = _match_batch()
     for side in ("home", "away"):
         entry = data.get(f"best{side.capitalize()}TeamPlayer")
         if not isinstance(entry, dict):
             continue
         player = entry.get("player", {})
-        records.append({
-            "country": country, "tournament": tournament,
-            "season": season, "week": week, "game_id": game_id,
+        out.append({
             "team": side,
             "player_name": player.get("name"),
             "player_id": player.get("id"),
@@ -389,7 +579,7 @@ def parse_best_players_records(
             "label": entry.get("label"),
             "value": entry.get("value"),
         })
-    return records
+    return _with_match_keys(out, country, tournament, season, week, game_id)
 
 
 def parse_match_h2h_record(
@@ -485,26 +675,21 @@ def parse_average_positions_records(
     data: dict,
     country: str, tournament: str, season, week, game_id,
     home_team: str, away_team: str,
-) -> list:
+) -> ColumnBatch:
     """Extract average positional records from a single event's average-positions response."""
-    records = []
-    for side in ("home", "away"):
-        for entry in data.get(side, []):
-            player = entry.get("player", {})
-            records.append({
-                "country": country, "tournament": tournament,
-                "season": season, "week": week, "game_id": game_id,
-                "home_team": home_team, "away_team": away_team,
-                "side": side,
-                "player_name": player.get("name"),
-                "player_id": player.get("id"),
-                "position": player.get("position"),
-                "jersey_number": player.get("jerseyNumber"),
-                "average_x": entry.get("averageX"),
-                "average_y": entry.get("averageY"),
-                "points_count": entry.get("pointsCount"),
-            })
-    return records
+    entries = [(side, entry) for side in ("home", "away") for entry in data.get(side, [])]
+    players = [entry.get("player", {}) for _, entry in entries]
+    out = _match_batch("home_team", "away_team")
+    out["side"] = [side for side, _ in entries]
+    out["player_name"] = [player.get("name") for player in players]
+    out["player_id"] = [player.get("id") for player in players]
+    out["position"] = [player.get("position") for player in players]
+    out["jersey_number"] = [player.get("jerseyNumber") for player in players]
+    out["average_x"] = [entry.get("averageX") for _, entry in entries]
+    out["average_y"] = [entry.get("averageY") for _, entry in entries]
+    out["points_count"] = [entry.get("pointsCount") for _, entry in entries]
+    out.broadcast(home_team=home_team, away_team=away_team)
+    return _with_match_keys(out, country, tournament, season, week, game_id)
 
 
 def parse_league_player_stats_records(
@@ -531,26 +716,91 @@ def parse_league_player_stats_records(
 
 def parse_pass_network_records(
     data: dict, country: str, tournament: str, season, week, game_id
-) -> list:
+) -> ColumnBatch:
     """Extract pass network pair records from a single event's pass-network response."""
-    records = []
+    pairs: list = []
     for side, team_key in (("home", "homeTeam"), ("away", "awayTeam")):
         team_data = data.get(team_key) or data.get(side, {})
-        for pair in team_data.get("pairPasses", []):
-            p1 = pair.get("player1") or {}
-            p2 = pair.get("player2") or {}
-            records.append({
-                "country": country, "tournament": tournament,
-                "season": season, "week": week, "game_id": game_id,
-                "side": side,
-                "player1_id": p1.get("id"),
-                "player1_name": p1.get("name"),
-                "player2_id": p2.get("id"),
-                "player2_name": p2.get("name"),
-                "passes": pair.get("passes"),
-                "passes_back": pair.get("passesBack"),
-            })
-    return records
+        pairs.extend((side, pair) for pair in team_data.get("pairPasses", []))
+    p1s = [pair.get("player1") or {} for _, pair in pairs]
+    p2s = [pair.get("player2") or {} for _, pair in pairs]
+    out = _match_batch()
+    out["side"] = [side for side, _ in pairs]
+    out["player1_id"] = [p1.get("id") for p1 in p1s]
+    out["player1_name"] = [p1.get("name") for p1 in p1s]
+    out["player2_id"] = [p2.get("id") for p2 in p2s]
+    out["player2_name"] = [p2.get("name") for p2 in p2s]
+    out["passes"] = [pair.get("passes") for _, pair in pairs]
+    out["passes_back"] = [pair.get("passesBack") for _, pair in pairs]
+    return _with_match_keys(out, country, tournament, season, week, game_id)
+
+
+def _xy(coords) -> tuple:
+    if isinstance(coords, dict):
+        return coords.get("x"), coords.get("y")
+    return None, None
+
+
+def _id_name(entity) -> tuple:
+    if isinstance(entity, dict):
+        return entity.get("id"), entity.get("name")
+    return None, None
+
+
+_GOAL_NETWORK_COLUMNS = (
+    "player_name", "player_id", "event_type",
+    "player_x", "player_y", "pass_end_x", "pass_end_y",
+    "is_assist", "id",
+    "goalkeeper_x", "goalkeeper_y",
+    "goal_shot_x", "goal_shot_y",
+    "goal_mouth_x", "goal_mouth_y",
+    "goalkeeper_name", "goalkeeper_id",
+)
+
+
+def parse_goal_networks_records(
+    data: dict, country: str, tournament: str, season, week, game_id
+) -> ColumnBatch:
+    """Flatten every goal's ``footballPassingNetworkAction`` list into one row per action.
+
+    Reads a single event's incidents response; ``id`` is the incident (goal) id.
+    """
+    out = _match_batch(*_GOAL_NETWORK_COLUMNS)
+    (player_names, player_ids, event_types, player_xs, player_ys, pass_end_xs, pass_end_ys,
+     is_assists, ids, gk_xs, gk_ys, shot_xs, shot_ys, mouth_xs, mouth_ys,
+     gk_names, gk_ids) = out.column_lists(*_GOAL_NETWORK_COLUMNS)
+    incidents = data.get("incidents", [])
+    for incident in incidents if isinstance(incidents, list) else ():
+        actions = incident.get("footballPassingNetworkAction")
+        if not isinstance(actions, list):
+            continue
+        incident_id = incident.get("id")
+        for action in actions:
+            player_id, player_name = _id_name(action.get("player"))
+            player_x, player_y = _xy(action.get("playerCoordinates"))
+            pass_end_x, pass_end_y = _xy(action.get("passEndCoordinates"))
+            gk_x, gk_y = _xy(action.get("gkCoordinates"))
+            shot_x, shot_y = _xy(action.get("goalShotCoordinates"))
+            mouth_x, mouth_y = _xy(action.get("goalMouthCoordinates"))
+            gk_id, gk_name = _id_name(action.get("goalkeeper"))
+            player_names.append(player_name)
+            player_ids.append(player_id)
+            event_types.append(action.get("eventType"))
+            player_xs.append(player_x)
+            player_ys.append(player_y)
+            pass_end_xs.append(pass_end_x)
+            pass_end_ys.append(pass_end_y)
+            is_assists.append(action.get("isAssist"))
+            ids.append(incident_id)
+            gk_xs.append(gk_x)
+            gk_ys.append(gk_y)
+            shot_xs.append(shot_x)
+            shot_ys.append(shot_y)
+            mouth_xs.append(mouth_x)
+            mouth_ys.append(mouth_y)
+            gk_names.append(gk_name)
+            gk_ids.append(gk_id)
+    return _with_match_keys(out, country, tournament, season, week, game_id)
 
 
 _SEARCH_TYPE_MAP = {"tournament": "uniqueTournament"}
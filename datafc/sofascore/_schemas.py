@@ -0,0 +1,507 @@
+"""
+Declared output schemas of the Sofascore fetch functions.
+
+Each entry of ``SCHEMAS`` maps a function name to its columns, in output
+order, and their dtypes:
+
+* ``"Int64"`` for IDs, counts, scores and epoch timestamps — nullable, so a
+  missing value no longer turns the column into float or object;
+* ``"float32"`` for coordinates, xG and ratings — applied only with
+  ``compact=True``; by default these are ``"float64"``, as is money;
+* ``"category"`` for low-cardinality labels (country, tournament, season,
+  stat names, positions, ...) — applied only with ``compact=True``; by
+  default labels stay plain strings;
+* ``"boolean"`` (nullable) for flags and ``"datetime64[ns]"`` for dates;
+* ``None`` where values are free text or mixed (e.g. ``stat_value``), which
+  keeps the inferred dtype.
+
+``build_frame`` builds a DataFrame straight from a ``ColumnBatch`` or a list of
+records with these dtypes; ``apply_schema`` does the same for a frame built
+elsewhere. Columns not in the schema (dynamic statistic columns, form
+columns) follow the declared ones with their inferred dtype. A column whose
+values don't fit the declared dtype (an unexpected string in an ID column,
+say) keeps its inferred dtype rather than failing the call, and a warning
+naming the column is logged.
+
+With ``compact=True`` the declared labels become categoricals, and so does
+every other string column in which values repeat (player names, stat groups,
+text values such as ``"55%"``), so a league's worth of lineups or match
+statistics stores each distinct string once.
+
+With an Arrow or Polars output backend selected (see ``datafc.utils._backend``),
+``build_frame`` builds a ``pyarrow.Table`` from the records instead, mapping the
+same dtypes to Arrow types (``category`` becomes dictionary-encoded), and
+wraps it as an Arrow-backed DataFrame without copying.
+
+``validate_columns`` checks a ``columns=`` projection against a schema; the
+builders then emit just those columns, in the requested order.
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from datafc.exceptions import InvalidParameterError
+from datafc.sofascore._parsers import LINEUP_STATS
+from datafc.utils._backend import arrow_frame, current_backend, require_pyarrow
+from datafc.utils._columns import ColumnBatch
+
+logger = logging.getLogger(__name__)
+
+Schema = Dict[str, Optional[str]]
+
+INT = "Int64"
+F32 = "float32"
+F64 = "float64"
+CAT = "category"
+BOOL = "boolean"
+DATE = "datetime64[ns]"
+ANY = None
+
+_MATCH_KEYS: Schema = {
+    "country": CAT, "tournament": CAT, "season": CAT, "week": INT, "game_id": INT,
+}
+
+_EVENT: Schema = {
+    **_MATCH_KEYS,
+    "home_team": CAT, "home_team_id": INT, "away_team": CAT, "away_team_id": INT,
+    "injury_time_1": INT, "injury_time_2": INT,
+    "start_timestamp": INT,
+    "status": CAT,
+    "home_score_current": INT, "home_score_display": INT,
+    "home_score_period1": INT, "home_score_period2": INT, "home_score_normaltime": INT,
+    "away_score_current": INT, "away_score_display": INT,
+    "away_score_period1": INT, "away_score_period2": INT, "away_score_normaltime": INT,
+}
+
+_FIXTURE: Schema = {
+    **_MATCH_KEYS,
+    "home_team": CAT, "home_team_id": INT, "away_team": CAT, "away_team_id": INT,
+}
+
+_TRANSFER: Schema = {
+    "transfer_date": DATE,
+    "from_team_id": INT, "from_team_name": CAT,
+    "to_team_id": INT, "to_team_name": CAT,
+    "transfer_type": CAT,
+    "fee": F64, "fee_currency": CAT,
+}
+
+_TEAM_KEYS: Schema = {
+    "country": CAT, "tournament": CAT, "team_name": CAT, "team_id": INT,
+}
+
+_PLAYER_KEYS: Schema = {"player_id": INT, "player_name": ANY}
+
+# Declared dtypes that only apply with ``compact=True``, and what is used otherwise.
+_DEFAULT_DTYPES: Dict[str, Optional[str]] = {CAT: ANY, F32: F64}
+
+_FRACTIONAL_LINEUP_STATS = {"rating", "expectedGoals", "expectedAssists", "goalsPrevented"}
+
+SCHEMAS: Dict[str, Schema] = {
+    # Discovery / metadata
+    "search_data": {
+        "entity_id": INT, "entity_name": ANY, "entity_type": CAT,
+        "score": F64, "country": CAT, "position": CAT,
+    },
+    "seasons_data": {
+        "tournament_id": INT, "season_id": INT, "season_name": ANY, "season_year": CAT,
+    },
+    "season_rounds_data": {
+        "tournament_id": INT, "season_id": INT, "round_number": INT,
+        "slug": ANY, "name": ANY, "prefix": ANY, "is_latest": BOOL,
+    },
+    # League / season
+    "standings_data": {
+        "country": CAT, "tournament": CAT, "tournament_id": INT, "season_id": INT,
+        "team_name": CAT, "team_id": INT, "position": INT,
+        "matches": INT, "wins": INT, "draws": INT, "losses": INT,
+        "scores_for": INT, "scores_against": INT, "points": INT,
+        "category": CAT,
+    },
+    "team_data": {
+        "country": CAT, "tournament": CAT, "team_id": INT, "team_name": ANY,
+        "short_name": ANY, "slug": ANY, "national": BOOL,
+        "country_name": CAT, "country_id": INT,
+        "primary_color": ANY, "secondary_color": ANY, "text_color": ANY,
+        "venue_id": INT, "venue_name": ANY, "venue_capacity": INT, "venue_city": ANY,
+        "manager_id": INT, "manager_name": ANY, "manager_country": CAT,
+    },
+    "team_stats_data": {**_TEAM_KEYS, "stat": CAT, "value": ANY},
+    "team_transfers_data": {
+        **_TEAM_KEYS, "direction": CAT, "player_id": INT, "player_name": ANY, **_TRANSFER,
+    },
+    "player_stats_data": {
+        **_TEAM_KEYS, "player_name": ANY, "player_id": INT, "position": CAT,
+        "stat_name": CAT, "stat_value": ANY,
+    },
+    "squad_data": {
+        "country": CAT, "tournament": CAT, "tournament_id": INT, "season_id": INT,
+        "team_name": CAT, "team_id": INT,
+        "player_name": ANY, "player_id": INT, "age": INT, "height": INT,
+        "player_country": CAT, "position": CAT, "preferred_foot": CAT,
+        "contract_until": INT, "market_value": F64, "market_currency": CAT,
+    },
+    "team_match_history_data": {
+        **_FIXTURE,
+        "home_score_period1": INT, "home_score_period2": INT, "home_score_normaltime": INT,
+        "home_score_display": INT, "home_score_current": INT,
+        "away_score_period1": INT, "away_score_period2": INT, "away_score_normaltime": INT,
+        "away_score_display": INT, "away_score_current": INT,
+        "start_timestamp": INT, "status": CAT,
+    },
+    "upcoming_matches_data": {**_FIXTURE, "start_timestamp": INT, "status": CAT},
+    "league_player_stats_data": {
+        "tournament_id": INT, "season_id": INT,
+        "player_name": ANY, "player_id": INT, "team_name": CAT, "team_id": INT,
+    },
+    # Matchweek
+    "match_data": _EVENT,
+    "past_matches_data": _EVENT,
+    "match_details_data": {
+        **_MATCH_KEYS,
+        "referee_id": INT, "referee_name": ANY, "referee_country": CAT,
+        "referee_yellow_cards": INT, "referee_red_cards": INT, "referee_games": INT,
+        "venue_id": INT, "venue_name": ANY, "venue_city": ANY, "venue_country": CAT,
+        "venue_capacity": INT,
+    },
+    "formations_data": {**_MATCH_KEYS, "team": CAT, "formation": CAT},
+    "match_stats_data": {
+        **_MATCH_KEYS, "period": CAT, "group_name": CAT, "stat_name": CAT,
+        "home_team_stat": ANY, "away_team_stat": ANY,
+    },
+    # match_stats_data(format="wide"): the {period}_{stat}_{side} columns are float64.
+    "match_stats_data_wide": {**_MATCH_KEYS},
+    "match_odds_data": {
+        **_MATCH_KEYS, "market_name": CAT, "market_id": INT, "is_live": BOOL,
+        "choice_name": CAT, "initial_fractional_value": ANY, "current_fractional_value": ANY,
+        "winning": BOOL, "change": INT,
+    },
+    "match_h2h_data": {
+        **_MATCH_KEYS, "home_team": CAT, "away_team": CAT,
+        "home_wins": INT, "away_wins": INT, "draws": INT,
+    },
+    "momentum_data": {**_MATCH_KEYS, "minute": F32, "value": F32},
+    "pregame_form_data": {
+        **_MATCH_KEYS, "team": CAT, "avg_rating": F32, "position": INT, "value": F64,
+    },
+    "shots_data": {
+        **_MATCH_KEYS,
+        "player_name": ANY, "player_id": INT, "player_position": CAT,
+        "is_home": BOOL, "incident_type": CAT, "shot_type": CAT, "body_part": CAT,
+        "goal_type": CAT, "situation": CAT, "goal_mouth_location": CAT,
+        "xg": F32, "xgot": F32,
+        "player_coordinates_x": F32, "player_coordinates_y": F32, "player_coordinates_z": F32,
+        "goal_mouth_coordinates_x": F32, "goal_mouth_coordinates_y": F32,
+        "goal_mouth_coordinates_z": F32,
+        "draw_start_x": F32, "draw_start_y": F32, "draw_end_x": F32, "draw_end_y": F32,
+        "draw_goal_x": F32, "draw_goal_y": F32,
+        "block_coordinates_x": F32, "block_coordinates_y": F32, "block_coordinates_z": F32,
+        "time": INT, "time_seconds": INT, "added_time": INT,
+    },
+    "lineups_data": {
+        **_MATCH_KEYS, "team": CAT, "player_name": ANY, "player_id": INT,
+        "stat_name": CAT, "stat_value": ANY,
+    },
+    # lineups_data(format="wide"): one column per stat, counts as integers.
+    "lineups_data_wide": {
+        **_MATCH_KEYS, "team": CAT, "player_name": ANY, "player_id": INT,
+        **{stat: F32 if stat in _FRACTIONAL_LINEUP_STATS else INT for stat in LINEUP_STATS},
+    },
+    "substitutions_data": {
+        **_MATCH_KEYS, "time": INT,
+        "player_in": ANY, "player_in_id": INT, "player_out": ANY, "player_out_id": INT,
+    },
+    "incidents_data": {
+        **_MATCH_KEYS, "incident_type": CAT, "incident_class": CAT,
+        "time": INT, "added_time": INT, "is_home": BOOL,
+        "player_id": INT, "player_name": ANY,
+        "home_score": INT, "away_score": INT, "goal_from": CAT,
+        "card_reason": CAT, "rescinded": BOOL, "var_confirmed": BOOL,
+    },
+    "average_positions_data": {
+        **_MATCH_KEYS, "home_team": CAT, "away_team": CAT, "side": CAT,
+        "player_name": ANY, "player_id": INT, "position": CAT, "jersey_number": ANY,
+        "average_x": F32, "average_y": F32, "points_count": INT,
+    },
+    "coordinates_data": {
+        **_MATCH_KEYS, "team": CAT, "player_id": INT, "player_name": ANY,
+        "x": F32, "y": F32,
+    },
+    "goal_networks_data": {
+        **_MATCH_KEYS,
+        "player_name": ANY, "player_id": INT, "event_type": CAT,
+        "player_x": F32, "player_y": F32, "pass_end_x": F32, "pass_end_y": F32,
+        "is_assist": BOOL, "id": INT,
+        "goalkeeper_x": F32, "goalkeeper_y": F32,
+        "goal_shot_x": F32, "goal_shot_y": F32,
+        "goal_mouth_x": F32, "goal_mouth_y": F32,
+        "goalkeeper_name": ANY, "goalkeeper_id": INT,
+    },
+    # Player
+    "player_data": {
+        **_PLAYER_KEYS, "date_of_birth": DATE, "age": INT,
+        "nationality": CAT, "nationality_id": INT, "height": INT, "weight": INT,
+        "preferred_foot": CAT, "jersey_number": ANY, "position": CAT,
+        "position_detailed": ANY, "market_value": F64, "market_currency": CAT,
+        "team_id": INT, "team_name": ANY,
+    },
+    "player_transfers_data": {**_PLAYER_KEYS, **_TRANSFER},
+    "player_career_stats_data": {
+        **_PLAYER_KEYS, "tournament_id": INT, "tournament_name": CAT,
+        "season_id": INT, "season_name": CAT, "team_id": INT, "team_name": CAT,
+        "stat": CAT, "value": ANY,
+    },
+    "player_attribute_overviews_data": {
+        **_PLAYER_KEYS, "series": CAT, "position": CAT, "year_shift": INT,
+        "attacking": INT, "technical": INT, "tactical": INT, "defending": INT,
+        "creativity": INT,
+    },
+    "player_national_team_data": {
+        **_PLAYER_KEYS, "team_id": INT, "team_name": CAT, "team_code": CAT,
+        "appearances": INT, "goals": INT, "debut_timestamp": INT,
+    },
+    "player_match_log_data": {
+        **_PLAYER_KEYS, "game_id": INT, "start_timestamp": INT,
+        "tournament": CAT, "season": CAT,
+        "home_team": CAT, "home_team_id": INT, "away_team": CAT, "away_team_id": INT,
+        "home_score": INT, "away_score": INT, "status": CAT,
+    },
+    # Referee
+    "referee_stats_data": {
+        "referee_id": INT, "referee_name": ANY, "tournament_id": INT, "tournament_name": CAT,
+        "stat": CAT, "value": ANY,
+    },
+}
+
+
+# Declared-ANY columns whose values mix numbers, text and dicts. Spilled chunks
+# store them as JSON text (see ``RecordSpiller``) so every chunk has the same
+# Parquet type and loading returns the in-memory values.
+MIXED_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "lineups_data": ("stat_value",),
+}
+
+
+def _blank_to_none(values: Iterable) -> list:
+    """Sofascore omits numbers as "" in a few endpoints; treat those as missing."""
+    return [None if isinstance(v, str) and v == "" else v for v in values]
+
+
+def _convert(values, dtype: str):
+    if dtype == INT:
+        return pd.array(values, dtype=INT)
+    if dtype in (F32, F64):
+        return np.asarray(values, dtype=dtype)
+    if dtype == CAT:
+        return pd.Categorical(values)
+    if dtype == BOOL:
+        return pd.array(values, dtype=BOOL)
+    if dtype == DATE:
+        return pd.to_datetime(values, errors="raise").astype(DATE)
+    raise ValueError(f"Unsupported dtype {dtype!r}")
+
+
+def _dtype(schema: Schema, column: str, compact: bool = False) -> Optional[str]:
+    """The dtype ``column`` is built with: its declared one, widened unless ``compact``."""
+    dtype = schema.get(column)
+    if compact or dtype is None:
+        return dtype
+    return _DEFAULT_DTYPES.get(dtype, dtype)
+
+
+def _typed(values, dtype: Optional[str], column: str):
+    """Return ``values`` as ``dtype``, or unchanged if they don't fit it."""
+    if dtype is None:
+        return values
+    try:
+        return _convert(values, dtype)
+    except (TypeError, ValueError, OverflowError):
+        pass
+    if dtype not in (CAT, DATE):
+        try:
+            return _convert(_blank_to_none(values), dtype)
+        except (TypeError, ValueError, OverflowError):
+            pass
+    logger.warning("Column %r does not fit dtype %s; keeping inferred dtype.", column, dtype)
+    return values
+
+
+def validate_columns(columns: Optional[Sequence[str]], fn_name: str) -> Optional[Tuple[str, ...]]:
+    """
+    Check a ``columns=`` projection against ``fn_name``'s schema.
+
+    Returns the columns as a tuple, or None when no projection was requested.
+
+    Raises:
+        InvalidParameterError: If ``columns`` is empty, a single string, or
+            names a column ``fn_name`` does not produce.
+    """
+    if columns is None:
+        return None
+    if isinstance(columns, str) or not columns:
+        raise InvalidParameterError(
+            "columns must be a non-empty list of column names, e.g. ['game_id', 'xg']."
+        )
+    schema = SCHEMAS[fn_name]
+    unknown = [column for column in columns if column not in schema]
+    if unknown:
+        raise InvalidParameterError(
+            f"Unknown column(s) for {fn_name}: {', '.join(map(str, unknown))}. "
+            f"Must be among: {', '.join(schema)}."
+        )
+    return tuple(dict.fromkeys(columns))
+
+
+def _ordered(
+    columns: List[str], schema: Schema, requested: Optional[Sequence[str]] = None,
+) -> List[str]:
+    present = set(columns)
+    if requested is not None:
+        return [column for column in requested if column in present]
+    declared = [column for column in schema if column in present]
+    return declared + [column for column in columns if column not in schema]
+
+
+def _categorize_repeated(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert string columns with at most one distinct value per two rows to category."""
+    n = len(df)
+    for column in df.columns:
+        values = df[column]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            continue
+        if pd.api.types.infer_dtype(values, skipna=True) != "string":
+            continue
+        if values.nunique() * 2 <= n:
+            df[column] = values.astype(CAT)
+    return df
+
+
+def _arrow_type(pa, dtype: str):
+    return {
+        INT: pa.int64(), F32: pa.float32(), F64: pa.float64(),
+        BOOL: pa.bool_(), DATE: pa.timestamp("ns"),
+    }[dtype]
+
+
+def _arrow_cast(pa, array, dtype: str):
+    if dtype == CAT:
+        if pa.types.is_null(array.type):
+            array = array.cast(pa.string())
+        return array.dictionary_encode()
+    return array.cast(_arrow_type(pa, dtype))
+
+
+def _arrow_column(pa, values, dtype: Optional[str], column: str):
+    """Arrow counterpart of ``_typed``: infer an array, then cast it to ``dtype``."""
+    errors = (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError)
+    try:
+        array = pa.array(values, from_pandas=True)
+    except errors:
+        # Mixed Python types have no Arrow type; keep them as strings.
+        array = pa.array([None if v is None else str(v) for v in values], pa.string())
+    if dtype is None:
+        return array
+    try:
+        return _arrow_cast(pa, array, dtype)
+    except errors:
+        pass
+    if dtype not in (CAT, DATE):
+        try:
+            return _arrow_cast(pa, pa.array(_blank_to_none(values), from_pandas=True), dtype)
+        except errors:
+            pass
+    logger.warning("Column %r does not fit dtype %s; keeping inferred type.", column, dtype)
+    return array
+
+
+def _dictionary_encode_repeated(pa, arrays: dict) -> dict:
+    """Arrow counterpart of ``_categorize_repeated``."""
+    import pyarrow.compute as pc
+
+    for column, array in arrays.items():
+        if not (pa.types.is_string(array.type) or pa.types.is_large_string(array.type)):
+            continue
+        if pc.count_distinct(array).as_py() * 2 <= len(array):
+            arrays[column] = array.dictionary_encode()
+    return arrays
+
+
+def build_table(
+    records: Union[dict, list, pd.DataFrame],
+    fn_name: str,
+    compact: bool = False,
+    columns: Optional[Sequence[str]] = None,
+):
+    """
+    Build ``fn_name``'s output as a ``pyarrow.Table`` with Arrow types for the
+    declared dtypes, from a ``ColumnBatch``, a list of records or a DataFrame.
+    """
+    pa = require_pyarrow()
+    if isinstance(records, pd.DataFrame):
+        data = {column: records[column] for column in records.columns}
+    elif isinstance(records, dict):
+        data = records
+    else:
+        data = ColumnBatch()
+        data.extend(records)
+    schema = SCHEMAS.get(fn_name, {})
+    arrays = {
+        column: _arrow_column(pa, data[column], _dtype(schema, column, compact), column)
+        for column in _ordered(list(data), schema, columns)
+    }
+    if compact:
+        arrays = _dictionary_encode_repeated(pa, arrays)
+    return pa.table(arrays) if arrays else pa.table({})
+
+
+def build_frame(
+    records: Union[dict, list],
+    fn_name: str,
+    compact: bool = False,
+    columns: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """
+    Build ``fn_name``'s DataFrame from a ``ColumnBatch`` or a list of records.
+
+    Column-oriented input is converted column by column straight into the
+    declared dtypes, without an inference pass over a generic object frame.
+    With ``compact=True``, undeclared repeated string columns become categoricals.
+    With ``columns``, only those columns are kept, in that order.
+    Under the other backends the frame is an Arrow-backed view of ``build_table``
+    (see ``arrow_frame``).
+    """
+    backend = current_backend()
+    if backend != "pandas":
+        return arrow_frame(build_table(records, fn_name, compact, columns), backend)
+    schema = SCHEMAS.get(fn_name, {})
+    if not isinstance(records, dict):
+        return apply_schema(pd.DataFrame(records), fn_name, compact=compact, columns=columns)
+    df = pd.DataFrame({
+        column: _typed(records[column], _dtype(schema, column, compact), column)
+        for column in _ordered(list(records), schema, columns)
+    })
+    return _categorize_repeated(df) if compact else df
+
+
+def apply_schema(
+    df: pd.DataFrame,
+    fn_name: str,
+    compact: bool = False,
+    columns: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """Reorder and cast an existing frame to ``fn_name``'s declared schema."""
+    backend = current_backend()
+    if backend != "pandas":
+        return arrow_frame(build_table(df, fn_name, compact, columns), backend)
+    schema = SCHEMAS.get(fn_name)
+    if not schema or df.empty and not len(df.columns):
+        return _categorize_repeated(df) if compact else df
+    ordered = _ordered(list(df.columns), schema, columns)
+    df = pd.DataFrame(
+        {column: _typed(df[column], _dtype(schema, column, compact), column) for column in ordered},
+        index=df.index,
+    )
+    return _categorize_repeated(df) if compact else df
@@ -0,0 +1,337 @@
+"""
+Streaming (unit-by-unit) execution of the row-driven fetch functions.
+
+The per-match, per-team and per-player functions collect every record before
+building one DataFrame, so nothing is usable until the last request finishes
+and the whole dataset is held in memory at once. ``iter_data`` runs such a
+function on one fetch unit at a time and yields each unit's DataFrame as soon
+as it is parsed, so consumers can process or write results incrementally.
+
+A fetch unit is the part of the input a function fetches independently, as
+declared in ``FETCH_UNITS``: all rows of one match (``game_id``) for the
+per-match functions and ``coordinates_data``, one player (``player_id``) for
+the per-player functions, and one team's ``"Total"`` standings row
+(``team_id``) for the per-team functions. Grouping the input this way keeps
+each function's own de-duplication (``coordinates_data`` fetches a player's
+heatmap once however many stat rows ``lineups_df`` has for them), and
+``upcoming_matches_data`` drops games already yielded for an earlier team, so
+the streamed frames add up to the batch result.
+
+Each call goes through the regular function, so column schema, dtypes and
+post-processing are exactly those of the batch version. All calls share one
+HTTP session, opened on the first request that misses the cache.
+
+The async counterparts are ``datafc.sofascore.aio.iter_data`` and the
+``aio.stream_*`` functions, both built on ``DataStream``: units are yielded in
+completion order, and a stream can be bounded by a deadline or cancelled, in
+which case the partial results and a list of failed units are still available.
+
+Usage:
+    from datafc.sofascore import iter_data, lineups_data
+
+    for game_df in iter_data(lineups_data, match_df):
+        game_df.to_parquet(f"lineups/{game_df['game_id'].iat[0]}.parquet")
+"""
+
+import asyncio
+import logging
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+)
+
+import pandas as pd
+
+from datafc.exceptions import APIError, DataNotAvailableError, InvalidParameterError
+from datafc.sofascore._core import raise_api_errors
+from datafc.utils._async_client import LazyAsyncSession
+from datafc.utils._async_client import shared_session as shared_async_session
+from datafc.utils._backend import as_input_frame, concat_results, drop_seen
+from datafc.utils._client import LazySession, shared_session
+
+logger = logging.getLogger(__name__)
+
+
+class FetchUnit(NamedTuple):
+    """How a row-driven function's input splits into independently fetched parts.
+
+    Attributes:
+        key: Input column identifying a unit; rows sharing it are passed together.
+        total_only: Only the ``"Total"`` standings rows are fetched.
+        unique: Output column that is unique across the whole batch result, if
+            the function de-duplicates it across units.
+    """
+
+    key: str
+    total_only: bool = False
+    unique: Optional[str] = None
+
+
+_PER_MATCH = FetchUnit("game_id")
+_PER_PLAYER = FetchUnit("player_id")
+_PER_TEAM = FetchUnit("team_id", total_only=True)
+
+FETCH_UNITS: Dict[str, FetchUnit] = {
+    **dict.fromkeys((
+        "match_stats_data", "match_odds_data", "match_h2h_data", "momentum_data",
+        "substitutions_data", "incidents_data", "match_details_data", "formations_data",
+        "goal_networks_data", "shots_data", "average_positions_data", "pregame_form_data",
+        "lineups_data", "coordinates_data",
+    ), _PER_MATCH),
+    **dict.fromkeys((
+        "player_career_stats_data", "player_transfers_data", "player_match_log_data",
+        "player_national_team_data", "player_data", "player_attribute_overviews_data",
+    ), _PER_PLAYER),
+    **dict.fromkeys((
+        "team_stats_data", "player_stats_data", "squad_data", "team_transfers_data",
+        "team_data",
+    ), _PER_TEAM),
+    "upcoming_matches_data": FetchUnit("team_id", total_only=True, unique="game_id"),
+}
+
+# Options that act on a whole batch result rather than on one unit's frame.
+_BATCH_ONLY_PARAMS = (
+    "enable_json_export", "enable_excel_export", "spill_dir", "bins", "enable_npz_export",
+)
+
+
+def _check_stream_kwargs(kwargs: dict) -> None:
+    for name in _BATCH_ONLY_PARAMS:
+        if kwargs.get(name):
+            raise InvalidParameterError(
+                f"{name} is not supported when streaming; it applies to a whole batch "
+                "call. Write the streamed frames yourself instead."
+            )
+
+
+def fetch_units(fn: Callable, df: pd.DataFrame) -> List[pd.DataFrame]:
+    """Split ``df`` into ``fn``'s fetch units, in order of first appearance.
+
+    Functions not in ``FETCH_UNITS``, and inputs lacking the unit's key column
+    (left for ``fn`` to reject), are streamed one row at a time.
+    """
+    unit = FETCH_UNITS.get(getattr(fn, "__name__", ""))
+    if unit is None or unit.key not in df.columns:
+        return [df.iloc[[pos]] for pos in range(len(df))]
+    if unit.total_only and "category" in df.columns:
+        df = df[df["category"] == "Total"]
+    return [group for _, group in df.groupby(unit.key, sort=False, dropna=False)]
+
+
+def _unique_column(fn: Callable) -> Optional[str]:
+    unit = FETCH_UNITS.get(getattr(fn, "__name__", ""))
+    return None if unit is None else unit.unique
+
+
+def iter_data(
+    fn: Callable[..., pd.DataFrame],
+    df: pd.DataFrame,
+    *args: Any,
+    **kwargs: Any,
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield ``fn``'s result for each fetch unit of ``df``, one DataFrame per unit, in input order.
+
+    Args:
+        fn: A sync fetch function whose first parameter is a DataFrame
+            (``match_df``, ``standings_df``, ``squad_df`` or ``lineups_df``),
+            e.g. ``lineups_data`` or ``squad_data``.
+        df: Input DataFrame, split into fetch units (see ``FETCH_UNITS``); each
+            unit's rows are passed to ``fn`` together.
+        *args, **kwargs: Further arguments for ``fn``. JSON/Excel export,
+            ``spill_dir`` and heatmap grids apply to batch calls only.
+
+    Yields:
+        One DataFrame per unit. Units for which ``fn`` raises
+        ``DataNotAvailableError`` (e.g. a match without shots) are skipped.
+
+    Raises:
+        InvalidParameterError: If a batch-only option is passed.
+        Any other exception raised by ``fn``, such as ``APIError`` from
+        functions that do not skip failed rows.
+    """
+    _check_stream_kwargs(kwargs)
+    units = fetch_units(fn, as_input_frame(df))
+    unique = _unique_column(fn)
+    seen: set = set()
+    session = LazySession()
+    try:
+        for unit in units:
+            token = shared_session.set(session)
+            try:
+                result = fn(unit, *args, **kwargs)
+            except DataNotAvailableError as exc:
+                logger.debug("No data for unit at row %s: %s", unit.index[0], exc)
+                continue
+            finally:
+                shared_session.reset(token)
+            if unique is not None:
+                result = drop_seen(result, unique, seen)
+                if not len(result):
+                    continue
+            yield result
+    finally:
+        session.close()
+
+
+class StreamFailure(NamedTuple):
+    """A fetch unit that produced no result: its input rows and the error."""
+
+    rows: pd.DataFrame
+    error: BaseException
+
+
+class StreamResult(NamedTuple):
+    """Outcome of ``DataStream.collect()``; ``data`` is in the stream's output backend."""
+
+    data: Any
+    failures: List[StreamFailure]
+    complete: bool
+
+
+class DataStream:
+    """
+    Async iterator over the per-unit results of an ``aio`` function.
+
+    The input is split into fetch units as for ``iter_data`` (see
+    ``FETCH_UNITS``). Units run concurrently (up to ``concurrency`` at a time,
+    within the global rate limit) and their DataFrames are yielded in completion
+    order. A unit failing with ``APIError`` is recorded in ``failures`` instead
+    of aborting the stream — even for functions that normally propagate it, such
+    as ``match_odds_data``, and for those that log and skip failed rows, such as
+    ``lineups_data``. Units without data (``DataNotAvailableError``) are
+    skipped.
+
+    When ``deadline`` seconds have passed, or ``cancel()`` is called, the units
+    still running are cancelled and recorded in ``failures`` with an
+    ``asyncio.TimeoutError`` / ``asyncio.CancelledError``, and the stream ends.
+    All units share one HTTP session, opened on the first request that misses
+    the cache. A stream can be consumed once.
+
+    Args:
+        fn: ``aio`` function whose first parameter is a DataFrame.
+        df: Input rows, split into fetch units; each unit's rows are passed to
+            ``fn`` together.
+        args, kwargs: Further arguments for ``fn``. JSON/Excel export,
+            ``spill_dir`` and heatmap grids apply to batch calls only.
+        concurrency: Maximum units in flight. Defaults to 8.
+        deadline: Optional time budget in seconds, counted from the start of iteration.
+        capture_errors: Record ``APIError`` in ``failures`` (True) or raise it (False).
+    """
+
+    def __init__(
+        self,
+        fn: Callable[..., Awaitable[pd.DataFrame]],
+        df: pd.DataFrame,
+        args: tuple = (),
+        kwargs: Optional[dict] = None,
+        concurrency: int = 8,
+        deadline: Optional[float] = None,
+        capture_errors: bool = True,
+    ) -> None:
+        self._kwargs = kwargs or {}
+        _check_stream_kwargs(self._kwargs)
+        self._fn = fn
+        self._units = fetch_units(fn, as_input_frame(df))
+        self._unique = _unique_column(fn)
+        self._seen: set = set()
+        self._args = args
+        self._concurrency = max(1, concurrency)
+        self._deadline = deadline
+        self._capture_errors = capture_errors
+        self._tasks: dict = {}
+        self._started = False
+        self.failures: List[StreamFailure] = []
+        self.timed_out = False
+        self.cancelled = False
+
+    @property
+    def complete(self) -> bool:
+        """True if every unit finished (successfully or not) before a deadline/cancel."""
+        return not (self.timed_out or self.cancelled)
+
+    def cancel(self) -> None:
+        """Stop the stream; units still running are cancelled and recorded as failures."""
+        self.cancelled = True
+        for task in self._tasks:
+            task.cancel()
+
+    def __aiter__(self) -> AsyncIterator[pd.DataFrame]:
+        if self._started:
+            raise RuntimeError("A DataStream can only be consumed once.")
+        self._started = True
+        return self._run()
+
+    async def collect(self) -> StreamResult:
+        """Consume the stream; return the concatenated results, failures and completeness."""
+        frames = [frame async for frame in self]
+        data = concat_results(frames)
+        return StreamResult(data, list(self.failures), self.complete)
+
+    async def _one(self, session: LazyAsyncSession, sem: asyncio.Semaphore, pos: int):
+        async with sem:
+            # Each task runs in its own context copy, so these do not leak.
+            shared_async_session.set(session)
+            raise_api_errors.set(self._capture_errors)
+            try:
+                return await self._fn(self._units[pos], *self._args, **self._kwargs)
+            except DataNotAvailableError as exc:
+                logger.debug("No data for unit %d: %s", pos, exc)
+                return None
+
+    async def _run(self) -> AsyncIterator[pd.DataFrame]:
+        loop = asyncio.get_running_loop()
+        ends_at = None if self._deadline is None else loop.time() + self._deadline
+        session = LazyAsyncSession()
+        sem = asyncio.Semaphore(self._concurrency)
+        self._tasks = {
+            asyncio.ensure_future(self._one(session, sem, pos)): pos
+            for pos in range(len(self._units))
+        }
+        pending = set(self._tasks)
+        try:
+            while pending and not self.cancelled:
+                timeout = None if ends_at is None else ends_at - loop.time()
+                if timeout is not None and timeout <= 0:
+                    self.timed_out = True
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    self.timed_out = True
+                    break
+                for task in sorted(done, key=self._tasks.__getitem__):
+                    if task.cancelled():
+                        continue
+                    exc = task.exception()
+                    if exc is None:
+                        result = task.result()
+                        if result is not None and self._unique is not None:
+                            result = drop_seen(result, self._unique, self._seen)
+                        if result is not None and len(result):
+                            yield result
+                    elif self._capture_errors and isinstance(exc, APIError):
+                        self.failures.append(self._failure(task, exc))
+                    else:
+                        raise exc
+        finally:
+            unfinished = [task for task in self._tasks if not task.done() or task.cancelled()]
+            for task in unfinished:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            if self.timed_out or self.cancelled:
+                reason = asyncio.TimeoutError if self.timed_out else asyncio.CancelledError
+                for task in unfinished:
+                    self.failures.append(self._failure(task, reason()))
+            await session.close()
+
+    def _failure(self, task: asyncio.Future, error: BaseException) -> StreamFailure:
+        return StreamFailure(self._units[self._tasks[task]], error)
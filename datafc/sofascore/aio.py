@@ -9,6 +9,9 @@ exceptions raised are identical to the sync versions.
 Rate limiting is shared globally — all concurrent coroutines respect the same
 per-second budget (default 2 req/s).
 
+Response parsing runs on the event loop unless ``set_parse_executor()`` moves
+it (and JSON decoding of large bodies) to a thread or process pool.
+
 Example::
 
     import asyncio
@@ -25,16 +28,18 @@ Example::
 
 import asyncio
 import logging
-from typing import Optional
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Sequence, Union
 from urllib.parse import quote
 
 import pandas as pd
 
 from datafc.exceptions import APIError, DataNotAvailableError, InvalidParameterError
 from datafc.sofascore._core import (
+    _interned,
     career_stats_records_for_pair,
     export_df,
-    goal_networks_post_process,
+    finish_spill,
     heatmap_records,
     iter_per_match_async,
     match_log_records_from_response,
@@ -47,6 +52,7 @@ from datafc.sofascore._core import (
     player_transfers_records_from_response,
     pregame_form_coerce_numeric,
     pregame_form_records,
+    raise_api_errors,
     referee_stats_records,
     resolve_world_cup_week_async,
     season_rounds_records,
@@ -55,17 +61,27 @@ from datafc.sofascore._core import (
     team_stats_records_from_response,
     team_transfers_records_from_response,
 )
+from datafc.sofascore._heatmap import (
+    HeatmapGrids,
+    collect_grids,
+    export_grids,
+    heatmap_grid,
+    validate_grid_params,
+)
 from datafc.sofascore._parsers import (
     parse_average_positions_records,
     parse_formations_records,
+    parse_goal_networks_records,
     parse_incidents_records,
     parse_league_player_stats_records,
     parse_lineups_records,
+    parse_lineups_wide_records,
     parse_match_details_records,
-    parse_match_events,
+    parse_match_events_records,
     parse_match_h2h_record,
     parse_match_odds_records,
     parse_match_stats_records,
+    parse_match_stats_wide_record,
     parse_momentum_records,
     parse_search_records,
     parse_seasons_records,
@@ -75,6 +91,8 @@ from datafc.sofascore._parsers import (
     parse_team_match_history_records,
     parse_upcoming_matches_records,
 )
+from datafc.sofascore._schemas import MIXED_COLUMNS, build_frame, validate_columns
+from datafc.sofascore._stream import DataStream
 from datafc.sofascore.fetch_league_player_stats_data import (
     AVAILABLE_ACCUMULATIONS,
     AVAILABLE_FIELDS,
@@ -82,11 +100,20 @@ from datafc.sofascore.fetch_league_player_stats_data import (
 )
 from datafc.sofascore.fetch_search_data import AVAILABLE_ENTITY_TYPES
 from datafc.utils._async_client import AsyncSofascoreClient
+from datafc.utils._backend import output_backend
 from datafc.utils._cache import DiskCache
+from datafc.utils._columns import ColumnBatch
 from datafc.utils._config import API_URLS, WWW_URLS
-from datafc.utils._helpers import _cast_int_cols
+from datafc.utils._executor import run_parser
+from datafc.utils._helpers import _id_or_zero
+from datafc.utils._spill import RecordSpiller, SpilledDataset
 from datafc.utils._tournament_info import resolve_tournament_season
-from datafc.utils._validate import build_tournament_url, validate_df, validate_source
+from datafc.utils._validate import (
+    build_tournament_url,
+    validate_df,
+    validate_format,
+    validate_source,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -95,6 +122,7 @@ logger = logging.getLogger(__name__)
 # Match-level (per-match iterator pattern)
 # ---------------------------------------------------------------------------
 
+@output_backend
 async def match_data(
     tournament_id: int,
     season_id: int,
@@ -107,9 +135,11 @@ async def match_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
+    columns: Optional[Sequence[str]] = None,
 ) -> pd.DataFrame:
     """Async version of match_data(). See the sync docstring for parameters."""
     validate_source(data_source)
+    columns = validate_columns(columns, "match_data")
 
     if needs_world_cup_resolution(tournament_type, tournament_stage, week_number):
         async with AsyncSofascoreClient(rate_limit=rate_limit, cache=cache) as client:
@@ -132,7 +162,8 @@ async def match_data(
             f"season_id={season_id}, week_number={week_number}."
         )
 
-    result_df = parse_match_events(events)
+    records = parse_match_events_records(events, columns)
+    result_df = build_frame(records, "match_data", columns=columns)
     export_df(
         result_df, fn_name="match_data", data_source=data_source,
         output_dir=output_dir,
@@ -145,12 +176,28 @@ async def _per_match_simple(
     match_df, data_source, rate_limit, cache, *,
     endpoint, parser, log_label, fn_name, error_msg,
     enable_json_export, enable_excel_export, output_dir,
-    extra_args_fn=None, single_record=False, catch_api_error=True,
+    extra_args_fn=None, single_record=False, catch_api_error=True, spill_dir=None,
+    compact=False, columns=None,
 ):
-    """Internal: per-match concurrent fetch + standard export tail."""
+    """Internal: per-match concurrent fetch + standard export tail.
+
+    ``columns`` is passed to the parser and the frame builder, so the parser
+    must accept a ``columns`` keyword when a projection is requested.
+    """
     validate_source(data_source)
     validate_df(match_df, "match_df")
-
+    columns = validate_columns(columns, fn_name)
+    if columns is not None:
+        parser = partial(parser, columns=columns)
+
+    spiller = (
+        RecordSpiller(
+            spill_dir, prefix=fn_name,
+            build=partial(build_frame, fn_name=fn_name, compact=compact, columns=columns),
+            json_columns=MIXED_COLUMNS.get(fn_name, ()),
+        )
+        if spill_dir else None
+    )
     async with AsyncSofascoreClient(rate_limit=rate_limit, cache=cache) as client:
         records = await iter_per_match_async(
             match_df, client,
@@ -158,9 +205,17 @@ async def _per_match_simple(
             endpoint=endpoint, parser=parser,
             extra_args_fn=extra_args_fn, single_record=single_record,
             catch_api_error=catch_api_error, log_label=log_label,
+            sink=spiller, compact=compact,
         )
 
-    df = pd.DataFrame(records)
+    if spiller is not None:
+        return finish_spill(
+            spiller, error_msg, fn_name=fn_name, data_source=data_source,
+            output_dir=output_dir,
+            enable_json_export=enable_json_export, enable_excel_export=enable_excel_export,
+        )
+
+    df = build_frame(records, fn_name, compact=compact, columns=columns)
     if df.empty:
         raise DataNotAvailableError(error_msg)
     export_df(
@@ -171,6 +226,7 @@ async def _per_match_simple(
     return df
 
 
+@output_backend
 async def match_stats_data(
     match_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -179,20 +235,27 @@ async def match_stats_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
+    compact: bool = False,
+    format: str = "long",
 ) -> pd.DataFrame:
     """Async version of match_stats_data()."""
+    validate_format(format)
+    wide = format == "wide"
     return await _per_match_simple(
         match_df, data_source, rate_limit, cache,
         endpoint="{base}/api/v1/event/{game_id}/statistics",
-        parser=parse_match_stats_records,
+        parser=parse_match_stats_wide_record if wide else parse_match_stats_records,
+        single_record=wide,
         log_label="match stats",
-        fn_name="match_stats_data",
+        fn_name="match_stats_data_wide" if wide else "match_stats_data",
         error_msg="No match statistics data found.",
         enable_json_export=enable_json_export, enable_excel_export=enable_excel_export,
         output_dir=output_dir,
+        compact=compact,
     )
 
 
+@output_backend
 async def shots_data(
     match_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -201,6 +264,7 @@ async def shots_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
+    columns: Optional[Sequence[str]] = None,
 ) -> pd.DataFrame:
     """Async version of shots_data()."""
     return await _per_match_simple(
@@ -212,9 +276,11 @@ async def shots_data(
         error_msg="No shot data found.",
         enable_json_export=enable_json_export, enable_excel_export=enable_excel_export,
         output_dir=output_dir,
+        columns=columns,
     )
 
 
+@output_backend
 async def momentum_data(
     match_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -237,6 +303,7 @@ async def momentum_data(
     )
 
 
+@output_backend
 async def formations_data(
     match_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -259,6 +326,7 @@ async def formations_data(
     )
 
 
+@output_backend
 async def lineups_data(
     match_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -267,20 +335,28 @@ async def lineups_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
-) -> pd.DataFrame:
-    """Async version of lineups_data()."""
+    spill_dir: Optional[str] = None,
+    compact: bool = False,
+    format: str = "long",
+) -> Union[pd.DataFrame, SpilledDataset]:
+    """Async version of lineups_data(). Spilled records are in completion order."""
+    validate_format(format)
+    wide = format == "wide"
     return await _per_match_simple(
         match_df, data_source, rate_limit, cache,
         endpoint="{base}/api/v1/event/{game_id}/lineups",
-        parser=parse_lineups_records,
+        parser=parse_lineups_wide_records if wide else parse_lineups_records,
         log_label="lineups",
-        fn_name="lineups_data",
+        fn_name="lineups_data_wide" if wide else "lineups_data",
         error_msg="No lineup data found.",
         enable_json_export=enable_json_export, enable_excel_export=enable_excel_export,
         output_dir=output_dir,
+        compact=compact,
+        spill_dir=spill_dir,
     )
 
 
+@output_backend
 async def substitutions_data(
     match_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -303,6 +379,7 @@ async def substitutions_data(
     )
 
 
+@output_backend
 async def incidents_data(
     match_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -311,6 +388,8 @@ async def incidents_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
+    compact: bool = False,
+    columns: Optional[Sequence[str]] = None,
 ) -> pd.DataFrame:
     """Async version of incidents_data()."""
     return await _per_match_simple(
@@ -322,9 +401,12 @@ async def incidents_data(
         error_msg="No incident data found.",
         enable_json_export=enable_json_export, enable_excel_export=enable_excel_export,
         output_dir=output_dir,
+        compact=compact,
+        columns=columns,
     )
 
 
+@output_backend
 async def match_details_data(
     match_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -335,7 +417,7 @@ async def match_details_data(
     output_dir: str = ".",
 ) -> pd.DataFrame:
     """Async version of match_details_data()."""
-    df = await _per_match_simple(
+    return await _per_match_simple(
         match_df, data_source, rate_limit, cache,
         endpoint="{base}/api/v1/event/{game_id}",
         parser=parse_match_details_records,
@@ -343,19 +425,12 @@ async def match_details_data(
         fn_name="match_details_data",
         error_msg="No match detail data found.",
         single_record=True,
-        enable_json_export=False, enable_excel_export=False,
-        output_dir=output_dir,
-    )
-    _cast_int_cols(df, "referee_id")
-    # Export after int casting.
-    export_df(
-        df, fn_name="match_details_data", data_source=data_source,
-        output_dir=output_dir,
         enable_json_export=enable_json_export, enable_excel_export=enable_excel_export,
+        output_dir=output_dir,
     )
-    return df
 
 
+@output_backend
 async def match_odds_data(
     match_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -378,6 +453,7 @@ async def match_odds_data(
     )
 
 
+@output_backend
 async def match_h2h_data(
     match_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -402,6 +478,7 @@ async def match_h2h_data(
     )
 
 
+@output_backend
 async def average_positions_data(
     match_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -425,6 +502,7 @@ async def average_positions_data(
     )
 
 
+@output_backend
 async def pregame_form_data(
     match_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -447,7 +525,7 @@ async def pregame_form_data(
             log_label="pregame form",
         )
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "pregame_form_data")
     if result_df.empty:
         raise DataNotAvailableError("No pre-game form data found for the specified matches.")
     result_df = pregame_form_coerce_numeric(result_df)
@@ -463,6 +541,7 @@ async def pregame_form_data(
 # Coordinates / Goal networks
 # ---------------------------------------------------------------------------
 
+@output_backend
 async def coordinates_data(
     lineups_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -471,10 +550,25 @@ async def coordinates_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
-) -> pd.DataFrame:
-    """Async version of coordinates_data(). Players with no heatmap data are silently skipped."""
+    spill_dir: Optional[str] = None,
+    compact: bool = False,
+    bins: Optional[Union[int, Sequence[int]]] = None,
+    per: str = "match",
+    enable_npz_export: bool = False,
+) -> Union[pd.DataFrame, SpilledDataset, HeatmapGrids]:
+    """Async version of coordinates_data(). Players with no heatmap data are silently skipped.
+
+    Spilled records are in completion order; grids are in row order.
+    """
     validate_source(data_source)
     validate_df(lineups_df, "lineups_df")
+    grid_bins = validate_grid_params(bins, per)
+    if grid_bins is not None:
+        if spill_dir or enable_json_export or enable_excel_export:
+            raise InvalidParameterError(
+                "bins returns heatmap grids; use enable_npz_export rather than "
+                "spill_dir or JSON/Excel export."
+            )
 
     unique_players = lineups_df[[
         "country", "tournament", "season", "week", "game_id", "team", "player_id", "player_name"
@@ -494,13 +588,45 @@ async def coordinates_data(
                 if exc.status_code in (404, 403):
                     return []
                 raise
-        return heatmap_records(data, row)
+        if grid_bins is not None:
+            return await run_parser(heatmap_grid, data, row, grid_bins)
+        records = await run_parser(heatmap_records, data, row)
+        if compact:
+            records = _interned(records)
+        if spiller is not None:
+            spiller.extend(records)
+            return []
+        return records
 
+    spiller = (
+        RecordSpiller(
+            spill_dir, prefix="coordinates_data",
+            build=partial(build_frame, fn_name="coordinates_data", compact=compact),
+        )
+        if spill_dir else None
+    )
     async with AsyncSofascoreClient(rate_limit=rate_limit, cache=cache) as client:
         batches = await asyncio.gather(*[_fetch(client, row) for _, row in unique_players.iterrows()])
 
-    heatmap_data = [rec for batch in batches for rec in batch]
-    result_df = pd.DataFrame(heatmap_data)
+    if grid_bins is not None:
+        grids = collect_grids(batches, grid_bins, per)
+        if enable_npz_export:
+            export_grids(grids, data_source, output_dir, lineups_df.iloc[0])
+        return grids
+
+    if spiller is not None:
+        return finish_spill(
+            spiller, "No heatmap data found for the specified players.",
+            fn_name="coordinates_data", data_source=data_source,
+            output_dir=output_dir,
+            first_row=lineups_df.iloc[0],
+            enable_json_export=enable_json_export, enable_excel_export=enable_excel_export,
+        )
+
+    heatmap_data = ColumnBatch()
+    for batch in batches:
+        heatmap_data.extend(batch)
+    result_df = build_frame(heatmap_data, "coordinates_data", compact=compact)
     if result_df.empty:
         raise DataNotAvailableError("No heatmap data found for the specified players.")
 
@@ -513,6 +639,7 @@ async def coordinates_data(
     return result_df
 
 
+@output_backend
 async def goal_networks_data(
     match_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -523,47 +650,24 @@ async def goal_networks_data(
     output_dir: str = ".",
 ) -> pd.DataFrame:
     """Async version of goal_networks_data()."""
-    validate_source(data_source)
-    validate_df(match_df, "match_df")
-    base = API_URLS[data_source]
-
-    async def _fetch(client, row):
-        country, tournament, season, week, game_id = row[
-            ["country", "tournament", "season", "week", "game_id"]
-        ]
-        data = await client.get(f"{base}/api/v1/event/{game_id}/incidents")
-        incidents = data.get("incidents", [])
-        if not isinstance(incidents, list) or not incidents:
-            return None
-        frame = pd.DataFrame(incidents)
-        frame["country"] = country
-        frame["tournament"] = tournament
-        frame["season"] = season
-        frame["week"] = week
-        frame["game_id"] = game_id
-        return frame
-
-    async with AsyncSofascoreClient(rate_limit=rate_limit, cache=cache) as client:
-        frames = await asyncio.gather(*[_fetch(client, row) for _, row in match_df.iterrows()])
-
-    incidents_frames = [f for f in frames if f is not None]
-    if not incidents_frames:
-        raise DataNotAvailableError("No goal network data found for the specified parameters.")
-    incidents_df = pd.concat(incidents_frames, ignore_index=True)
-    result_df = goal_networks_post_process(incidents_df)
-
-    export_df(
-        result_df, fn_name="goal_networks_data", data_source=data_source,
-        output_dir=output_dir,
+    return await _per_match_simple(
+        match_df, data_source, rate_limit, cache,
+        endpoint="{base}/api/v1/event/{game_id}/incidents",
+        parser=parse_goal_networks_records,
+        log_label="goal networks",
+        fn_name="goal_networks_data",
+        error_msg="No goal network data found for the specified parameters.",
         enable_json_export=enable_json_export, enable_excel_export=enable_excel_export,
+        output_dir=output_dir,
+        catch_api_error=False,
     )
-    return result_df
 
 
 # ---------------------------------------------------------------------------
 # past_matches: two-stage (round events + parallel h2h)
 # ---------------------------------------------------------------------------
 
+@output_backend
 async def past_matches_data(
     tournament_id: int,
     season_id: int,
@@ -626,7 +730,7 @@ async def past_matches_data(
             f"No H2H match data found for tournament_id={tournament_id}, "
             f"season_id={season_id}, week_number={week_number}."
         )
-    result_df = pd.DataFrame(all_matches)
+    result_df = build_frame(all_matches, "past_matches_data")
     export_df(
         result_df, fn_name="past_matches_data", data_source=data_source,
         output_dir=output_dir,
@@ -641,6 +745,7 @@ async def past_matches_data(
 # Standings, seasons, search, season_rounds, league_player_stats
 # ---------------------------------------------------------------------------
 
+@output_backend
 async def standings_data(
     tournament_id: int,
     season_id: int,
@@ -670,7 +775,7 @@ async def standings_data(
         batches = await asyncio.gather(*[_fetch(client, c) for c in ("total", "home", "away")])
 
     rows = [r for batch in batches for r in batch]
-    df = pd.DataFrame(rows)
+    df = build_frame(rows, "standings_data")
     if df.empty:
         raise DataNotAvailableError("No standings data found.")
 
@@ -690,6 +795,7 @@ async def standings_data(
     return df
 
 
+@output_backend
 async def seasons_data(
     tournament_id: int,
     data_source: str = "sofascore",
@@ -719,7 +825,7 @@ async def seasons_data(
     seasons = data.get("seasons", [])
     if not seasons:
         raise DataNotAvailableError(f"No seasons found for tournament_id={tournament_id}.")
-    result_df = pd.DataFrame(parse_seasons_records(data, tournament_id))
+    result_df = build_frame(parse_seasons_records(data, tournament_id), "seasons_data")
 
     export_df(
         result_df, fn_name="seasons_data", data_source=data_source,
@@ -731,6 +837,7 @@ async def seasons_data(
     return result_df
 
 
+@output_backend
 async def search_data(
     query: str,
     entity_type: Optional[str] = None,
@@ -759,7 +866,7 @@ async def search_data(
     if not results:
         raise DataNotAvailableError(f"No results found for query='{query}'.")
     records = parse_search_records(results, entity_type)
-    df = pd.DataFrame(records)
+    df = build_frame(records, "search_data")
     if df.empty:
         raise DataNotAvailableError(
             f"No results found for query='{query}'"
@@ -778,6 +885,7 @@ async def search_data(
     return result_df
 
 
+@output_backend
 async def season_rounds_data(
     tournament_id: int,
     season_id: int,
@@ -801,7 +909,9 @@ async def season_rounds_data(
         raise DataNotAvailableError(
             f"No round data found for tournament_id={tournament_id}, season_id={season_id}."
         )
-    result_df = pd.DataFrame(season_rounds_records(rounds, tournament_id, season_id))
+    result_df = build_frame(
+        season_rounds_records(rounds, tournament_id, season_id), "season_rounds_data",
+    )
 
     if enable_json_export or enable_excel_export:
         country, tournament_name, season_year = resolve_tournament_season(
@@ -817,6 +927,7 @@ async def season_rounds_data(
     return result_df
 
 
+@output_backend
 async def league_player_stats_data(
     tournament_id: int,
     season_id: int,
@@ -890,7 +1001,7 @@ async def league_player_stats_data(
         raise DataNotAvailableError(
             f"No player stats found for tournament_id={tournament_id}, season_id={season_id}."
         )
-    result_df = pd.DataFrame(records).head(max_players)
+    result_df = build_frame(records, "league_player_stats_data").head(max_players)
 
     if enable_json_export or enable_excel_export:
         country, tournament, season = resolve_tournament_season(
@@ -929,8 +1040,10 @@ async def _per_team_concurrent(
         team_name = row["team_name"]
         try:
             data = await client.get(url_for_team(row, base))
-            return parser(data, row), None
+            return await run_parser(parser, data, row), None
         except APIError as exc:
+            if raise_api_errors.get():
+                raise
             logger.warning(
                 "Failed to fetch %s for team_id=%s (%s): %s",
                 log_label, team_id, team_name, exc,
@@ -948,6 +1061,7 @@ async def _per_team_concurrent(
     return records, failed
 
 
+@output_backend
 async def squad_data(
     standings_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -970,14 +1084,14 @@ async def squad_data(
     if failed_teams:
         logger.warning("Could not retrieve squad for %d team(s): %s",
                        len(failed_teams), failed_teams)
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "squad_data")
     if result_df.empty:
         raise DataNotAvailableError("No squad data found for the specified teams.")
 
     if enable_json_export or enable_excel_export:
         first = standings_df.iloc[0]
-        t_id = int(first.get("tournament_id") or 0)
-        s_id = int(first.get("season_id") or 0)
+        t_id = _id_or_zero(first.get("tournament_id"))
+        s_id = _id_or_zero(first.get("season_id"))
         _, _, season_year = resolve_tournament_season(
             t_id, s_id, data_source=data_source, rate_limit=rate_limit
         ) if t_id and s_id else ("", "", None)
@@ -991,6 +1105,7 @@ async def squad_data(
     return result_df
 
 
+@output_backend
 async def player_stats_data(
     standings_df: pd.DataFrame,
     tournament_id: int,
@@ -1023,7 +1138,7 @@ async def player_stats_data(
     if failed_teams:
         logger.warning("Could not retrieve player stats for %d team(s): %s",
                        len(failed_teams), failed_teams)
-    result_df = pd.DataFrame(records).drop_duplicates(
+    result_df = build_frame(records, "player_stats_data").drop_duplicates(
         subset=["team_id", "player_id", "stat_name"]
     )
     if result_df.empty:
@@ -1045,6 +1160,7 @@ async def player_stats_data(
     return result_df
 
 
+@output_backend
 async def team_stats_data(
     standings_df: pd.DataFrame,
     tournament_id: int,
@@ -1082,7 +1198,7 @@ async def team_stats_data(
     if failed_teams:
         logger.warning("Could not retrieve stats for %d team(s): %s",
                        len(failed_teams), failed_teams)
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "team_stats_data")
     if result_df.empty:
         raise DataNotAvailableError("No team statistics data found for the specified teams.")
 
@@ -1105,6 +1221,7 @@ async def team_stats_data(
     return result_df
 
 
+@output_backend
 async def team_transfers_data(
     standings_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -1127,10 +1244,9 @@ async def team_transfers_data(
     if failed:
         logger.warning("Could not retrieve transfers for %d team(s): %s", len(failed), failed)
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "team_transfers_data")
     if result_df.empty:
         raise DataNotAvailableError("No transfer data found for the specified teams.")
-    _cast_int_cols(result_df, "from_team_id", "to_team_id")
 
     if enable_json_export or enable_excel_export:
         first = standings_df.iloc[0]
@@ -1144,6 +1260,7 @@ async def team_transfers_data(
     return result_df
 
 
+@output_backend
 async def team_data(
     standings_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -1170,6 +1287,8 @@ async def team_data(
                 return None, team_id
             return rec, None
         except APIError as exc:
+            if raise_api_errors.get():
+                raise
             logger.warning(
                 "Failed to fetch profile for team_id=%s (%s): %s",
                 team_id, team_name, exc,
@@ -1188,14 +1307,14 @@ async def team_data(
     if failed:
         logger.warning("Could not retrieve profile for %d team(s): %s", len(failed), failed)
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "team_data")
     if result_df.empty:
         raise DataNotAvailableError("No team profile data found for the specified teams.")
 
     if enable_json_export or enable_excel_export:
         first = standings_df.iloc[0]
-        t_id = int(first.get("tournament_id") or 0)
-        s_id = int(first.get("season_id") or 0)
+        t_id = _id_or_zero(first.get("tournament_id"))
+        s_id = _id_or_zero(first.get("season_id"))
         _, _, season_year = resolve_tournament_season(
             t_id, s_id, data_source=data_source, rate_limit=rate_limit
         ) if t_id and s_id else ("", "", None)
@@ -1231,8 +1350,10 @@ async def _per_player_concurrent(
     async def _fetch(client, player_id, player_name):
         try:
             data = await client.get(url_for_player(player_id, base))
-            return parser(data, player_id, player_name), None
+            return await run_parser(parser, data, player_id, player_name), None
         except APIError as exc:
+            if raise_api_errors.get():
+                raise
             logger.warning(
                 "Failed to fetch %s for player_id=%s (%s): %s",
                 log_label, player_id, player_name, exc,
@@ -1253,6 +1374,7 @@ async def _per_player_concurrent(
     return records, failed
 
 
+@output_backend
 async def player_transfers_data(
     squad_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -1275,15 +1397,14 @@ async def player_transfers_data(
     if failed:
         logger.warning("Could not retrieve transfers for %d player(s): %s", len(failed), failed)
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "player_transfers_data")
     if result_df.empty:
         raise DataNotAvailableError("No transfer data found for the specified players.")
-    _cast_int_cols(result_df, "from_team_id", "to_team_id")
 
     if enable_json_export or enable_excel_export:
         first = squad_df.iloc[0]
-        t_id = int(first.get("tournament_id") or 0)
-        s_id = int(first.get("season_id") or 0)
+        t_id = _id_or_zero(first.get("tournament_id"))
+        s_id = _id_or_zero(first.get("season_id"))
         _, _, season_year = resolve_tournament_season(
             t_id, s_id, data_source=data_source, rate_limit=rate_limit
         ) if t_id and s_id else ("", "", None)
@@ -1298,6 +1419,7 @@ async def player_transfers_data(
     return result_df
 
 
+@output_backend
 async def player_national_team_data(
     squad_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -1318,7 +1440,7 @@ async def player_national_team_data(
         log_label="national team stats",
     )
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "player_national_team_data")
     if result_df.empty:
         raise DataNotAvailableError("No national team data found for the specified players.")
 
@@ -1335,6 +1457,7 @@ async def player_national_team_data(
     return result_df
 
 
+@output_backend
 async def player_attribute_overviews_data(
     squad_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -1355,7 +1478,7 @@ async def player_attribute_overviews_data(
         log_label="attribute overviews",
     )
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "player_attribute_overviews_data")
     if result_df.empty:
         raise DataNotAvailableError(
             "No attribute overview data found for the specified players."
@@ -1374,6 +1497,7 @@ async def player_attribute_overviews_data(
     return result_df
 
 
+@output_backend
 async def player_data(
     squad_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -1398,14 +1522,14 @@ async def player_data(
         log_label="profile",
     )
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "player_data")
     if result_df.empty:
         raise DataNotAvailableError("No player profile data found for the specified players.")
 
     if enable_json_export or enable_excel_export:
         first = squad_df.iloc[0]
-        t_id = int(first.get("tournament_id") or 0)
-        s_id = int(first.get("season_id") or 0)
+        t_id = _id_or_zero(first.get("tournament_id"))
+        s_id = _id_or_zero(first.get("season_id"))
         _, _, season_year = resolve_tournament_season(
             t_id, s_id, data_source=data_source, rate_limit=rate_limit
         ) if t_id and s_id else ("", "", None)
@@ -1420,6 +1544,7 @@ async def player_data(
     return result_df
 
 
+@output_backend
 async def player_match_log_data(
     squad_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -1442,6 +1567,8 @@ async def player_match_log_data(
             try:
                 data = await client.get(url)
             except APIError as exc:
+                if raise_api_errors.get():
+                    raise
                 logger.warning(
                     "Failed to fetch match log for player_id=%s (%s): %s",
                     player_id, player_name, exc,
@@ -1461,7 +1588,7 @@ async def player_match_log_data(
         ])
 
     records = [rec for batch in batches for rec in batch]
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "player_match_log_data")
     if result_df.empty:
         raise DataNotAvailableError("No match log data found for the specified players.")
 
@@ -1479,6 +1606,7 @@ async def player_match_log_data(
     return result_df
 
 
+@output_backend
 async def player_career_stats_data(
     squad_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -1499,6 +1627,8 @@ async def player_career_stats_data(
                 f"{base}/api/v1/player/{player_id}/statistics/seasons"
             )
         except APIError as exc:
+            if raise_api_errors.get():
+                raise
             logger.warning(
                 "Failed to fetch career stats for player_id=%s (%s): %s",
                 player_id, player_name, exc,
@@ -1538,10 +1668,9 @@ async def player_career_stats_data(
     if failed:
         logger.warning("Could not retrieve career stats for %d player(s): %s", len(failed), failed)
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "player_career_stats_data")
     if result_df.empty:
         raise DataNotAvailableError("No career stats data found for the specified players.")
-    _cast_int_cols(result_df, "team_id")
 
     if enable_json_export or enable_excel_export:
         first = squad_df.iloc[0]
@@ -1560,6 +1689,7 @@ async def player_career_stats_data(
 # Upcoming matches / team match history / referee
 # ---------------------------------------------------------------------------
 
+@output_backend
 async def upcoming_matches_data(
     standings_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -1601,15 +1731,15 @@ async def upcoming_matches_data(
         for data in team_pages:
             records.extend(parse_upcoming_matches_records(data, seen_game_ids))
 
-    df = pd.DataFrame(records)
+    df = build_frame(records, "upcoming_matches_data")
     if df.empty:
         raise DataNotAvailableError("No upcoming match data found for the specified teams.")
     result_df = df.sort_values("start_timestamp").reset_index(drop=True)
 
     if enable_json_export or enable_excel_export:
         first = standings_df.iloc[0]
-        t_id = int(first.get("tournament_id") or 0)
-        s_id = int(first.get("season_id") or 0)
+        t_id = _id_or_zero(first.get("tournament_id"))
+        s_id = _id_or_zero(first.get("season_id"))
         _, _, season_year = resolve_tournament_season(
             t_id, s_id, data_source=data_source, rate_limit=rate_limit
         ) if t_id and s_id else ("", "", None)
@@ -1624,6 +1754,7 @@ async def upcoming_matches_data(
     return result_df
 
 
+@output_backend
 async def team_match_history_data(
     team_id: int,
     data_source: str = "sofascore",
@@ -1656,22 +1787,12 @@ async def team_match_history_data(
                 break
             page += 1
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "team_match_history_data")
     if result_df.empty:
         raise DataNotAvailableError(
             f"No historical match data found for team_id={team_id}."
         )
     result_df = result_df.sort_values("start_timestamp").reset_index(drop=True)
-    result_df = _cast_int_cols(
-        result_df,
-        "week",
-        "home_team_id", "away_team_id",
-        "home_score_period1", "home_score_period2", "home_score_normaltime",
-        "home_score_display", "home_score_current",
-        "away_score_period1", "away_score_period2", "away_score_normaltime",
-        "away_score_display", "away_score_current",
-        "start_timestamp",
-    )
 
     if enable_json_export or enable_excel_export:
         first = result_df.iloc[0]
@@ -1686,6 +1807,7 @@ async def team_match_history_data(
     return result_df
 
 
+@output_backend
 async def referee_stats_data(
     referee_id: int,
     data_source: str = "sofascore",
@@ -1713,7 +1835,9 @@ async def referee_stats_data(
     if not statistics:
         raise DataNotAvailableError(f"No statistics found for referee_id={referee_id}.")
 
-    result_df = pd.DataFrame(referee_stats_records(statistics, referee_id, referee_name))
+    result_df = build_frame(
+        referee_stats_records(statistics, referee_id, referee_name), "referee_stats_data",
+    )
     if result_df.empty:
         raise DataNotAvailableError(f"No statistics found for referee_id={referee_id}.")
 
@@ -1724,3 +1848,87 @@ async def referee_stats_data(
         enable_json_export=enable_json_export, enable_excel_export=enable_excel_export,
     )
     return result_df
+
+
+# ---------------------------------------------------------------------------
+# Streaming
+# ---------------------------------------------------------------------------
+
+async def iter_data(
+    fn: Callable[..., Awaitable[pd.DataFrame]],
+    df: pd.DataFrame,
+    *args: Any,
+    concurrency: int = 8,
+    **kwargs: Any,
+) -> AsyncIterator[pd.DataFrame]:
+    """
+    Async version of iter_data(): yield one DataFrame per fetch unit of ``df``
+    (match, player or team; see ``_stream.FETCH_UNITS``) in completion order.
+
+    Up to ``concurrency`` units are in flight at once (the global rate limit
+    still applies); each unit's DataFrame is yielded as soon as it is parsed. All
+    calls share one HTTP session. Units raising ``DataNotAvailableError`` are
+    skipped; any other exception stops the iteration and cancels the remaining
+    units. Use the ``stream_*`` functions for deadlines and partial results.
+
+    Example::
+
+        async for game_df in aio.iter_data(aio.shots_data, match_df):
+            writer.write(game_df)
+    """
+    stream = DataStream(fn, df, args, kwargs, concurrency=concurrency, capture_errors=False)
+    async for frame in stream:
+        yield frame
+
+
+def _streaming(fn: Callable[..., Awaitable[Any]]) -> Callable[..., DataStream]:
+    """Build the ``stream_<name>`` counterpart of a row-driven aio function."""
+
+    def stream(
+        df: pd.DataFrame,
+        *args: Any,
+        deadline: Optional[float] = None,
+        concurrency: int = 8,
+        **kwargs: Any,
+    ) -> DataStream:
+        return DataStream(fn, df, args, kwargs, concurrency=concurrency, deadline=deadline)
+
+    stream.__name__ = stream.__qualname__ = f"stream_{fn.__name__}"
+    stream.__doc__ = (
+        f"Streaming version of {fn.__name__}(). Returns a DataStream yielding one "
+        "DataFrame per fetch unit (match, player or team) of the input in completion "
+        "order; ``deadline`` (seconds) bounds the run and ``await stream.collect()`` "
+        "returns partial results plus failures."
+    )
+    return stream
+
+
+# Match-level
+stream_match_stats_data = _streaming(match_stats_data)
+stream_match_odds_data = _streaming(match_odds_data)
+stream_match_h2h_data = _streaming(match_h2h_data)
+stream_momentum_data = _streaming(momentum_data)
+stream_substitutions_data = _streaming(substitutions_data)
+stream_incidents_data = _streaming(incidents_data)
+stream_match_details_data = _streaming(match_details_data)
+stream_formations_data = _streaming(formations_data)
+stream_goal_networks_data = _streaming(goal_networks_data)
+stream_shots_data = _streaming(shots_data)
+stream_average_positions_data = _streaming(average_positions_data)
+stream_pregame_form_data = _streaming(pregame_form_data)
+stream_lineups_data = _streaming(lineups_data)
+# Player-level
+stream_coordinates_data = _streaming(coordinates_data)
+stream_player_career_stats_data = _streaming(player_career_stats_data)
+stream_player_transfers_data = _streaming(player_transfers_data)
+stream_player_match_log_data = _streaming(player_match_log_data)
+stream_player_national_team_data = _streaming(player_national_team_data)
+stream_player_data = _streaming(player_data)
+stream_player_attribute_overviews_data = _streaming(player_attribute_overviews_data)
+# Team-level
+stream_team_stats_data = _streaming(team_stats_data)
+stream_player_stats_data = _streaming(player_stats_data)
+stream_squad_data = _streaming(squad_data)
+stream_team_transfers_data = _streaming(team_transfers_data)
+stream_team_data = _streaming(team_data)
+stream_upcoming_matches_data = _streaming(upcoming_matches_data)
@@ -1,15 +1,29 @@
-from typing import TYPE_CHECKING, Optional
+from functools import partial
+from typing import TYPE_CHECKING, Optional, Sequence, Union
 import pandas as pd
 from datafc.utils._client import SofascoreClient
 from datafc.utils._config import API_URLS
 from datafc.utils._validate import validate_source, validate_df
-from datafc.sofascore._core import heatmap_records, export_df
+from datafc.utils._columns import ColumnBatch
+from datafc.utils._spill import RecordSpiller
+from datafc.utils._backend import output_backend
+from datafc.sofascore._core import (
+    _interned, heatmap_records, export_df, finish_spill, imap_rows_sync,
+)
+from datafc.sofascore._schemas import build_frame
+from datafc.sofascore._heatmap import (
+    HeatmapGrids, collect_grids, export_grids, heatmap_grid, validate_grid_params,
+)
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import APIError, DataNotAvailableError, InvalidParameterError
 
 if TYPE_CHECKING:
     from datafc.utils._cache import DiskCache
+    from datafc.utils._spill import SpilledDataset
 
 
+@sync_engine_dispatch
+@output_backend
 def coordinates_data(
     lineups_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -18,13 +32,41 @@ def coordinates_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
-) -> pd.DataFrame:
+    max_workers: int = 1,
+    spill_dir: Optional[str] = None,
+    compact: bool = False,
+    bins: Optional[Union[int, Sequence[int]]] = None,
+    per: str = "match",
+    enable_npz_export: bool = False,
+) -> Union[pd.DataFrame, "SpilledDataset", HeatmapGrids]:
     """Fetches heatmap coordinate data for each player in the provided lineup dataset.
 
     Players with no heatmap data (404/403) are silently skipped.
+
+    With ``spill_dir`` set, records are written to Parquet chunks under that
+    directory as they arrive and a lazily loaded ``SpilledDataset`` is returned
+    instead of a DataFrame, so memory stays bounded on league-scale crawls
+    (requires pyarrow).
+
+    With ``compact=True``, repeated strings are interned as records arrive and
+    every repeated string column (such as ``player_name``) is returned as a
+    categorical.
+
+    With ``bins`` set (``nx`` or ``(nx, ny)``), each player's points are
+    histogrammed into a count grid as they arrive and a ``HeatmapGrids`` is
+    returned instead: one grid per player-match, or per player-season with
+    ``per="season"``. ``enable_npz_export`` saves it as an ``.npz`` file;
+    JSON/Excel export and ``spill_dir`` apply to point rows only.
     """
     validate_source(data_source)
     validate_df(lineups_df, "lineups_df")
+    grid_bins = validate_grid_params(bins, per)
+    if grid_bins is not None:
+        if spill_dir or enable_json_export or enable_excel_export:
+            raise InvalidParameterError(
+                "bins returns heatmap grids; use enable_npz_export rather than "
+                "spill_dir or JSON/Excel export."
+            )
 
     unique_players = lineups_df[[
         "country", "tournament", "season", "week", "game_id", "team", "player_id", "player_name"
@@ -33,22 +75,52 @@ def coordinates_data(
     if unique_players.empty:
         raise InvalidParameterError("No unique players found in lineups_df.")
 
-    heatmap_data = []
+    def fetch_player(client, row: pd.Series):
+        url = (
+            f"{API_URLS[data_source]}/api/v1/event/{row['game_id']}"
+            f"/player/{row['player_id']}/heatmap"
+        )
+        try:
+            data = client.get(url)
+        except APIError as exc:
+            if exc.status_code in (404, 403):
+                return []
+            raise
+        if grid_bins is not None:
+            return heatmap_grid(data, row, grid_bins)
+        return heatmap_records(data, row)
+
+    if grid_bins is not None:
+        with SofascoreClient(rate_limit=rate_limit, cache=cache) as client:
+            results = list(imap_rows_sync(unique_players, client, fetch_player, max_workers=max_workers))
+        grids = collect_grids(results, grid_bins, per)
+        if enable_npz_export:
+            export_grids(grids, data_source, output_dir, lineups_df.iloc[0])
+        return grids
+
+    spiller = (
+        RecordSpiller(
+            spill_dir, prefix="coordinates_data",
+            build=partial(build_frame, fn_name="coordinates_data", compact=compact),
+        )
+        if spill_dir else None
+    )
+    heatmap_data = ColumnBatch()
+    out = heatmap_data if spiller is None else spiller
     with SofascoreClient(rate_limit=rate_limit, cache=cache) as client:
-        for _, row in unique_players.iterrows():
-            url = (
-                f"{API_URLS[data_source]}/api/v1/event/{row['game_id']}"
-                f"/player/{row['player_id']}/heatmap"
-            )
-            try:
-                data = client.get(url)
-            except APIError as exc:
-                if exc.status_code in (404, 403):
-                    continue
-                raise
-            heatmap_data.extend(heatmap_records(data, row))
-
-    result_df = pd.DataFrame(heatmap_data)
+        for result in imap_rows_sync(unique_players, client, fetch_player, max_workers=max_workers):
+            out.extend(_interned(result) if compact else result)
+
+    if spiller is not None:
+        return finish_spill(
+            spiller, "No heatmap data found for the specified players.",
+            fn_name="coordinates_data", data_source=data_source,
+            output_dir=output_dir,
+            first_row=lineups_df.iloc[0],
+            enable_json_export=enable_json_export, enable_excel_export=enable_excel_export,
+        )
+
+    result_df = build_frame(heatmap_data, "coordinates_data", compact=compact)
     if result_df.empty:
         raise DataNotAvailableError("No heatmap data found for the specified players.")
 
@@ -59,3 +131,4 @@ def coordinates_data(
         enable_json_export=enable_json_export, enable_excel_export=enable_excel_export,
     )
     return result_df
+
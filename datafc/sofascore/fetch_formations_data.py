@@ -2,14 +2,19 @@ from typing import TYPE_CHECKING, Optional
 import pandas as pd
 from datafc.utils._client import SofascoreClient
 from datafc.utils._validate import validate_source, validate_df
+from datafc.utils._backend import output_backend
 from datafc.sofascore._parsers import parse_formations_records
 from datafc.sofascore._core import iter_per_match_sync, export_df
+from datafc.sofascore._schemas import build_frame
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import DataNotAvailableError
 
 if TYPE_CHECKING:
     from datafc.utils._cache import DiskCache
 
 
+@sync_engine_dispatch
+@output_backend
 def formations_data(
     match_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -18,6 +23,8 @@ def formations_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
+    max_workers: int = 1,
+    processes: int = 1,
 ) -> pd.DataFrame:
     """Fetches home and away formation for each match. Two rows per match."""
     validate_source(data_source)
@@ -30,9 +37,11 @@ def formations_data(
             endpoint="{base}/api/v1/event/{game_id}/lineups",
             parser=parse_formations_records,
             log_label="formations",
+            max_workers=max_workers,
+            processes=processes,
         )
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "formations_data")
     if result_df.empty:
         raise DataNotAvailableError("No formation data found for the specified parameters.")
 
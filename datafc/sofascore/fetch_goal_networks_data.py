@@ -1,18 +1,20 @@
-import logging
 from typing import TYPE_CHECKING, Optional
 import pandas as pd
 from datafc.utils._client import SofascoreClient
-from datafc.utils._config import API_URLS
 from datafc.utils._validate import validate_source, validate_df
-from datafc.sofascore._core import goal_networks_post_process, export_df
-from datafc.exceptions import APIError, DataNotAvailableError
+from datafc.utils._backend import output_backend
+from datafc.sofascore._parsers import parse_goal_networks_records
+from datafc.sofascore._core import iter_per_match_sync, export_df
+from datafc.sofascore._schemas import build_frame
+from datafc.sofascore._bridge import sync_engine_dispatch
+from datafc.exceptions import DataNotAvailableError
 
 if TYPE_CHECKING:
     from datafc.utils._cache import DiskCache
 
-logger = logging.getLogger(__name__)
-
 
+@sync_engine_dispatch
+@output_backend
 def goal_networks_data(
     match_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -21,38 +23,32 @@ def goal_networks_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
+    max_workers: int = 1,
+    processes: int = 1,
 ) -> pd.DataFrame:
-    """Fetches goal network (passing network) data for each match."""
+    """Fetches goal network (passing network) data for each match.
+
+    One row per passing-network action of every goal, flattened straight from
+    each match's incidents response.
+    """
     validate_source(data_source)
     validate_df(match_df, "match_df")
 
-    incidents_frames = []
     with SofascoreClient(rate_limit=rate_limit, cache=cache) as client:
-        for _, row in match_df.iterrows():
-            country, tournament, season, week, game_id = row[
-                ["country", "tournament", "season", "week", "game_id"]
-            ]
-            try:
-                data = client.get(f"{API_URLS[data_source]}/api/v1/event/{game_id}/incidents")
-            except APIError as exc:
-                logger.warning("Failed to fetch goal networks for game_id=%s: %s", game_id, exc)
-                continue
-            incidents = data.get("incidents", [])
-            if isinstance(incidents, list) and incidents:
-                frame = pd.DataFrame(incidents)
-                frame["country"] = country
-                frame["tournament"] = tournament
-                frame["season"] = season
-                frame["week"] = week
-                frame["game_id"] = game_id
-                incidents_frames.append(frame)
-
-    if not incidents_frames:
+        records = iter_per_match_sync(
+            match_df, client,
+            data_source=data_source,
+            endpoint="{base}/api/v1/event/{game_id}/incidents",
+            parser=parse_goal_networks_records,
+            log_label="goal networks",
+            max_workers=max_workers,
+            processes=processes,
+        )
+
+    result_df = build_frame(records, "goal_networks_data")
+    if result_df.empty:
         raise DataNotAvailableError("No goal network data found for the specified parameters.")
 
-    incidents_df = pd.concat(incidents_frames, ignore_index=True)
-    result_df = goal_networks_post_process(incidents_df)
-
     export_df(
         result_df, fn_name="goal_networks_data", data_source=data_source,
         output_dir=output_dir,
@@ -1,15 +1,21 @@
-from typing import TYPE_CHECKING, Optional
+from functools import partial
+from typing import TYPE_CHECKING, Optional, Sequence
 import pandas as pd
 from datafc.utils._client import SofascoreClient
 from datafc.utils._validate import validate_source, validate_df
+from datafc.utils._backend import output_backend
 from datafc.sofascore._parsers import parse_incidents_records
 from datafc.sofascore._core import iter_per_match_sync, export_df
+from datafc.sofascore._schemas import build_frame, validate_columns
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import DataNotAvailableError
 
 if TYPE_CHECKING:
     from datafc.utils._cache import DiskCache
 
 
+@sync_engine_dispatch
+@output_backend
 def incidents_data(
     match_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -18,21 +24,33 @@ def incidents_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
+    max_workers: int = 1,
+    processes: int = 1,
+    compact: bool = False,
+    columns: Optional[Sequence[str]] = None,
 ) -> pd.DataFrame:
-    """Fetches goal, card and VAR decision events for each match."""
+    """Fetches goal, card and VAR decision events for each match.
+
+    With ``compact=True``, repeated string columns are returned as categoricals.
+    With ``columns``, only those output columns are extracted, in that order.
+    """
     validate_source(data_source)
     validate_df(match_df, "match_df")
+    columns = validate_columns(columns, "incidents_data")
 
     with SofascoreClient(rate_limit=rate_limit, cache=cache) as client:
         records = iter_per_match_sync(
             match_df, client,
             data_source=data_source,
             endpoint="{base}/api/v1/event/{game_id}/incidents",
-            parser=parse_incidents_records,
+            parser=partial(parse_incidents_records, columns=columns),
             log_label="incidents",
+            max_workers=max_workers,
+            processes=processes,
+            compact=compact,
         )
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "incidents_data", compact=compact, columns=columns)
     if result_df.empty:
         raise DataNotAvailableError("No incident data found for the specified parameters.")
 
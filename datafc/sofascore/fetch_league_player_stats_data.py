@@ -4,8 +4,11 @@ from datafc.utils._client import SofascoreClient
 from datafc.utils._config import API_URLS
 from datafc.utils._validate import validate_source
 from datafc.utils._tournament_info import resolve_tournament_season
+from datafc.utils._backend import output_backend
 from datafc.sofascore._parsers import parse_league_player_stats_records
 from datafc.sofascore._core import export_df
+from datafc.sofascore._schemas import build_frame
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import InvalidParameterError, DataNotAvailableError
 
 if TYPE_CHECKING:
@@ -73,6 +76,8 @@ def _build_lps_url(base, tournament_id, season_id, page_size, order, accumulatio
     return url
 
 
+@sync_engine_dispatch
+@output_backend
 def league_player_stats_data(
     tournament_id: int,
     season_id: int,
@@ -120,7 +125,7 @@ def league_player_stats_data(
             f"No player stats found for tournament_id={tournament_id}, season_id={season_id}."
         )
 
-    result_df = pd.DataFrame(records).head(max_players)
+    result_df = build_frame(records, "league_player_stats_data").head(max_players)
 
     if enable_json_export or enable_excel_export:
         country, tournament, season = resolve_tournament_season(
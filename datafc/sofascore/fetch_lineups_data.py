@@ -1,15 +1,23 @@
-from typing import TYPE_CHECKING, Optional
+from functools import partial
+from typing import TYPE_CHECKING, Optional, Union
 import pandas as pd
 from datafc.utils._client import SofascoreClient
-from datafc.utils._validate import validate_source, validate_df
-from datafc.sofascore._parsers import parse_lineups_records
-from datafc.sofascore._core import iter_per_match_sync, export_df
+from datafc.utils._validate import validate_source, validate_df, validate_format
+from datafc.utils._spill import RecordSpiller
+from datafc.utils._backend import output_backend
+from datafc.sofascore._parsers import parse_lineups_records, parse_lineups_wide_records
+from datafc.sofascore._core import iter_per_match_sync, export_df, finish_spill
+from datafc.sofascore._schemas import MIXED_COLUMNS, build_frame
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import DataNotAvailableError
 
 if TYPE_CHECKING:
     from datafc.utils._cache import DiskCache
+    from datafc.utils._spill import SpilledDataset
 
 
+@sync_engine_dispatch
+@output_backend
 def lineups_data(
     match_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -18,26 +26,68 @@ def lineups_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
-) -> pd.DataFrame:
-    """Fetches lineup and per-player statistics for each match."""
+    max_workers: int = 1,
+    processes: int = 1,
+    spill_dir: Optional[str] = None,
+    compact: bool = False,
+    format: str = "long",
+) -> Union[pd.DataFrame, "SpilledDataset"]:
+    """Fetches lineup and per-player statistics for each match.
+
+    With ``spill_dir`` set, records are written to Parquet chunks under that
+    directory as matches finish and a lazily loaded ``SpilledDataset`` is
+    returned instead of a DataFrame (requires pyarrow).
+
+    With ``compact=True``, repeated strings are interned as matches are parsed
+    and every repeated string column (such as ``player_name``) is returned as a
+    categorical, which shrinks a season of lineups several times over.
+
+    With ``format="wide"``, each player-match is one row with one numeric
+    column per statistic in ``LINEUP_STATS``, built directly while parsing
+    rather than pivoted from the long (one row per stat) layout. Exports are
+    named ``lineups_data_wide``.
+    """
     validate_source(data_source)
     validate_df(match_df, "match_df")
+    validate_format(format)
+    wide = format == "wide"
+    fn_name = "lineups_data_wide" if wide else "lineups_data"
 
+    spiller = (
+        RecordSpiller(
+            spill_dir, prefix=fn_name,
+            build=partial(build_frame, fn_name=fn_name, compact=compact),
+            json_columns=MIXED_COLUMNS.get(fn_name, ()),
+        )
+        if spill_dir else None
+    )
     with SofascoreClient(rate_limit=rate_limit, cache=cache) as client:
         records = iter_per_match_sync(
             match_df, client,
             data_source=data_source,
             endpoint="{base}/api/v1/event/{game_id}/lineups",
-            parser=parse_lineups_records,
+            parser=parse_lineups_wide_records if wide else parse_lineups_records,
             log_label="lineups",
+            max_workers=max_workers,
+            processes=processes,
+            sink=spiller,
+            compact=compact,
+        )
+
+    if spiller is not None:
+        return finish_spill(
+            spiller, "No lineup data found for the specified parameters.",
+            fn_name=fn_name, data_source=data_source,
+            output_dir=output_dir,
+            enable_json_export=enable_json_export, enable_excel_export=enable_excel_export,
         )
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, fn_name, compact=compact)
     if result_df.empty:
         raise DataNotAvailableError("No lineup data found for the specified parameters.")
 
     export_df(
-        result_df, fn_name="lineups_data", data_source=data_source,
+        result_df, fn_name=fn_name, data_source=data_source,
         output_dir=output_dir,
         enable_json_export=enable_json_export, enable_excel_export=enable_excel_export,
     )
@@ -1,20 +1,25 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Sequence
 import pandas as pd
 from datafc.utils._client import SofascoreClient
 from datafc.utils._config import API_URLS
 from datafc.utils._validate import validate_source, build_tournament_url
-from datafc.sofascore._parsers import parse_match_events
+from datafc.utils._backend import output_backend
+from datafc.sofascore._parsers import parse_match_events_records
 from datafc.sofascore._core import (
     needs_world_cup_resolution,
     resolve_world_cup_week_sync,
     export_df,
 )
+from datafc.sofascore._schemas import build_frame, validate_columns
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import DataNotAvailableError
 
 if TYPE_CHECKING:
     from datafc.utils._cache import DiskCache
 
 
+@sync_engine_dispatch
+@output_backend
 def match_data(
     tournament_id: int,
     season_id: int,
@@ -27,6 +32,7 @@ def match_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
+    columns: Optional[Sequence[str]] = None,
 ) -> pd.DataFrame:
     """
     Fetches match data for a specified tournament, season, and matchweek.
@@ -42,6 +48,8 @@ def match_data(
         cache: Optional DiskCache. Cached responses skip the API call.
         enable_json_export / enable_excel_export: Export switches.
         output_dir: Directory where exported files are written.
+        columns: Optional subset of output columns, in output order. Only these
+            fields are extracted from the events.
 
     Returns:
         Match data with columns for teams, scores, status, and timestamps.
@@ -50,6 +58,7 @@ def match_data(
         InvalidParameterError, DataNotAvailableError, APIError.
     """
     validate_source(data_source)
+    columns = validate_columns(columns, "match_data")
 
     if needs_world_cup_resolution(tournament_type, tournament_stage, week_number):
         with SofascoreClient(rate_limit=rate_limit, cache=cache) as client:
@@ -72,7 +81,8 @@ def match_data(
             f"season_id={season_id}, week_number={week_number}."
         )
 
-    match_data_df = parse_match_events(events)
+    records = parse_match_events_records(events, columns)
+    match_data_df = build_frame(records, "match_data", columns=columns)
 
     export_df(
         match_data_df, fn_name="match_data", data_source=data_source,
@@ -2,15 +2,19 @@ from typing import TYPE_CHECKING, Optional
 import pandas as pd
 from datafc.utils._client import SofascoreClient
 from datafc.utils._validate import validate_source, validate_df
-from datafc.utils._helpers import _cast_int_cols
+from datafc.utils._backend import output_backend
 from datafc.sofascore._parsers import parse_match_details_records
 from datafc.sofascore._core import iter_per_match_sync, export_df
+from datafc.sofascore._schemas import build_frame
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import DataNotAvailableError
 
 if TYPE_CHECKING:
     from datafc.utils._cache import DiskCache
 
 
+@sync_engine_dispatch
+@output_backend
 def match_details_data(
     match_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -19,6 +23,8 @@ def match_details_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
+    max_workers: int = 1,
+    processes: int = 1,
 ) -> pd.DataFrame:
     """Fetches referee and venue details for each match. One row per match."""
     validate_source(data_source)
@@ -32,12 +38,13 @@ def match_details_data(
             parser=parse_match_details_records,
             single_record=True,
             log_label="details",
+            max_workers=max_workers,
+            processes=processes,
         )
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "match_details_data")
     if result_df.empty:
         raise DataNotAvailableError("No match detail data found for the specified parameters.")
-    _cast_int_cols(result_df, "referee_id")
 
     export_df(
         result_df, fn_name="match_details_data", data_source=data_source,
@@ -2,14 +2,19 @@ from typing import TYPE_CHECKING, Optional
 import pandas as pd
 from datafc.utils._client import SofascoreClient
 from datafc.utils._validate import validate_source, validate_df
+from datafc.utils._backend import output_backend
 from datafc.sofascore._parsers import parse_match_odds_records
 from datafc.sofascore._core import iter_per_match_sync, export_df
+from datafc.sofascore._schemas import build_frame
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import DataNotAvailableError
 
 if TYPE_CHECKING:
     from datafc.utils._cache import DiskCache
 
 
+@sync_engine_dispatch
+@output_backend
 def match_odds_data(
     match_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -18,6 +23,8 @@ def match_odds_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
+    max_workers: int = 1,
+    processes: int = 1,
 ) -> pd.DataFrame:
     """Fetches betting odds data for each match."""
     validate_source(data_source)
@@ -30,9 +37,11 @@ def match_odds_data(
             endpoint="{base}/api/v1/event/{game_id}/odds/1/all",
             parser=parse_match_odds_records,
             log_label="match odds",
+            max_workers=max_workers,
+            processes=processes,
         )
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "match_odds_data")
     if result_df.empty:
         raise DataNotAvailableError("No match odds data found for the specified parameters.")
 
@@ -1,15 +1,22 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 import pandas as pd
 from datafc.utils._client import SofascoreClient
-from datafc.utils._validate import validate_source, validate_df
-from datafc.sofascore._parsers import parse_match_stats_records
+from datafc.utils._validate import validate_source, validate_df, validate_format
+from datafc.utils._backend import as_input_frame, output_backend
+from datafc.sofascore._parsers import (
+    MATCH_KEYS, parse_match_stats_records, parse_match_stats_wide_record,
+)
 from datafc.sofascore._core import iter_per_match_sync, export_df
+from datafc.sofascore._schemas import build_frame
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import DataNotAvailableError
 
 if TYPE_CHECKING:
     from datafc.utils._cache import DiskCache
 
 
+@sync_engine_dispatch
+@output_backend
 def match_stats_data(
     match_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -18,6 +25,10 @@ def match_stats_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
+    max_workers: int = 1,
+    processes: int = 1,
+    compact: bool = False,
+    format: str = "long",
 ) -> pd.DataFrame:
     """
     Fetches statistical data for each match in the provided match dataset.
@@ -29,6 +40,15 @@ def match_stats_data(
         cache: Optional DiskCache instance. Cached responses skip the API call.
         enable_json_export: If True, saves output as JSON. Defaults to False.
         enable_excel_export: If True, saves output as Excel. Defaults to False.
+        max_workers: Threads fetching matches concurrently. Defaults to 1 (sequential).
+        processes: Processes parsing cached matches in batch mode. Defaults to 1 (off).
+        compact: If True, repeated strings are interned during parsing and every
+            repeated string column (including text values such as ``"55%"``) is
+            returned as a categorical. Defaults to False.
+        format: ``"long"`` (default) for one row per period, group and stat
+            with the values as displayed, or ``"wide"`` for one row per match
+            with a float column per ``{period}_{stat}_{side}``, parsed from
+            percentages and fractions while parsing. See ``stat_column_index``.
 
     Returns:
         Match statistics with period, group, stat name and home/away values.
@@ -40,23 +60,54 @@ def match_stats_data(
     """
     validate_source(data_source)
     validate_df(match_df, "match_df")
+    validate_format(format)
+    wide = format == "wide"
+    fn_name = "match_stats_data_wide" if wide else "match_stats_data"
 
     with SofascoreClient(rate_limit=rate_limit, cache=cache) as client:
         records = iter_per_match_sync(
             match_df, client,
             data_source=data_source,
             endpoint="{base}/api/v1/event/{game_id}/statistics",
-            parser=parse_match_stats_records,
+            parser=parse_match_stats_wide_record if wide else parse_match_stats_records,
+            single_record=wide,
             log_label="match stats",
+            max_workers=max_workers,
+            processes=processes,
+            compact=compact,
         )
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, fn_name, compact=compact)
     if result_df.empty:
         raise DataNotAvailableError("No match statistics data found for the specified parameters.")
 
     export_df(
-        result_df, fn_name="match_stats_data", data_source=data_source,
+        result_df, fn_name=fn_name, data_source=data_source,
         output_dir=output_dir,
         enable_json_export=enable_json_export, enable_excel_export=enable_excel_export,
     )
     return result_df
+
+
+def stat_column_index(df: Any) -> pd.DataFrame:
+    """
+    Reshape ``match_stats_data(format="wide")`` output for column-wise analysis.
+
+    The match keys become the row index and the stat columns a
+    ``(period, stat, side)`` column MultiIndex, so a season table is a single
+    vectorized call, e.g.
+    ``stat_column_index(df)["ALL"].groupby(level="season", observed=True).mean()``.
+
+    Args:
+        df: Wide match statistics, as a DataFrame, ``pyarrow.Table`` or ``polars.DataFrame``.
+    """
+    df = as_input_frame(df)
+    keys = [column for column in MATCH_KEYS if column in df.columns]
+    out = df.set_index(keys)
+    levels = []
+    for column in out.columns:
+        period, rest = column.split("_", 1)
+        stat, side = rest.rsplit("_", 1)
+        levels.append((period, stat, side))
+    out.columns = pd.MultiIndex.from_tuples(levels, names=["period", "stat", "side"])
+    return out
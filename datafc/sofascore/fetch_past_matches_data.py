@@ -3,13 +3,18 @@ import pandas as pd
 from datafc.utils._client import SofascoreClient
 from datafc.utils._config import API_URLS, WWW_URLS
 from datafc.utils._validate import validate_source, build_tournament_url
+from datafc.utils._backend import output_backend
 from datafc.sofascore._core import past_match_record_from_event, export_df
+from datafc.sofascore._schemas import build_frame
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import DataNotAvailableError
 
 if TYPE_CHECKING:
     from datafc.utils._cache import DiskCache
 
 
+@sync_engine_dispatch
+@output_backend
 def past_matches_data(
     tournament_id: int,
     season_id: int,
@@ -72,7 +77,7 @@ def past_matches_data(
             f"season_id={season_id}, week_number={week_number}."
         )
 
-    result_df = pd.DataFrame(all_matches)
+    result_df = build_frame(all_matches, "past_matches_data")
 
     export_df(
         result_df, fn_name="past_matches_data", data_source=data_source,
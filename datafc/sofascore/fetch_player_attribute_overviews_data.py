@@ -4,10 +4,14 @@ import pandas as pd
 from datafc.utils._client import SofascoreClient
 from datafc.utils._config import API_URLS
 from datafc.utils._validate import validate_source, validate_df
+from datafc.utils._backend import output_backend
 from datafc.sofascore._core import (
     player_attribute_overviews_records_from_response,
     export_df,
+    map_rows_sync,
 )
+from datafc.sofascore._schemas import build_frame
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import APIError, DataNotAvailableError
 
 if TYPE_CHECKING:
@@ -16,6 +20,8 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@sync_engine_dispatch
+@output_backend
 def player_attribute_overviews_data(
     squad_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -24,6 +30,7 @@ def player_attribute_overviews_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
+    max_workers: int = 1,
 ) -> pd.DataFrame:
     """Fetches radar attribute overviews for each player in the provided squad dataset."""
     validate_source(data_source)
@@ -33,21 +40,23 @@ def player_attribute_overviews_data(
     unique_players = squad_df[["player_id", "player_name"]].drop_duplicates()
     failed_players: list = []
 
+    def fetch_player(client, prow: pd.Series) -> list:
+        player_id, player_name = prow["player_id"], prow["player_name"]
+        url = f"{API_URLS[data_source]}/api/v1/player/{player_id}/attribute-overviews"
+        try:
+            data = client.get(url)
+            return player_attribute_overviews_records_from_response(data, player_id, player_name)
+        except APIError as exc:
+            logger.warning(
+                "Failed to fetch attribute overviews for player_id=%s (%s): %s",
+                player_id, player_name, exc,
+            )
+            failed_players.append(player_id)
+            return []
+
     with SofascoreClient(rate_limit=rate_limit, cache=cache) as client:
-        for _, prow in unique_players.iterrows():
-            player_id, player_name = prow["player_id"], prow["player_name"]
-            url = f"{API_URLS[data_source]}/api/v1/player/{player_id}/attribute-overviews"
-            try:
-                data = client.get(url)
-                records.extend(
-                    player_attribute_overviews_records_from_response(data, player_id, player_name)
-                )
-            except APIError as exc:
-                logger.warning(
-                    "Failed to fetch attribute overviews for player_id=%s (%s): %s",
-                    player_id, player_name, exc,
-                )
-                failed_players.append(player_id)
+        for result in map_rows_sync(unique_players, client, fetch_player, max_workers=max_workers):
+            records.extend(result)
 
     if failed_players:
         logger.warning(
@@ -55,7 +64,7 @@ def player_attribute_overviews_data(
             len(failed_players), failed_players,
         )
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "player_attribute_overviews_data")
     if result_df.empty:
         raise DataNotAvailableError(
             "No attribute overview data found for the specified players."
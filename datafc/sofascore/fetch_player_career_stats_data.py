@@ -4,8 +4,10 @@ import pandas as pd
 from datafc.utils._client import SofascoreClient
 from datafc.utils._config import API_URLS
 from datafc.utils._validate import validate_source, validate_df
-from datafc.utils._helpers import _cast_int_cols
-from datafc.sofascore._core import career_stats_records_for_pair, export_df
+from datafc.utils._backend import output_backend
+from datafc.sofascore._core import career_stats_records_for_pair, export_df, map_rows_sync
+from datafc.sofascore._schemas import build_frame
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import APIError, DataNotAvailableError
 
 if TYPE_CHECKING:
@@ -14,6 +16,8 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@sync_engine_dispatch
+@output_backend
 def player_career_stats_data(
     squad_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -22,6 +26,7 @@ def player_career_stats_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
+    max_workers: int = 1,
 ) -> pd.DataFrame:
     """Fetches career statistics (all seasons, overall) for each player in the squad dataset."""
     validate_source(data_source)
@@ -32,34 +37,39 @@ def player_career_stats_data(
     failed_players: list = []
     base = API_URLS[data_source]
 
+    def fetch_player(client, row: pd.Series) -> list:
+        player_id, player_name = row["player_id"], row["player_name"]
+        player_records: list = []
+        try:
+            seasons_data = client.get(
+                f"{base}/api/v1/player/{player_id}/statistics/seasons"
+            )
+            for entry in seasons_data.get("uniqueTournamentSeasons", []):
+                tournament = entry.get("uniqueTournament", {})
+                tid = tournament.get("id")
+                for season in entry.get("seasons", []):
+                    sid = season.get("id")
+                    try:
+                        stats_data = client.get(
+                            f"{base}/api/v1/player/{player_id}"
+                            f"/unique-tournament/{tid}/season/{sid}/statistics/overall"
+                        )
+                    except APIError:
+                        continue
+                    player_records.extend(career_stats_records_for_pair(
+                        tournament, season, stats_data, player_id, player_name,
+                    ))
+        except APIError as exc:
+            logger.warning(
+                "Failed to fetch career stats for player_id=%s (%s): %s",
+                player_id, player_name, exc,
+            )
+            failed_players.append(player_id)
+        return player_records
+
     with SofascoreClient(rate_limit=rate_limit, cache=cache) as client:
-        for _, row in unique_players.iterrows():
-            player_id, player_name = row["player_id"], row["player_name"]
-            try:
-                seasons_data = client.get(
-                    f"{base}/api/v1/player/{player_id}/statistics/seasons"
-                )
-                for entry in seasons_data.get("uniqueTournamentSeasons", []):
-                    tournament = entry.get("uniqueTournament", {})
-                    tid = tournament.get("id")
-                    for season in entry.get("seasons", []):
-                        sid = season.get("id")
-                        try:
-                            stats_data = client.get(
-                                f"{base}/api/v1/player/{player_id}"
-                                f"/unique-tournament/{tid}/season/{sid}/statistics/overall"
-                            )
-                        except APIError:
-                            continue
-                        records.extend(career_stats_records_for_pair(
-                            tournament, season, stats_data, player_id, player_name,
-                        ))
-            except APIError as exc:
-                logger.warning(
-                    "Failed to fetch career stats for player_id=%s (%s): %s",
-                    player_id, player_name, exc,
-                )
-                failed_players.append(player_id)
+        for result in map_rows_sync(unique_players, client, fetch_player, max_workers=max_workers):
+            records.extend(result)
 
     if failed_players:
         logger.warning(
@@ -67,10 +77,9 @@ def player_career_stats_data(
             len(failed_players), failed_players,
         )
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "player_career_stats_data")
     if result_df.empty:
         raise DataNotAvailableError("No career stats data found for the specified players.")
-    _cast_int_cols(result_df, "team_id")
 
     if enable_json_export or enable_excel_export:
         first = squad_df.iloc[0]
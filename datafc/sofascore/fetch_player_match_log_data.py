@@ -4,7 +4,10 @@ import pandas as pd
 from datafc.utils._client import SofascoreClient
 from datafc.utils._config import API_URLS
 from datafc.utils._validate import validate_source, validate_df
-from datafc.sofascore._core import match_log_records_from_response, export_df
+from datafc.utils._backend import output_backend
+from datafc.sofascore._core import match_log_records_from_response, export_df, map_rows_sync
+from datafc.sofascore._schemas import build_frame
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import APIError, DataNotAvailableError
 
 if TYPE_CHECKING:
@@ -13,6 +16,8 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@sync_engine_dispatch
+@output_backend
 def player_match_log_data(
     squad_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -21,6 +26,7 @@ def player_match_log_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
+    max_workers: int = 1,
 ) -> pd.DataFrame:
     """Fetches match-by-match player statistics for each player in the squad dataset."""
     validate_source(data_source)
@@ -30,28 +36,33 @@ def player_match_log_data(
     unique_players = squad_df[["player_id", "player_name"]].drop_duplicates()
     failed_players: list = []
 
-    with SofascoreClient(rate_limit=rate_limit, cache=cache) as client:
-        for _, prow in unique_players.iterrows():
-            player_id, player_name = prow["player_id"], prow["player_name"]
-            page = 0
-            while True:
-                url = (
-                    f"{API_URLS[data_source]}/api/v1/player/{player_id}"
-                    f"/events/last/{page}"
+    def fetch_player(client, prow: pd.Series) -> list:
+        player_id, player_name = prow["player_id"], prow["player_name"]
+        player_records: list = []
+        page = 0
+        while True:
+            url = (
+                f"{API_URLS[data_source]}/api/v1/player/{player_id}"
+                f"/events/last/{page}"
+            )
+            try:
+                data = client.get(url)
+            except APIError as exc:
+                logger.warning(
+                    "Failed to fetch match log for player_id=%s (%s): %s",
+                    player_id, player_name, exc,
                 )
-                try:
-                    data = client.get(url)
-                except APIError as exc:
-                    logger.warning(
-                        "Failed to fetch match log for player_id=%s (%s): %s",
-                        player_id, player_name, exc,
-                    )
-                    failed_players.append(player_id)
-                    break
-                records.extend(match_log_records_from_response(data, player_id, player_name))
-                if not data.get("hasNextPage", False):
-                    break
-                page += 1
+                failed_players.append(player_id)
+                break
+            player_records.extend(match_log_records_from_response(data, player_id, player_name))
+            if not data.get("hasNextPage", False):
+                break
+            page += 1
+        return player_records
+
+    with SofascoreClient(rate_limit=rate_limit, cache=cache) as client:
+        for result in map_rows_sync(unique_players, client, fetch_player, max_workers=max_workers):
+            records.extend(result)
 
     if failed_players:
         logger.warning(
@@ -59,7 +70,7 @@ def player_match_log_data(
             len(failed_players), failed_players,
         )
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "player_match_log_data")
     if result_df.empty:
         raise DataNotAvailableError("No match log data found for the specified players.")
 
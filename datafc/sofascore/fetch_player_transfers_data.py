@@ -5,8 +5,11 @@ from datafc.utils._client import SofascoreClient
 from datafc.utils._config import API_URLS
 from datafc.utils._validate import validate_source, validate_df
 from datafc.utils._tournament_info import resolve_tournament_season
-from datafc.utils._helpers import _cast_int_cols
-from datafc.sofascore._core import player_transfers_records_from_response, export_df
+from datafc.utils._helpers import _id_or_zero
+from datafc.utils._backend import output_backend
+from datafc.sofascore._core import player_transfers_records_from_response, export_df, map_rows_sync
+from datafc.sofascore._schemas import build_frame
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import APIError, DataNotAvailableError
 
 if TYPE_CHECKING:
@@ -15,6 +18,8 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@sync_engine_dispatch
+@output_backend
 def player_transfers_data(
     squad_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -23,6 +28,7 @@ def player_transfers_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
+    max_workers: int = 1,
 ) -> pd.DataFrame:
     """Fetches full transfer history for each player in the provided squad dataset."""
     validate_source(data_source)
@@ -32,19 +38,23 @@ def player_transfers_data(
     unique_players = squad_df[["player_id", "player_name"]].drop_duplicates()
     failed_players: list = []
 
+    def fetch_player(client, row: pd.Series) -> list:
+        player_id, player_name = row["player_id"], row["player_name"]
+        url = f"{API_URLS[data_source]}/api/v1/player/{player_id}/transfer-history"
+        try:
+            data = client.get(url)
+            return player_transfers_records_from_response(data, player_id, player_name)
+        except APIError as exc:
+            logger.warning(
+                "Failed to fetch transfers for player_id=%s (%s): %s",
+                player_id, player_name, exc,
+            )
+            failed_players.append(player_id)
+            return []
+
     with SofascoreClient(rate_limit=rate_limit, cache=cache) as client:
-        for _, row in unique_players.iterrows():
-            player_id, player_name = row["player_id"], row["player_name"]
-            url = f"{API_URLS[data_source]}/api/v1/player/{player_id}/transfer-history"
-            try:
-                data = client.get(url)
-                records.extend(player_transfers_records_from_response(data, player_id, player_name))
-            except APIError as exc:
-                logger.warning(
-                    "Failed to fetch transfers for player_id=%s (%s): %s",
-                    player_id, player_name, exc,
-                )
-                failed_players.append(player_id)
+        for result in map_rows_sync(unique_players, client, fetch_player, max_workers=max_workers):
+            records.extend(result)
 
     if failed_players:
         logger.warning(
@@ -52,15 +62,14 @@ def player_transfers_data(
             len(failed_players), failed_players,
         )
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "player_transfers_data")
     if result_df.empty:
         raise DataNotAvailableError("No transfer data found for the specified players.")
-    _cast_int_cols(result_df, "from_team_id", "to_team_id")
 
     if enable_json_export or enable_excel_export:
         first = squad_df.iloc[0]
-        t_id = int(first.get("tournament_id") or 0)
-        s_id = int(first.get("season_id") or 0)
+        t_id = _id_or_zero(first.get("tournament_id"))
+        s_id = _id_or_zero(first.get("season_id"))
         _, _, season_year = resolve_tournament_season(
             t_id, s_id, data_source=data_source, rate_limit=rate_limit
         ) if t_id and s_id else ("", "", None)
@@ -2,18 +2,23 @@ from typing import TYPE_CHECKING, Optional
 import pandas as pd
 from datafc.utils._client import SofascoreClient
 from datafc.utils._validate import validate_source, validate_df
+from datafc.utils._backend import output_backend
 from datafc.sofascore._core import (
     iter_per_match_sync,
     pregame_form_records,
     pregame_form_coerce_numeric,
     export_df,
 )
+from datafc.sofascore._schemas import build_frame
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import DataNotAvailableError
 
 if TYPE_CHECKING:
     from datafc.utils._cache import DiskCache
 
 
+@sync_engine_dispatch
+@output_backend
 def pregame_form_data(
     match_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -22,6 +27,8 @@ def pregame_form_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
+    max_workers: int = 1,
+    processes: int = 1,
 ) -> pd.DataFrame:
     """Fetches pre-game form (last 5 results, avg rating, league position, squad value) per match."""
     validate_source(data_source)
@@ -34,9 +41,11 @@ def pregame_form_data(
             endpoint="{base}/api/v1/event/{game_id}/pregame-form",
             parser=pregame_form_records,
             log_label="pregame form",
+            max_workers=max_workers,
+            processes=processes,
         )
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "pregame_form_data")
     if result_df.empty:
         raise DataNotAvailableError("No pre-game form data found for the specified matches.")
     result_df = pregame_form_coerce_numeric(result_df)
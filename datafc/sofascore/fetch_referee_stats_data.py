@@ -4,7 +4,10 @@ import pandas as pd
 from datafc.utils._client import SofascoreClient
 from datafc.utils._config import API_URLS
 from datafc.utils._validate import validate_source
+from datafc.utils._backend import output_backend
 from datafc.sofascore._core import referee_stats_records, export_df
+from datafc.sofascore._schemas import build_frame
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import DataNotAvailableError
 
 logger = logging.getLogger(__name__)
@@ -13,6 +16,8 @@ if TYPE_CHECKING:
     from datafc.utils._cache import DiskCache
 
 
+@sync_engine_dispatch
+@output_backend
 def referee_stats_data(
     referee_id: int,
     data_source: str = "sofascore",
@@ -41,7 +46,9 @@ def referee_stats_data(
     if not statistics:
         raise DataNotAvailableError(f"No statistics found for referee_id={referee_id}.")
 
-    result_df = pd.DataFrame(referee_stats_records(statistics, referee_id, referee_name))
+    result_df = build_frame(
+        referee_stats_records(statistics, referee_id, referee_name), "referee_stats_data",
+    )
     if result_df.empty:
         raise DataNotAvailableError(f"No statistics found for referee_id={referee_id}.")
 
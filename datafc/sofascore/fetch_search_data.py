@@ -4,7 +4,10 @@ import pandas as pd
 from datafc.utils._client import SofascoreClient
 from datafc.utils._config import API_URLS
 from datafc.utils._validate import validate_source
+from datafc.utils._backend import output_backend
 from datafc.sofascore._parsers import parse_search_records
+from datafc.sofascore._schemas import build_frame
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import InvalidParameterError, DataNotAvailableError
 
 if TYPE_CHECKING:
@@ -13,6 +16,8 @@ if TYPE_CHECKING:
 AVAILABLE_ENTITY_TYPES = {"team", "player", "tournament", "manager"}
 
 
+@sync_engine_dispatch
+@output_backend
 def search_data(
     query: str,
     entity_type: Optional[str] = None,
@@ -42,7 +47,7 @@ def search_data(
         raise DataNotAvailableError(f"No results found for query='{query}'.")
 
     records = parse_search_records(results, entity_type)
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "search_data")
     if result_df.empty:
         raise DataNotAvailableError(
             f"No results found for query='{query}'"
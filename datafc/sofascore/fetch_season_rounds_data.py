@@ -4,13 +4,18 @@ from datafc.utils._client import SofascoreClient
 from datafc.utils._config import API_URLS
 from datafc.utils._validate import validate_source
 from datafc.utils._tournament_info import resolve_tournament_season
+from datafc.utils._backend import output_backend
 from datafc.sofascore._core import season_rounds_records, export_df
+from datafc.sofascore._schemas import build_frame
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import DataNotAvailableError
 
 if TYPE_CHECKING:
     from datafc.utils._cache import DiskCache
 
 
+@sync_engine_dispatch
+@output_backend
 def season_rounds_data(
     tournament_id: int,
     season_id: int,
@@ -37,7 +42,9 @@ def season_rounds_data(
             f"No round data found for tournament_id={tournament_id}, season_id={season_id}."
         )
 
-    result_df = pd.DataFrame(season_rounds_records(rounds, tournament_id, season_id))
+    result_df = build_frame(
+        season_rounds_records(rounds, tournament_id, season_id), "season_rounds_data",
+    )
 
     if enable_json_export or enable_excel_export:
         country, tournament_name, season_year = resolve_tournament_season(
@@ -4,8 +4,11 @@ import pandas as pd
 from datafc.utils._client import SofascoreClient
 from datafc.utils._config import API_URLS
 from datafc.utils._validate import validate_source
+from datafc.utils._backend import output_backend
 from datafc.sofascore._parsers import parse_seasons_records
 from datafc.sofascore._core import export_df
+from datafc.sofascore._schemas import build_frame
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import DataNotAvailableError
 
 logger = logging.getLogger(__name__)
@@ -14,6 +17,8 @@ if TYPE_CHECKING:
     from datafc.utils._cache import DiskCache
 
 
+@sync_engine_dispatch
+@output_backend
 def seasons_data(
     tournament_id: int,
     data_source: str = "sofascore",
@@ -47,7 +52,7 @@ def seasons_data(
     if not records:
         raise DataNotAvailableError(f"No seasons found for tournament_id={tournament_id}.")
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "seasons_data")
 
     export_df(
         result_df, fn_name="seasons_data", data_source=data_source,
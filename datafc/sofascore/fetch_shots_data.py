@@ -1,15 +1,21 @@
-from typing import TYPE_CHECKING, Optional
+from functools import partial
+from typing import TYPE_CHECKING, Optional, Sequence
 import pandas as pd
 from datafc.utils._client import SofascoreClient
 from datafc.utils._validate import validate_source, validate_df
+from datafc.utils._backend import output_backend
 from datafc.sofascore._parsers import parse_shots_records
 from datafc.sofascore._core import iter_per_match_sync, export_df
+from datafc.sofascore._schemas import build_frame, validate_columns
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import DataNotAvailableError
 
 if TYPE_CHECKING:
     from datafc.utils._cache import DiskCache
 
 
+@sync_engine_dispatch
+@output_backend
 def shots_data(
     match_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -18,6 +24,9 @@ def shots_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
+    max_workers: int = 1,
+    processes: int = 1,
+    columns: Optional[Sequence[str]] = None,
 ) -> pd.DataFrame:
     """Fetches shot map data (xG, xGOT, coordinates, body part, etc.) for each match.
 
@@ -27,23 +36,30 @@ def shots_data(
         rate_limit: Maximum requests per second.
         cache: Optional DiskCache. Cached responses skip the API call.
         enable_json_export / enable_excel_export: Export switches.
+        max_workers: Threads fetching matches concurrently. Defaults to 1 (sequential).
+        processes: Processes parsing cached matches in batch mode. Defaults to 1 (off).
+        columns: Optional subset of output columns, in output order. Only these
+            fields are extracted from each response.
 
     Raises:
         InvalidParameterError, DataNotAvailableError, APIError.
     """
     validate_source(data_source)
     validate_df(match_df, "match_df")
+    columns = validate_columns(columns, "shots_data")
 
     with SofascoreClient(rate_limit=rate_limit, cache=cache) as client:
         records = iter_per_match_sync(
             match_df, client,
             data_source=data_source,
             endpoint="{base}/api/v1/event/{game_id}/shotmap",
-            parser=parse_shots_records,
+            parser=partial(parse_shots_records, columns=columns),
             log_label="shots",
+            max_workers=max_workers,
+            processes=processes,
         )
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "shots_data", columns=columns)
     if result_df.empty:
         raise DataNotAvailableError("No shot data found for the specified parameters.")
 
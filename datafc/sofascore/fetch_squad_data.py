@@ -5,7 +5,11 @@ from datafc.utils._client import SofascoreClient
 from datafc.utils._config import API_URLS
 from datafc.utils._validate import validate_source, validate_df
 from datafc.utils._tournament_info import resolve_tournament_season
-from datafc.sofascore._core import squad_records_from_response, export_df
+from datafc.utils._helpers import _id_or_zero
+from datafc.utils._backend import output_backend
+from datafc.sofascore._core import squad_records_from_response, export_df, map_rows_sync
+from datafc.sofascore._schemas import build_frame
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import APIError, DataNotAvailableError
 
 if TYPE_CHECKING:
@@ -14,6 +18,8 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@sync_engine_dispatch
+@output_backend
 def squad_data(
     standings_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -22,6 +28,7 @@ def squad_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
+    max_workers: int = 1,
 ) -> pd.DataFrame:
     """Fetches squad roster data for each team in the provided standings dataset."""
     validate_source(data_source)
@@ -31,34 +38,38 @@ def squad_data(
     teams = standings_df[standings_df["category"] == "Total"]
     failed_teams: list = []
 
+    def fetch_team(client, row: pd.Series) -> list:
+        team_id = row["team_id"]
+        team_name = row["team_name"]
+        url = f"{API_URLS[data_source]}/api/v1/team/{team_id}/players"
+        try:
+            data = client.get(url)
+            return squad_records_from_response(data, row)
+        except APIError as exc:
+            logger.warning(
+                "Failed to fetch squad data for team_id=%s (%s): %s",
+                team_id, team_name, exc,
+            )
+            failed_teams.append(team_id)
+            return []
+
     with SofascoreClient(rate_limit=rate_limit, cache=cache) as client:
-        for _, row in teams.iterrows():
-            team_id = row["team_id"]
-            team_name = row["team_name"]
-            url = f"{API_URLS[data_source]}/api/v1/team/{team_id}/players"
-            try:
-                data = client.get(url)
-                squad_list.extend(squad_records_from_response(data, row))
-            except APIError as exc:
-                logger.warning(
-                    "Failed to fetch squad data for team_id=%s (%s): %s",
-                    team_id, team_name, exc,
-                )
-                failed_teams.append(team_id)
+        for result in map_rows_sync(teams, client, fetch_team, max_workers=max_workers):
+            squad_list.extend(result)
 
     if failed_teams:
         logger.warning(
             "Could not retrieve squad for %d team(s): %s", len(failed_teams), failed_teams
         )
 
-    result_df = pd.DataFrame(squad_list)
+    result_df = build_frame(squad_list, "squad_data")
     if result_df.empty:
         raise DataNotAvailableError("No squad data found for the specified teams.")
 
     if enable_json_export or enable_excel_export:
         first = standings_df.iloc[0]
-        t_id = int(first.get("tournament_id") or 0)
-        s_id = int(first.get("season_id") or 0)
+        t_id = _id_or_zero(first.get("tournament_id"))
+        s_id = _id_or_zero(first.get("season_id"))
         _, _, season_year = resolve_tournament_season(
             t_id, s_id, data_source=data_source, rate_limit=rate_limit
         ) if t_id and s_id else ("", "", None)
@@ -4,14 +4,19 @@ from datafc.utils._client import SofascoreClient
 from datafc.utils._config import API_URLS
 from datafc.utils._validate import validate_source
 from datafc.utils._tournament_info import resolve_tournament_season
+from datafc.utils._backend import output_backend
 from datafc.sofascore._parsers import parse_standings_rows
 from datafc.sofascore._core import export_df
+from datafc.sofascore._schemas import build_frame
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import APIError, DataNotAvailableError
 
 if TYPE_CHECKING:
     from datafc.utils._cache import DiskCache
 
 
+@sync_engine_dispatch
+@output_backend
 def standings_data(
     tournament_id: int,
     season_id: int,
@@ -38,7 +43,7 @@ def standings_data(
             except APIError:
                 pass
 
-    result_df = pd.DataFrame(rows)
+    result_df = build_frame(rows, "standings_data")
     if result_df.empty:
         raise DataNotAvailableError(
             f"No standings data found for tournament_id={tournament_id}, season_id={season_id}."
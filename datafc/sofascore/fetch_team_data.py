@@ -5,7 +5,11 @@ from datafc.utils._client import SofascoreClient
 from datafc.utils._config import API_URLS
 from datafc.utils._validate import validate_source, validate_df
 from datafc.utils._tournament_info import resolve_tournament_season
-from datafc.sofascore._core import team_profile_record_from_response, export_df
+from datafc.utils._helpers import _id_or_zero
+from datafc.utils._backend import output_backend
+from datafc.sofascore._core import team_profile_record_from_response, export_df, map_rows_sync
+from datafc.sofascore._schemas import build_frame
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import APIError, DataNotAvailableError
 
 if TYPE_CHECKING:
@@ -14,6 +18,8 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@sync_engine_dispatch
+@output_backend
 def team_data(
     standings_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -22,6 +28,7 @@ def team_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
+    max_workers: int = 1,
 ) -> pd.DataFrame:
     """Fetches profile and infrastructure data for each team in the standings dataset."""
     validate_source(data_source)
@@ -31,24 +38,28 @@ def team_data(
     teams = standings_df[standings_df["category"] == "Total"]
     failed_teams: list = []
 
-    with SofascoreClient(rate_limit=rate_limit, cache=cache) as client:
-        for _, row in teams.iterrows():
-            team_id, team_name = row["team_id"], row["team_name"]
-            url = f"{API_URLS[data_source]}/api/v1/team/{team_id}"
-            try:
-                data = client.get(url)
-                record = team_profile_record_from_response(data, row)
-                if record is None:
-                    logger.warning("Empty team response for team_id=%s", team_id)
-                    failed_teams.append(team_id)
-                    continue
-                records.append(record)
-            except APIError as exc:
-                logger.warning(
-                    "Failed to fetch profile for team_id=%s (%s): %s",
-                    team_id, team_name, exc,
-                )
+    def fetch_team(client, row: pd.Series) -> list:
+        team_id, team_name = row["team_id"], row["team_name"]
+        url = f"{API_URLS[data_source]}/api/v1/team/{team_id}"
+        try:
+            data = client.get(url)
+            record = team_profile_record_from_response(data, row)
+            if record is None:
+                logger.warning("Empty team response for team_id=%s", team_id)
                 failed_teams.append(team_id)
+                return []
+            return [record]
+        except APIError as exc:
+            logger.warning(
+                "Failed to fetch profile for team_id=%s (%s): %s",
+                team_id, team_name, exc,
+            )
+            failed_teams.append(team_id)
+            return []
+
+    with SofascoreClient(rate_limit=rate_limit, cache=cache) as client:
+        for result in map_rows_sync(teams, client, fetch_team, max_workers=max_workers):
+            records.extend(result)
 
     if failed_teams:
         logger.warning(
@@ -56,14 +67,14 @@ def team_data(
             len(failed_teams), failed_teams,
         )
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "team_data")
     if result_df.empty:
         raise DataNotAvailableError("No team profile data found for the specified teams.")
 
     if enable_json_export or enable_excel_export:
         first = standings_df.iloc[0]
-        t_id = int(first.get("tournament_id") or 0)
-        s_id = int(first.get("season_id") or 0)
+        t_id = _id_or_zero(first.get("tournament_id"))
+        s_id = _id_or_zero(first.get("season_id"))
         _, _, season_year = resolve_tournament_season(
             t_id, s_id, data_source=data_source, rate_limit=rate_limit
         ) if t_id and s_id else ("", "", None)
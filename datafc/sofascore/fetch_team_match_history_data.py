@@ -4,9 +4,11 @@ import pandas as pd
 from datafc.utils._client import SofascoreClient
 from datafc.utils._config import API_URLS
 from datafc.utils._validate import validate_source
-from datafc.utils._helpers import _cast_int_cols
+from datafc.utils._backend import output_backend
 from datafc.sofascore._parsers import parse_team_match_history_records
 from datafc.sofascore._core import export_df
+from datafc.sofascore._schemas import build_frame
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import APIError, DataNotAvailableError
 
 if TYPE_CHECKING:
@@ -15,6 +17,8 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@sync_engine_dispatch
+@output_backend
 def team_match_history_data(
     team_id: int,
     data_source: str = "sofascore",
@@ -47,23 +51,13 @@ def team_match_history_data(
                 break
             page += 1
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "team_match_history_data")
     if result_df.empty:
         raise DataNotAvailableError(
             f"No historical match data found for team_id={team_id}."
         )
 
     result_df = result_df.sort_values("start_timestamp").reset_index(drop=True)
-    result_df = _cast_int_cols(
-        result_df,
-        "week",
-        "home_team_id", "away_team_id",
-        "home_score_period1", "home_score_period2", "home_score_normaltime",
-        "home_score_display", "home_score_current",
-        "away_score_period1", "away_score_period2", "away_score_normaltime",
-        "away_score_display", "away_score_current",
-        "start_timestamp",
-    )
 
     if enable_json_export or enable_excel_export:
         first = result_df.iloc[0]
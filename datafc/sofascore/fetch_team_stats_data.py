@@ -5,7 +5,10 @@ from datafc.utils._client import SofascoreClient
 from datafc.utils._config import WWW_URLS
 from datafc.utils._validate import validate_source, validate_df
 from datafc.utils._tournament_info import resolve_tournament_season
-from datafc.sofascore._core import team_stats_records_from_response, export_df
+from datafc.utils._backend import output_backend
+from datafc.sofascore._core import team_stats_records_from_response, export_df, map_rows_sync
+from datafc.sofascore._schemas import build_frame
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import APIError, DataNotAvailableError
 
 if TYPE_CHECKING:
@@ -14,6 +17,8 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@sync_engine_dispatch
+@output_backend
 def team_stats_data(
     standings_df: pd.DataFrame,
     tournament_id: int,
@@ -25,6 +30,7 @@ def team_stats_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
+    max_workers: int = 1,
 ) -> pd.DataFrame:
     """Fetches season statistics for each team in the provided standings dataset.
 
@@ -39,29 +45,33 @@ def team_stats_data(
     teams = standings_df[standings_df["category"] == "Total"]
     failed_teams: list = []
 
-    with SofascoreClient(rate_limit=rate_limit, cache=cache) as client:
-        for _, row in teams.iterrows():
-            team_id, team_name = row["team_id"], row["team_name"]
-            url = (
-                f"{WWW_URLS[data_source]}/api/v1/team/{team_id}"
-                f"/unique-tournament/{tournament_id}/season/{season_id}/statistics/overall"
+    def fetch_team(client, row: pd.Series) -> list:
+        team_id, team_name = row["team_id"], row["team_name"]
+        url = (
+            f"{WWW_URLS[data_source]}/api/v1/team/{team_id}"
+            f"/unique-tournament/{tournament_id}/season/{season_id}/statistics/overall"
+        )
+        try:
+            data = client.get(url)
+            return team_stats_records_from_response(data, row)
+        except APIError as exc:
+            logger.warning(
+                "Failed to fetch team stats for team_id=%s (%s): %s",
+                team_id, team_name, exc,
             )
-            try:
-                data = client.get(url)
-                stats_list.extend(team_stats_records_from_response(data, row))
-            except APIError as exc:
-                logger.warning(
-                    "Failed to fetch team stats for team_id=%s (%s): %s",
-                    team_id, team_name, exc,
-                )
-                failed_teams.append(team_id)
+            failed_teams.append(team_id)
+            return []
+
+    with SofascoreClient(rate_limit=rate_limit, cache=cache) as client:
+        for result in map_rows_sync(teams, client, fetch_team, max_workers=max_workers):
+            stats_list.extend(result)
 
     if failed_teams:
         logger.warning(
             "Could not retrieve stats for %d team(s): %s", len(failed_teams), failed_teams
         )
 
-    result_df = pd.DataFrame(stats_list)
+    result_df = build_frame(stats_list, "team_stats_data")
     if result_df.empty:
         raise DataNotAvailableError("No team statistics data found for the specified teams.")
 
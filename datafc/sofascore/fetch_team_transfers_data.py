@@ -4,8 +4,10 @@ import pandas as pd
 from datafc.utils._client import SofascoreClient
 from datafc.utils._config import API_URLS
 from datafc.utils._validate import validate_source, validate_df
-from datafc.utils._helpers import _cast_int_cols
-from datafc.sofascore._core import team_transfers_records_from_response, export_df
+from datafc.utils._backend import output_backend
+from datafc.sofascore._core import team_transfers_records_from_response, export_df, map_rows_sync
+from datafc.sofascore._schemas import build_frame
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import APIError, DataNotAvailableError
 
 if TYPE_CHECKING:
@@ -14,6 +16,8 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@sync_engine_dispatch
+@output_backend
 def team_transfers_data(
     standings_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -22,6 +26,7 @@ def team_transfers_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
+    max_workers: int = 1,
 ) -> pd.DataFrame:
     """Fetches incoming and outgoing transfers for each team in the standings dataset."""
     validate_source(data_source)
@@ -31,19 +36,23 @@ def team_transfers_data(
     teams = standings_df[standings_df["category"] == "Total"]
     failed_teams: list = []
 
+    def fetch_team(client, row: pd.Series) -> list:
+        team_id, team_name = row["team_id"], row["team_name"]
+        url = f"{API_URLS[data_source]}/api/v1/team/{team_id}/transfers"
+        try:
+            data = client.get(url)
+            return team_transfers_records_from_response(data, row)
+        except APIError as exc:
+            logger.warning(
+                "Failed to fetch transfers for team_id=%s (%s): %s",
+                team_id, team_name, exc,
+            )
+            failed_teams.append(team_id)
+            return []
+
     with SofascoreClient(rate_limit=rate_limit, cache=cache) as client:
-        for _, row in teams.iterrows():
-            team_id, team_name = row["team_id"], row["team_name"]
-            url = f"{API_URLS[data_source]}/api/v1/team/{team_id}/transfers"
-            try:
-                data = client.get(url)
-                records.extend(team_transfers_records_from_response(data, row))
-            except APIError as exc:
-                logger.warning(
-                    "Failed to fetch transfers for team_id=%s (%s): %s",
-                    team_id, team_name, exc,
-                )
-                failed_teams.append(team_id)
+        for result in map_rows_sync(teams, client, fetch_team, max_workers=max_workers):
+            records.extend(result)
 
     if failed_teams:
         logger.warning(
@@ -51,10 +60,9 @@ def team_transfers_data(
             len(failed_teams), failed_teams,
         )
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "team_transfers_data")
     if result_df.empty:
         raise DataNotAvailableError("No transfer data found for the specified teams.")
-    _cast_int_cols(result_df, "from_team_id", "to_team_id")
 
     if enable_json_export or enable_excel_export:
         first = result_df.iloc[0]
@@ -5,8 +5,12 @@ from datafc.utils._client import SofascoreClient
 from datafc.utils._config import API_URLS
 from datafc.utils._validate import validate_source, validate_df
 from datafc.utils._tournament_info import resolve_tournament_season
+from datafc.utils._helpers import _id_or_zero
+from datafc.utils._backend import output_backend
 from datafc.sofascore._parsers import parse_upcoming_matches_records
-from datafc.sofascore._core import export_df
+from datafc.sofascore._core import export_df, map_rows_sync
+from datafc.sofascore._schemas import build_frame
+from datafc.sofascore._bridge import sync_engine_dispatch
 from datafc.exceptions import APIError, DataNotAvailableError
 
 if TYPE_CHECKING:
@@ -15,6 +19,8 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@sync_engine_dispatch
+@output_backend
 def upcoming_matches_data(
     standings_df: pd.DataFrame,
     data_source: str = "sofascore",
@@ -23,6 +29,7 @@ def upcoming_matches_data(
     enable_json_export: bool = False,
     enable_excel_export: bool = False,
     output_dir: str = ".",
+    max_workers: int = 1,
 ) -> pd.DataFrame:
     """Fetches upcoming fixture data for each team in the provided standings dataset."""
     validate_source(data_source)
@@ -32,26 +39,35 @@ def upcoming_matches_data(
     records = []
     teams = standings_df[standings_df["category"] == "Total"]
 
+    def fetch_team(client, row: pd.Series) -> list:
+        team_id = row["team_id"]
+        pages: list = []
+        page = 0
+        while True:
+            url = f"{API_URLS[data_source]}/api/v1/team/{team_id}/events/next/{page}"
+            try:
+                data = client.get(url)
+            except APIError as exc:
+                logger.warning(
+                    "Failed to fetch upcoming matches for team_id=%s page=%s: %s",
+                    team_id, page, exc,
+                )
+                break
+            pages.append(data)
+            if not data.get("hasNextPage", False):
+                break
+            page += 1
+        return pages
+
     with SofascoreClient(rate_limit=rate_limit, cache=cache) as client:
-        for _, row in teams.iterrows():
-            team_id = row["team_id"]
-            page = 0
-            while True:
-                url = f"{API_URLS[data_source]}/api/v1/team/{team_id}/events/next/{page}"
-                try:
-                    data = client.get(url)
-                except APIError as exc:
-                    logger.warning(
-                        "Failed to fetch upcoming matches for team_id=%s page=%s: %s",
-                        team_id, page, exc,
-                    )
-                    break
-                records.extend(parse_upcoming_matches_records(data, seen_game_ids))
-                if not data.get("hasNextPage", False):
-                    break
-                page += 1
+        team_pages = map_rows_sync(teams, client, fetch_team, max_workers=max_workers)
+
+    # Parsed in team order so de-duplication keeps the same first occurrence.
+    for pages in team_pages:
+        for data in pages:
+            records.extend(parse_upcoming_matches_records(data, seen_game_ids))
 
-    result_df = pd.DataFrame(records)
+    result_df = build_frame(records, "upcoming_matches_data")
     if result_df.empty:
         raise DataNotAvailableError("No upcoming match data found for the specified teams.")
 
@@ -59,8 +75,8 @@ def upcoming_matches_data(
 
     if enable_json_export or enable_excel_export:
         first = standings_df.iloc[0]
-        t_id = int(first.get("tournament_id") or 0)
-        s_id = int(first.get("season_id") or 0)
+        t_id = _id_or_zero(first.get("tournament_id"))
+        s_id = _id_or_zero(first.get("season_id"))
         _, _, season_year = resolve_tournament_season(
             t_id, s_id, data_source=data_source, rate_limit=rate_limit
         ) if t_id and s_id else ("", "", None)
@@ -1,12 +1,20 @@
 from datafc.utils._client import SofascoreClient
 from datafc.utils._cache import DiskCache, get_default_cache, set_default_cache
-from datafc.utils._save_files import save_json, save_excel, save_parquet
+from datafc.utils._circuit import CircuitBreaker, set_circuit_breaker, reset_circuit_breakers
+from datafc.utils._failover import get_failover, set_failover
+from datafc.utils._proxy import ProxyPool, get_default_proxy_pool, set_default_proxy_pool
+from datafc.utils._executor import get_parse_executor, set_parse_executor
+from datafc.utils._backend import ALLOWED_BACKENDS, get_default_backend, set_default_backend
+from datafc.utils._save_files import save_json, save_excel, save_parquet, save_npz
+from datafc.utils._spill import RecordSpiller, SpilledDataset
+from datafc.utils._spatial import SpatialStore
+from datafc.utils._columns import ColumnBatch
 from datafc.utils._config import (
-    ALLOWED_SOURCES, API_URLS, WWW_URLS, TOURNAMENT_URL_PATTERNS, SOFASCORE_HEADERS,
+    ALLOWED_SOURCES, ALLOWED_FORMATS, API_URLS, WWW_URLS, TOURNAMENT_URL_PATTERNS, SOFASCORE_HEADERS,
     get_tournament_url_patterns, set_tournament_url_patterns, reset_tournament_url_patterns,
 )
 from datafc.utils._validate import (
-    validate_source, validate_df, safe_get, build_tournament_url,
+    validate_source, validate_format, validate_df, safe_get, build_tournament_url,
     validate_tournament_type, validate_tournament_stage,
 )
 
@@ -15,10 +23,29 @@ __all__ = [
     "DiskCache",
     "get_default_cache",
     "set_default_cache",
+    "CircuitBreaker",
+    "set_circuit_breaker",
+    "reset_circuit_breakers",
+    "get_failover",
+    "set_failover",
+    "ProxyPool",
+    "get_default_proxy_pool",
+    "set_default_proxy_pool",
+    "get_parse_executor",
+    "set_parse_executor",
+    "ALLOWED_BACKENDS",
+    "get_default_backend",
+    "set_default_backend",
     "save_json",
     "save_excel",
     "save_parquet",
+    "save_npz",
+    "RecordSpiller",
+    "SpilledDataset",
+    "SpatialStore",
+    "ColumnBatch",
     "ALLOWED_SOURCES",
+    "ALLOWED_FORMATS",
     "API_URLS",
     "WWW_URLS",
     "TOURNAMENT_URL_PATTERNS",
@@ -27,6 +54,7 @@ __all__ = [
     "set_tournament_url_patterns",
     "reset_tournament_url_patterns",
     "validate_source",
+    "validate_format",
     "validate_df",
     "safe_get",
     "build_tournament_url",
@@ -21,15 +21,50 @@ Usage:
 import asyncio
 import time
 import logging
+from contextvars import ContextVar
 from typing import Optional
+from urllib.parse import urlparse
 from curl_cffi.requests import AsyncSession
-from datafc.exceptions import APIError, RateLimitError, ServerError
+from datafc.exceptions import (
+    APIError, CacheMissError, CircuitOpenError, RateLimitError, ServerError,
+)
 from datafc.utils._config import SOFASCORE_HEADERS
-from datafc.utils._cache import get_default_cache
+from datafc.utils._cache import conditional_headers, get_default_cache
+from datafc.utils._circuit import OPEN, get_circuit_breaker
+from datafc.utils._executor import decode_json
+from datafc.utils._failover import get_failover, is_failover_error, latency_tracker, mirror_url
+from datafc.utils._proxy import as_proxy_pool, get_default_proxy_pool
+from datafc.utils._ratelimit import rate_limiter
 
 logger = logging.getLogger(__name__)
 
 
+class LazyAsyncSession:
+    """An ``AsyncSession`` opened on first use, so a run served from the cache never opens one."""
+
+    def __init__(self) -> None:
+        self._session: Optional[AsyncSession] = None
+
+    def get(self) -> AsyncSession:
+        if self._session is None:
+            self._session = AsyncSession(impersonate="chrome124")
+            self._session.headers.update(SOFASCORE_HEADERS)
+        return self._session
+
+    async def close(self) -> None:
+        session, self._session = self._session, None
+        if session is not None:
+            await session.close()
+
+
+# Set by the sync facade's background loop (``datafc.sofascore._bridge``) and the
+# streaming helpers so every client running under them reuses one long-lived
+# session instead of opening its own.
+shared_session: ContextVar[Optional[LazyAsyncSession]] = ContextVar(
+    "shared_session", default=None,
+)
+
+
 class AsyncSofascoreClient:
     """
     Async HTTP client for Sofascore API using curl_cffi AsyncSession.
@@ -37,9 +72,10 @@ class AsyncSofascoreClient:
     Designed for concurrent data fetching — e.g. fetching all 38 weeks of a
     season simultaneously instead of sequentially.
 
-    Rate limiting is class-level: all AsyncSofascoreClient instances in the same
-    event loop share a single lock and timestamp, so concurrent gather() calls
-    across multiple instances don't bypass the rate limit.
+    Rate limiting is process-wide and loop-agnostic: all clients — async ones on
+    any event loop or thread, and sync ``SofascoreClient`` instances — draw from
+    one shared limiter, so concurrent gather() calls, multiple loops and mixed
+    sync/async code can't bypass the rate limit.
 
     Args:
         rate_limit: Maximum requests per second. Defaults to 2.0.
@@ -47,13 +83,22 @@ class AsyncSofascoreClient:
         retries: Number of retry attempts on transient errors. Defaults to 3.
         cache: Optional DiskCache instance for response caching. Falls back to
                the module-level default cache set via ``set_default_cache()``.
-    """
+        offline: If True, serve responses from the cache only and raise
+                 ``CacheMissError`` on a miss. Defaults to the cache's own
+                 ``offline`` flag.
+        failover: If True, retry host-level failures on the sofascore/sofavpn
+                  mirror. Defaults to the global ``set_failover()`` setting.
+        hedge_percentile: With failover, send a second request to the mirror once
+                  the primary has been in flight longer than this percentile of
+                  its host's recent latencies. Defaults to ``set_failover()``.
+        proxies: Optional ``ProxyPool`` (or list of proxy URLs) to spread requests
+                 across. Each proxy gets its own ``rate_limit`` and health state, and
+                 the pool replaces the process-wide limiter. Falls back to
+                 ``set_default_proxy_pool()``.
 
-    # Class-level shared rate limiter.
-    # The lock is created lazily on first use inside a running event loop,
-    # and re-created if the previous loop was closed (e.g. successive asyncio.run() calls).
-    _class_lock: Optional[asyncio.Lock] = None
-    _class_last_request: float = 0.0
+    The AsyncSession is created lazily on the first cache miss, so fully cached
+    runs never open a network session.
+    """
 
     def __init__(
         self,
@@ -61,32 +106,55 @@ class AsyncSofascoreClient:
         timeout: int = 30,
         retries: int = 3,
         cache=None,
+        offline: Optional[bool] = None,
+        failover: Optional[bool] = None,
+        hedge_percentile: Optional[float] = None,
+        proxies=None,  # Optional[ProxyPool | list of proxy URLs]
     ) -> None:
         self._min_interval = 1.0 / rate_limit if rate_limit > 0 else 0.0
         self._timeout = timeout
         self._retries = retries
         self._cache = cache if cache is not None else get_default_cache()
+        self._offline = (
+            offline if offline is not None else bool(getattr(self._cache, "offline", False))
+        )
+        default_failover, default_hedge = get_failover()
+        self._failover = failover if failover is not None else default_failover
+        self._hedge_percentile = hedge_percentile if hedge_percentile is not None else default_hedge
+        self._proxies = as_proxy_pool(
+            proxies if proxies is not None else get_default_proxy_pool(), rate_limit,
+        )
         self._session: Optional[AsyncSession] = None
 
+    def _get_session(self) -> AsyncSession:
+        shared = shared_session.get()
+        if shared is not None:
+            return shared.get()
+        if self._session is None:
+            self._session = AsyncSession(impersonate="chrome124")
+            self._session.headers.update(SOFASCORE_HEADERS)
+        return self._session
+
     async def _rate_limit_wait(self) -> None:
-        # Re-create the class-level lock if it hasn't been created yet or if
-        # the event loop it was bound to is now closed (successive asyncio.run() calls).
-        if AsyncSofascoreClient._class_lock is None or (
-            hasattr(AsyncSofascoreClient._class_lock, "_loop")
-            and getattr(AsyncSofascoreClient._class_lock, "_loop", None) is not None
-            and AsyncSofascoreClient._class_lock._loop.is_closed()  # type: ignore[union-attr]
-        ):
-            AsyncSofascoreClient._class_lock = asyncio.Lock()
-        async with AsyncSofascoreClient._class_lock:
-            elapsed = time.monotonic() - AsyncSofascoreClient._class_last_request
-            if elapsed < self._min_interval:
-                await asyncio.sleep(self._min_interval - elapsed)
-            AsyncSofascoreClient._class_last_request = time.monotonic()
+        await rate_limiter.wait_async(self._min_interval)
+
+    async def _throttle(self) -> Optional[str]:
+        """Wait for a request slot; return the proxy to send through, if any."""
+        if self._proxies is None:
+            await self._rate_limit_wait()
+            return None
+        proxy, delay = self._proxies.acquire()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return proxy
 
     async def get(self, url: str) -> dict:
         """
         Perform an async GET request with optional caching, rate limiting, and retries.
 
+        With failover enabled, host-level failures are retried once on the mirror
+        host; with a hedge percentile set, slow requests are also raced against it.
+
         Args:
             url: Full URL to request.
 
@@ -94,68 +162,171 @@ class AsyncSofascoreClient:
             Parsed JSON response as a dict.
 
         Raises:
+            CacheMissError: In offline mode, if the URL is not cached.
+            CircuitOpenError: If the host's circuit breaker is open.
             RateLimitError: If the API returns 429 after all retries.
             ServerError: If the API returns a 5xx error after all retries.
             APIError: For other non-200 HTTP responses.
         """
+        # Expired entries with validators are revalidated instead of re-downloaded.
+        stale = None
         if self._cache is not None:
-            cached = self._cache.get(url)
+            cached, stale = self._cache.get(url, ignore_ttl=self._offline, return_stale=True)
             if cached is not None:
                 logger.debug("Cache hit: %s", url)
                 return cached
 
-        last_exc: Optional[Exception] = None
+        if self._offline:
+            raise CacheMissError(url)
+        mirror = mirror_url(url) if self._failover else None
 
-        for attempt in range(1, self._retries + 1):
-            await self._rate_limit_wait()
+        if mirror is not None and self._hedge_percentile is not None:
+            delay = latency_tracker.percentile(url, self._hedge_percentile)
+            if delay is not None:
+                return await self._hedged(url, mirror, stale, delay)
 
-            try:
-                response = await self._session.get(url, timeout=self._timeout)
+        try:
+            return await self._request(url, url, stale)
+        except APIError as exc:
+            if mirror is None or not is_failover_error(exc):
+                raise
+            logger.warning("Request to %s failed (%s). Failing over to %s", url, exc, mirror)
+            return await self._request(url, mirror, stale)
 
-                if response.status_code == 200:
-                    data = response.json()
-                    if not isinstance(data, dict):
-                        raise APIError(200, url, f"Non-dict JSON response ({type(data).__name__})")
-                    if self._cache is not None:
-                        self._cache.set(url, data)
-                    return data
+    async def _hedged(self, url: str, mirror: str, stale: Optional[dict], delay: float) -> dict:
+        """Send to the primary; if it is slower than ``delay``, race it against the mirror."""
+        primary = asyncio.ensure_future(self._request(url, url, stale))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            exc = primary.exception()
+            if exc is None:
+                return primary.result()
+            if not isinstance(exc, APIError) or not is_failover_error(exc):
+                raise exc
+            logger.warning("Request to %s failed (%s). Failing over to %s", url, exc, mirror)
+            return await self._request(url, mirror, stale)
 
-                if response.status_code == 429:
-                    wait = 2 ** attempt
-                    logger.warning(
-                        "Rate limited (429). Waiting %ds before retry %d/%d. URL: %s",
-                        wait, attempt, self._retries, url,
-                    )
-                    await asyncio.sleep(wait)
-                    last_exc = RateLimitError(429, url)
-                    continue
+        logger.debug("No response from %s after %.2fs, hedging to %s", url, delay, mirror)
+        pending = {primary, asyncio.ensure_future(self._request(url, mirror, stale))}
+        last_exc: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for fut in done:
+                    if fut.exception() is None:
+                        return fut.result()
+                    last_exc = fut.exception()
+        finally:
+            for fut in pending:
+                fut.cancel()
+        raise last_exc  # type: ignore[misc]
 
-                if response.status_code in (500, 502, 503, 504):
-                    wait = 2 ** attempt
-                    logger.warning(
-                        "Server error %d. Waiting %ds before retry %d/%d. URL: %s",
-                        response.status_code, wait, attempt, self._retries, url,
+    async def _request(self, url: str, target: str, stale: Optional[dict]) -> dict:
+        """Fetch ``target`` with retries; cache the result under ``url``."""
+        headers = conditional_headers(stale)
+        session = self._get_session()
+        breaker = get_circuit_breaker(urlparse(target).netloc)
+        last_exc: Optional[Exception] = None
+        attempt = 0
+
+        probing = False
+        try:
+            for attempt in range(1, self._retries + 1):
+                allowed, probing = breaker.allow()
+                if not allowed:
+                    raise CircuitOpenError(target, breaker.retry_after()) from last_exc
+                proxy = await self._throttle()
+
+                try:
+                    started = time.monotonic()
+                    response = await session.get(
+                        target, timeout=self._timeout, headers=headers or None, proxy=proxy,
                     )
-                    await asyncio.sleep(wait)
-                    last_exc = ServerError(response.status_code, url)
-                    continue
 
-                raise APIError(response.status_code, url)
+                    if response.status_code == 429 or response.status_code in (500, 502, 503, 504):
+                        breaker.record_failure()
+                        if proxy is not None:
+                            self._proxies.record_failure(proxy)
+                    else:
+                        breaker.record_success()
+                        if proxy is not None:
+                            self._proxies.record_success(proxy)
+                    # The outcome is recorded; the probe slot is no longer ours.
+                    probing = False
 
-            except (APIError, RateLimitError, ServerError):
-                raise
-            except Exception as exc:
-                logger.warning("Request failed (attempt %d/%d): %s", attempt, self._retries, exc)
-                last_exc = exc
-                await asyncio.sleep(2 ** attempt)
+                    if response.status_code == 304 and stale is not None:
+                        latency_tracker.record(target, time.monotonic() - started)
+                        logger.debug("Not modified, cache revalidated: %s", url)
+                        self._cache.touch(url)
+                        return stale["data"]
+
+                    if response.status_code == 200:
+                        latency_tracker.record(target, time.monotonic() - started)
+                        data = await decode_json(response.content)
+                        if not isinstance(data, dict):
+                            raise APIError(
+                                200, target, f"Non-dict JSON response ({type(data).__name__})",
+                            )
+                        if self._cache is not None:
+                            self._cache.set(
+                                url, data,
+                                etag=response.headers.get("ETag"),
+                                last_modified=response.headers.get("Last-Modified"),
+                            )
+                        return data
+
+                    if response.status_code == 429:
+                        last_exc = RateLimitError(429, target)
+                        if breaker.state == OPEN:
+                            break
+                        wait = 2 ** attempt
+                        logger.warning(
+                            "Rate limited (429). Waiting %ds before retry %d/%d. URL: %s",
+                            wait, attempt, self._retries, target,
+                        )
+                        await asyncio.sleep(wait)
+                        continue
+
+                    if response.status_code in (500, 502, 503, 504):
+                        last_exc = ServerError(response.status_code, target)
+                        if breaker.state == OPEN:
+                            break
+                        wait = 2 ** attempt
+                        logger.warning(
+                            "Server error %d. Waiting %ds before retry %d/%d. URL: %s",
+                            response.status_code, wait, attempt, self._retries, target,
+                        )
+                        await asyncio.sleep(wait)
+                        continue
+
+                    raise APIError(response.status_code, target)
+
+                except (APIError, RateLimitError, ServerError):
+                    raise
+                except Exception as exc:
+                    logger.warning(
+                        "Request failed (attempt %d/%d): %s", attempt, self._retries, exc,
+                    )
+                    breaker.record_failure()
+                    probing = False
+                    if proxy is not None:
+                        self._proxies.record_failure(proxy)
+                    last_exc = exc
+                    if breaker.state == OPEN:
+                        break
+                    await asyncio.sleep(2 ** attempt)
+        finally:
+            # A probe we own that ended without recording an outcome (cancelled
+            # by a hedge or deadline, KeyboardInterrupt) must not hold the
+            # circuit half-open forever.
+            if probing:
+                breaker.release_probe()
 
         if isinstance(last_exc, (RateLimitError, ServerError, APIError)):
             raise last_exc
-        raise APIError(0, url, f"All {self._retries} attempts failed") from last_exc
+        raise APIError(0, target, f"All {attempt} attempts failed") from last_exc
 
     async def __aenter__(self) -> "AsyncSofascoreClient":
-        self._session = AsyncSession(impersonate="chrome124")
-        self._session.headers.update(SOFASCORE_HEADERS)
         return self
 
     async def __aexit__(self, *_) -> None:
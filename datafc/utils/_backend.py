@@ -0,0 +1,291 @@
+"""
+Output backend of the fetch functions.
+
+By default every fetch function returns a NumPy-backed pandas DataFrame. The
+backend can be switched globally with ``set_default_backend`` or per call with
+the ``backend`` keyword that every sync and ``aio`` fetch function accepts:
+
+* ``"pandas"`` (default): NumPy-backed pandas DataFrame.
+* ``"pyarrow"``: pandas DataFrame whose columns are Arrow arrays
+  (``pd.ArrowDtype``; categoricals stay pandas categoricals). The Sofascore
+  functions build these straight from their column-oriented records, so
+  strings are stored as Arrow buffers rather than one Python object per row.
+* ``"arrow"``: a ``pyarrow.Table``. Built the same way and handed over without
+  copying, ready for ``pyarrow.parquet``, DuckDB or any Arrow consumer.
+* ``"polars"``: a ``polars.DataFrame``, created with ``polars.from_arrow`` from
+  that same table, so the data is never converted to NumPy or Python objects.
+
+For ``"arrow"`` and ``"polars"`` the frame a function works on internally is
+only a zero-copy pandas view of the Arrow columns (dictionary columns
+included). When the function returns that view unchanged, the table it was
+built from is returned as is (or passed to ``polars.from_arrow``); a frame
+that was modified or rebuilt is converted back with ``Table.from_pandas``.
+
+The Arrow backends require ``pyarrow`` (``pip install datafc[parquet]``), the
+Polars backend ``polars`` as well (``pip install datafc[polars]``).
+Functions that return a ``SpilledDataset`` (``spill_dir``) are unaffected.
+
+Usage:
+    from datafc import set_default_backend
+    from datafc.sofascore import lineups_data
+
+    table = lineups_data(match_df, backend="arrow")
+    set_default_backend("polars")
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+from typing import Any, Callable, List, Optional, TypeVar
+
+import pandas as pd
+
+from datafc.exceptions import InvalidParameterError
+
+ALLOWED_BACKENDS = ("pandas", "pyarrow", "arrow", "polars")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_default_backend: str = "pandas"
+
+# Backend of the fetch function call in progress, if any (see ``output_backend``).
+_active_backend: contextvars.ContextVar = contextvars.ContextVar(
+    "datafc_active_backend", default=None,
+)
+
+
+def get_default_backend() -> str:
+    """Return the output backend used when a call does not pass ``backend``."""
+    return _default_backend
+
+
+def set_default_backend(backend: str) -> None:
+    """
+    Select the output backend of all fetch functions.
+
+    Args:
+        backend: One of ``ALLOWED_BACKENDS``: ``"pandas"`` (default),
+            ``"pyarrow"`` (Arrow-backed pandas), ``"arrow"`` (``pyarrow.Table``)
+            or ``"polars"`` (``polars.DataFrame``).
+
+    Raises:
+        InvalidParameterError: If backend is not one of ``ALLOWED_BACKENDS``.
+        ImportError: If the backend's library (pyarrow, polars) is not installed.
+    """
+    global _default_backend
+    _default_backend = validate_backend(backend)
+
+
+def validate_backend(backend: str) -> str:
+    if backend not in ALLOWED_BACKENDS:
+        raise InvalidParameterError(
+            f"Invalid backend '{backend}'. Must be one of: {', '.join(ALLOWED_BACKENDS)}."
+        )
+    if backend != "pandas":
+        require_pyarrow()
+    if backend == "polars":
+        require_polars()
+    return backend
+
+
+def current_backend() -> str:
+    """Backend frames should be built with: the active call's, else the default."""
+    return _active_backend.get() or _default_backend
+
+
+def require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "Arrow output requires pyarrow. Install it with: pip install pyarrow"
+        ) from None
+    return pyarrow
+
+
+def require_polars():
+    try:
+        import polars
+    except ImportError:
+        raise ImportError(
+            "Polars output requires polars. Install it with: pip install polars"
+        ) from None
+    return polars
+
+
+def _arrow_types(arrow_type):
+    # Dictionary columns become pandas categoricals; everything else stays Arrow.
+    pa = require_pyarrow()
+    return None if pa.types.is_dictionary(arrow_type) else pd.ArrowDtype(arrow_type)
+
+
+def arrow_to_pandas(table, categoricals: bool = True) -> pd.DataFrame:
+    """Wrap a ``pyarrow.Table`` as an Arrow-backed pandas DataFrame.
+
+    With ``categoricals=False`` dictionary columns stay Arrow as well, so the
+    frame is a pure zero-copy view of ``table``.
+    """
+    return table.to_pandas(types_mapper=_arrow_types if categoricals else pd.ArrowDtype)
+
+
+# Attribute of a frame from ``arrow_frame``: the table it views and its columns.
+_SOURCE_TABLE = "_datafc_source_table"
+
+
+def _column_arrays(df: pd.DataFrame) -> list:
+    return [
+        (name, df.iloc[:, pos].array.__arrow_array__()) for pos, name in enumerate(df.columns)
+    ]
+
+
+def arrow_frame(table, backend: str) -> pd.DataFrame:
+    """Wrap a table built for an Arrow ``backend`` as the frame a fetch function works on.
+
+    For ``"arrow"`` and ``"polars"`` the frame remembers ``table`` so that
+    ``to_backend`` can return it directly if the frame comes back unchanged.
+    """
+    frame = arrow_to_pandas(table, backend == "pyarrow")
+    if backend in ("arrow", "polars"):
+        object.__setattr__(frame, _SOURCE_TABLE, (table, _column_arrays(frame)))
+    return frame
+
+
+def _source_table(df: pd.DataFrame):
+    """The table ``df`` was built from, or None if ``df`` has been modified since."""
+    source = getattr(df, _SOURCE_TABLE, None)
+    if source is None:
+        return None
+    table, arrays = source
+    current = _column_arrays(df)
+    if len(current) != len(arrays) or any(
+        name != old_name or array is not old_array
+        for (name, array), (old_name, old_array) in zip(current, arrays)
+    ):
+        return None
+    return table
+
+
+def _is_arrow_backed(df: pd.DataFrame) -> bool:
+    return all(
+        isinstance(dtype, (pd.ArrowDtype, pd.CategoricalDtype)) for dtype in df.dtypes
+    )
+
+
+def to_backend(result: Any, backend: str) -> Any:
+    """Convert a fetch function's pandas result to ``backend``; other results pass through."""
+    if backend == "pandas" or not isinstance(result, pd.DataFrame):
+        return result
+    pa = require_pyarrow()
+    if backend == "pyarrow":
+        if _is_arrow_backed(result):
+            return result
+        return arrow_to_pandas(pa.Table.from_pandas(result, preserve_index=False))
+    table = _source_table(result)
+    if table is None:
+        table = pa.Table.from_pandas(result, preserve_index=False).replace_schema_metadata(None)
+    if backend == "polars":
+        return require_polars().from_arrow(table)
+    return table
+
+
+def as_input_frame(df: Any) -> Any:
+    """Accept a ``pyarrow.Table`` or ``polars.DataFrame`` from an earlier call as input frame."""
+    if isinstance(df, pd.DataFrame):
+        return df
+    module = type(df).__module__.split(".")[0]
+    if module == "polars":
+        return arrow_to_pandas(df.to_arrow())
+    if module == "pyarrow":
+        return arrow_to_pandas(df)
+    return df
+
+
+def concat_results(frames: List[Any]) -> Any:
+    """Concatenate per-row results of one backend (used by the streaming helpers)."""
+    if not frames:
+        return pd.DataFrame()
+    module = type(frames[0]).__module__.split(".")[0]
+    if module == "polars":
+        return require_polars().concat(frames, how="diagonal_relaxed")
+    if module == "pyarrow":
+        pa = require_pyarrow()
+        try:
+            return pa.concat_tables(frames, promote_options="default")
+        except TypeError:  # pyarrow < 14
+            return pa.concat_tables(frames, promote=True)
+    return pd.concat(frames, ignore_index=True)
+
+
+def drop_seen(frame: Any, column: str, seen: set) -> Any:
+    """Drop the rows of a per-unit result whose ``column`` value is in ``seen``, then
+    add the remaining values to ``seen`` (used by the streaming helpers)."""
+    module = type(frame).__module__.split(".")[0]
+    if module == "polars":
+        values = frame.get_column(column).to_list()
+    elif module == "pyarrow":
+        values = frame.column(column).to_pylist()
+    else:
+        values = frame[column].tolist()
+    keep = [value not in seen for value in values]
+    seen.update(values)
+    if all(keep):
+        return frame
+    if module == "polars":
+        return frame.filter(require_polars().Series(keep))
+    if module == "pyarrow":
+        return frame.filter(require_pyarrow().array(keep))
+    return frame[keep].reset_index(drop=True)
+
+
+def _with_backend_param(fn: Callable) -> inspect.Signature:
+    sig = inspect.signature(fn)
+    param = inspect.Parameter(
+        "backend", inspect.Parameter.KEYWORD_ONLY, default=None, annotation=Optional[str],
+    )
+    return sig.replace(parameters=[*sig.parameters.values(), param])
+
+
+def output_backend(fn: F) -> F:
+    """Decorate a fetch function (sync or async) with a ``backend`` keyword.
+
+    The backend is active while the function runs, so ``build_frame`` can
+    build Arrow columns directly, and the result is converted on return. A
+    ``pyarrow.Table`` or ``polars.DataFrame`` passed as the input frame (the
+    first argument, or a ``*_df`` keyword) is accepted as well.
+    """
+
+    def _enter(args: tuple, kwargs: dict, backend: Optional[str]):
+        backend = validate_backend(backend) if backend is not None else current_backend()
+        if args:
+            args = (as_input_frame(args[0]),) + tuple(args[1:])
+        for name, value in kwargs.items():
+            if name.endswith("_df"):
+                kwargs[name] = as_input_frame(value)
+        return args, backend, _active_backend.set(backend)
+
+    if asyncio.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def async_wrapper(*args: Any, backend: Optional[str] = None, **kwargs: Any) -> Any:
+            args, backend, token = _enter(args, kwargs, backend)
+            try:
+                return to_backend(await fn(*args, **kwargs), backend)
+            finally:
+                _active_backend.reset(token)
+
+        wrapper: Callable = async_wrapper
+    else:
+
+        @functools.wraps(fn)
+        def sync_wrapper(*args: Any, backend: Optional[str] = None, **kwargs: Any) -> Any:
+            args, backend, token = _enter(args, kwargs, backend)
+            try:
+                return to_backend(fn(*args, **kwargs), backend)
+            finally:
+                _active_backend.reset(token)
+
+        wrapper = sync_wrapper
+
+    wrapper.__signature__ = _with_backend_param(fn)  # type: ignore[attr-defined]
+    return wrapper  # type: ignore[return-value]
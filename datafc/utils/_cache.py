@@ -12,11 +12,18 @@ Usage:
     cache = DiskCache(cache_dir=".datafc_cache", ttl_hours=24)
     df = match_data(52, 63814, 21, cache=cache)  # first call hits API
     df = match_data(52, 63814, 21, cache=cache)  # second call reads from disk
+
+    # Offline: serve only from disk, never open an HTTP session
+    offline = DiskCache(cache_dir=".datafc_cache", offline=True)
+    df = match_data(52, 63814, 21, cache=offline)
 """
 
 import hashlib
 import json
 import logging
+import os
+import tempfile
+import threading
 import time
 from pathlib import Path
 from typing import Optional
@@ -24,23 +31,39 @@ from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
 
 logger = logging.getLogger(__name__)
 
+# ``set`` writes ``ts`` first, so ``touch`` can rewrite it in place.
+_TS_PREFIX = '{"ts": '
+
 
 class DiskCache:
     """
     Simple file-based cache that stores API responses as JSON on disk.
 
+    Safe to share between threads (and processes using the same directory):
+    entries are written atomically, so a reader sees either the old or the new
+    entry, never a partial one.
+
     Args:
         cache_dir: Directory where cached responses are stored. Created automatically
                    if it does not exist. Defaults to '.datafc_cache'.
         ttl_hours: Time-to-live in hours. Entries older than this are considered
                    stale and re-fetched. Use 0 to disable TTL (cache forever).
                    Defaults to 24.0.
+        offline: If True, clients using this cache serve responses from disk only and
+                 raise ``CacheMissError`` instead of touching the network. TTL is
+                 ignored so stale entries are still served. Defaults to False.
     """
 
-    def __init__(self, cache_dir: str = ".datafc_cache", ttl_hours: float = 24.0) -> None:
+    def __init__(
+        self,
+        cache_dir: str = ".datafc_cache",
+        ttl_hours: float = 24.0,
+        offline: bool = False,
+    ) -> None:
         self._dir = Path(cache_dir)
         self._dir.mkdir(parents=True, exist_ok=True)
         self._ttl = ttl_hours * 3600 if ttl_hours > 0 else None
+        self.offline = offline
 
     @staticmethod
     def _normalize_url(url: str) -> str:
@@ -53,30 +76,106 @@ class DiskCache:
         key = hashlib.md5(self._normalize_url(url).encode("utf-8"), usedforsecurity=False).hexdigest()
         return self._dir / f"{key}.json"
 
-    def get(self, url: str) -> Optional[dict]:
-        """Return cached data for url, or None if missing or expired."""
-        path = self._path(url)
-        if not path.exists():
+    def _read(self, path: Path) -> Optional[dict]:
+        """Load a raw entry, removing it if it is corrupt."""
+        try:
+            text = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            # Removed by another thread or process since the exists() check.
             return None
         try:
-            entry = json.loads(path.read_text(encoding="utf-8"))
-            if self._ttl is not None and time.time() - entry["ts"] > self._ttl:
-                path.unlink(missing_ok=True)
-                return None
-            return entry["data"]
+            entry = json.loads(text)
+            if "ts" not in entry or "data" not in entry:
+                raise KeyError("ts/data")
+            return entry
         except Exception as e:
             logger.warning("Corrupt cache entry for %s, removing: %s", path.name, e)
             path.unlink(missing_ok=True)
             return None
 
-    def set(self, url: str, data: dict) -> None:
-        """Write data to cache for url."""
+    def get(self, url: str, ignore_ttl: bool = False, return_stale: bool = False):
+        """Return cached data for url, or None if missing or expired.
+
+        Expired entries that carry validators (ETag / Last-Modified) are kept on
+        disk so the client can revalidate them with a conditional request.
+
+        Args:
+            url: Request URL.
+            ignore_ttl: Return the entry even if it is older than ``ttl_hours``
+                (used in offline mode). Expired entries are not removed.
+            return_stale: Return ``(data, stale)`` instead, where ``stale`` is
+                the raw expired entry kept for revalidation (None otherwise).
+                Saves the client a second read of the same file.
+        """
+        data, stale = None, None
+        path = self._path(url)
+        entry = self._read(path) if path.exists() else None
+        if entry is None:
+            pass
+        elif ignore_ttl or self._ttl is None or time.time() - entry["ts"] <= self._ttl:
+            data = entry["data"]
+        elif entry.get("etag") or entry.get("last_modified"):
+            stale = entry
+        else:
+            path.unlink(missing_ok=True)
+        return (data, stale) if return_stale else data
+
+    def get_entry(self, url: str) -> Optional[dict]:
+        """Return the raw entry (``ts``, ``data``, ``etag``, ``last_modified``) regardless of TTL."""
+        path = self._path(url)
+        if not path.exists():
+            return None
+        return self._read(path)
+
+    def set(
+        self,
+        url: str,
+        data: dict,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Write data to cache for url, along with optional HTTP validators."""
+        path = self._path(url)
+        entry = {"ts": time.time(), "data": data}
+        if etag:
+            entry["etag"] = etag
+        if last_modified:
+            entry["last_modified"] = last_modified
+        try:
+            self._write_atomic(path, json.dumps(entry, ensure_ascii=False))
+        except Exception as e:
+            logger.warning("Cache write failed for %s: %s", path.name, e)
+
+    def _write_atomic(self, path: Path, text: str) -> None:
+        """Write via a temp file + ``os.replace`` so readers never see a partial entry."""
+        fd, tmp = tempfile.mkstemp(dir=self._dir, prefix=path.stem, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(text)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def touch(self, url: str) -> None:
+        """Reset the timestamp of an existing entry (after a 304 Not Modified).
+
+        Only the leading ``{"ts": ...`` of the file is rewritten; the cached
+        body is copied through as text, not parsed and re-serialized.
+        """
         path = self._path(url)
         try:
-            path.write_text(
-                json.dumps({"ts": time.time(), "data": data}, ensure_ascii=False),
-                encoding="utf-8",
-            )
+            text = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return
+        end = text.find(",", len(_TS_PREFIX)) if text.startswith(_TS_PREFIX) else -1
+        if end == -1:
+            entry = self._read(path)
+            if entry is not None:
+                self.set(url, entry["data"], entry.get("etag"), entry.get("last_modified"))
+            return
+        try:
+            self._write_atomic(path, f"{_TS_PREFIX}{time.time()!r}{text[end:]}")
         except Exception as e:
             logger.warning("Cache write failed for %s: %s", path.name, e)
 
@@ -92,22 +191,38 @@ class DiskCache:
             Number of entries removed.
         """
         if url is not None:
-            path = self._path(url)
-            if path.exists():
-                path.unlink()
-                return 1
-            return 0
+            try:
+                self._path(url).unlink()
+            except FileNotFoundError:
+                return 0
+            return 1
 
         count = 0
         for f in self._dir.glob("*.json"):
-            f.unlink()
+            try:
+                f.unlink()
+            except FileNotFoundError:
+                continue
             count += 1
         return count
 
     def __repr__(self) -> str:
         entries = len(list(self._dir.glob("*.json")))
         ttl_str = f"{self._ttl / 3600:.1f}" if self._ttl is not None else "disabled"
-        return f"DiskCache(dir={self._dir!r}, ttl_hours={ttl_str}, entries={entries})"
+        offline_str = ", offline=True" if self.offline else ""
+        return f"DiskCache(dir={self._dir!r}, ttl_hours={ttl_str}, entries={entries}{offline_str})"
+
+
+def conditional_headers(entry: Optional[dict]) -> dict:
+    """Build If-None-Match / If-Modified-Since headers from a cache entry's validators."""
+    if not entry:
+        return {}
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
 
 
 # ---------------------------------------------------------------------------
@@ -115,11 +230,13 @@ class DiskCache:
 # ---------------------------------------------------------------------------
 
 _default_cache: Optional["DiskCache"] = None
+_default_cache_lock = threading.Lock()
 
 
 def get_default_cache() -> Optional["DiskCache"]:
     """Return the module-level default cache, or None if not set."""
-    return _default_cache
+    with _default_cache_lock:
+        return _default_cache
 
 
 def set_default_cache(cache: Optional["DiskCache"]) -> None:
@@ -139,4 +256,5 @@ def set_default_cache(cache: Optional["DiskCache"]) -> None:
         set_default_cache(None)  # Disables the default cache.
     """
     global _default_cache
-    _default_cache = cache
+    with _default_cache_lock:
+        _default_cache = cache
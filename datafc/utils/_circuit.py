@@ -0,0 +1,174 @@
+"""
+Per-host circuit breaker shared by the Sofascore clients.
+
+When a host keeps failing (connection errors, 429, 5xx), every further request
+would otherwise burn ``retries × 2**attempt`` seconds of back-off before giving
+up. The breaker opens after ``failure_threshold`` consecutive failures and makes
+requests to that host fail immediately with ``CircuitOpenError``. Once
+``recovery_timeout`` seconds have passed, a single half-open probe request is
+let through: success closes the circuit, failure re-opens it.
+
+Breakers are process-wide and keyed by host (e.g. ``api.sofascore.com``), so all
+client instances — sync and async — see the same state.
+
+Usage:
+    from datafc import set_circuit_breaker
+
+    set_circuit_breaker(failure_threshold=3, recovery_timeout=60)
+    set_circuit_breaker(failure_threshold=0)  # disable
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for a single host.
+
+    Args:
+        host: Host name, used in log messages.
+        failure_threshold: Consecutive failures that open the circuit. 0 disables it.
+        recovery_timeout: Seconds the circuit stays open before a half-open probe.
+    """
+
+    def __init__(self, host: str, failure_threshold: int = 5, recovery_timeout: float = 30.0) -> None:
+        self.host = host
+        self._threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until the next half-open probe is allowed (0 if not open)."""
+        if self._state != OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self._recovery_timeout - time.monotonic())
+
+    def allow(self) -> Tuple[bool, bool]:
+        """Return ``(allowed, probe)`` for a request to this host.
+
+        ``allowed`` is True if the request may be sent now; ``probe`` is True if
+        this caller took the half-open probe slot and so must end it with
+        ``record_success``, ``record_failure`` or ``release_probe``. Both are
+        decided under the lock, so two callers can never both hold the probe.
+        """
+        if self._threshold <= 0:
+            return True, False
+        with self._lock:
+            if self._state == CLOSED:
+                return True, False
+            if self._state == OPEN:
+                if time.monotonic() - self._opened_at < self._recovery_timeout:
+                    return False, False
+                logger.info("Circuit half-open for %s, sending probe request.", self.host)
+                self._state = HALF_OPEN
+                self._probe_in_flight = True
+                return True, True
+            # HALF_OPEN: only one probe at a time.
+            if self._probe_in_flight:
+                return False, False
+            self._probe_in_flight = True
+            return True, True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info("Circuit closed for %s.", self.host)
+            self._state = CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Free a half-open probe slot whose request ended without an outcome.
+
+        Called by the probe's owner (see ``allow``) when the probe is cancelled
+        or interrupted before ``record_success`` / ``record_failure``; the next
+        request probes instead.
+        """
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        if self._threshold <= 0:
+            return
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == HALF_OPEN or self._failures >= self._threshold:
+                if self._state != OPEN:
+                    logger.warning(
+                        "Circuit opened for %s after %d consecutive failure(s); "
+                        "failing fast for %.0fs.",
+                        self.host, self._failures, self._recovery_timeout,
+                    )
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+
+    def __repr__(self) -> str:
+        return f"CircuitBreaker(host={self.host!r}, state={self._state!r}, failures={self._failures})"
+
+
+# ---------------------------------------------------------------------------
+# Module-level registry
+# ---------------------------------------------------------------------------
+
+_failure_threshold: int = 5
+_recovery_timeout: float = 30.0
+_breakers: Dict[str, CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+
+def get_circuit_breaker(host: str) -> CircuitBreaker:
+    """Return the shared breaker for ``host``, creating it on first use."""
+    with _registry_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(host, _failure_threshold, _recovery_timeout)
+            _breakers[host] = breaker
+        return breaker
+
+
+def set_circuit_breaker(failure_threshold: int = 5, recovery_timeout: float = 30.0) -> None:
+    """
+    Configure the per-host circuit breakers used by all Sofascore clients.
+
+    Existing breaker state is discarded.
+
+    Args:
+        failure_threshold: Consecutive failures that open a host's circuit.
+            Use 0 to disable circuit breaking. Defaults to 5.
+        recovery_timeout: Seconds an open circuit waits before letting a single
+            half-open probe through. Defaults to 30.
+    """
+    global _failure_threshold, _recovery_timeout
+    if failure_threshold < 0:
+        raise ValueError("failure_threshold must be >= 0.")
+    if recovery_timeout < 0:
+        raise ValueError("recovery_timeout must be >= 0.")
+    with _registry_lock:
+        _failure_threshold = failure_threshold
+        _recovery_timeout = recovery_timeout
+        _breakers.clear()
+
+
+def reset_circuit_breakers() -> None:
+    """Close all circuits by discarding their state."""
+    with _registry_lock:
+        _breakers.clear()
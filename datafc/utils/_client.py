@@ -1,22 +1,63 @@
 import time
 import threading
 import logging
-from typing import Optional
+from contextvars import ContextVar
+from typing import List, Optional
+from urllib.parse import urlparse
 from curl_cffi import requests as cf_requests
-from datafc.exceptions import APIError, RateLimitError, ServerError
+from datafc.exceptions import (
+    APIError, CacheMissError, CircuitOpenError, RateLimitError, ServerError,
+)
 from datafc.utils._config import SOFASCORE_HEADERS
-from datafc.utils._cache import get_default_cache
+from datafc.utils._cache import conditional_headers, get_default_cache
+from datafc.utils._circuit import OPEN, get_circuit_breaker
+from datafc.utils._failover import get_failover, is_failover_error, latency_tracker, mirror_url
+from datafc.utils._proxy import as_proxy_pool, get_default_proxy_pool
+from datafc.utils._ratelimit import rate_limiter
 
 logger = logging.getLogger(__name__)
 
 
+def _new_session() -> cf_requests.Session:
+    session = cf_requests.Session(impersonate="chrome124")
+    session.headers.update(SOFASCORE_HEADERS)
+    return session
+
+
+class LazySession:
+    """A session opened on first use, so a run served from the cache never opens one."""
+
+    def __init__(self) -> None:
+        self._session: Optional[cf_requests.Session] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> cf_requests.Session:
+        with self._lock:
+            if self._session is None:
+                self._session = _new_session()
+            return self._session
+
+    def close(self) -> None:
+        with self._lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+
+# Set by the streaming helpers (``datafc.sofascore._stream``) so the many short-lived
+# clients they create reuse one session instead of reconnecting per call.
+shared_session: ContextVar[Optional[LazySession]] = ContextVar(
+    "shared_sync_session", default=None,
+)
+
+
 class SofascoreClient:
     """
     HTTP client for Sofascore API using curl_cffi to bypass Cloudflare TLS fingerprinting.
 
-    Rate limiting is class-level: all SofascoreClient instances share a single
-    lock and timestamp, so the total request rate across the process never
-    exceeds the most conservative instance's configured limit.
+    Rate limiting is process-wide: all SofascoreClient and AsyncSofascoreClient
+    instances draw from one shared limiter, so the total request rate across the
+    process never exceeds the most conservative instance's configured limit.
 
     Args:
         rate_limit: Maximum requests per second. Defaults to 2.0.
@@ -25,12 +66,24 @@ class SofascoreClient:
         cache: Optional DiskCache instance. When provided, responses are read from and
                written to disk so identical URLs are not fetched twice. Falls back to
                the module-level default cache set via ``set_default_cache()``.
-    """
+        offline: If True, serve responses from the cache only and raise
+                 ``CacheMissError`` on a miss. Defaults to the cache's own
+                 ``offline`` flag.
+        failover: If True, retry host-level failures on the sofascore/sofavpn
+                  mirror. Defaults to the global ``set_failover()`` setting.
+        proxies: Optional ``ProxyPool`` (or list of proxy URLs) to spread requests
+                 across. Each proxy gets its own ``rate_limit`` and health state, and
+                 the pool replaces the process-wide limiter. Falls back to
+                 ``set_default_proxy_pool()``.
+
+    The underlying curl_cffi session is created lazily on the first cache miss,
+    so fully cached runs never open a network session.
 
-    # Class-level shared rate limiter — prevents multiple instances from
-    # independently hammering the API at their individual limits.
-    _class_lock: threading.Lock = threading.Lock()
-    _class_last_request_time: float = 0.0
+    The client is thread-safe: curl_cffi sessions cannot be shared across threads,
+    so each thread calling ``get`` lazily gets its own session, while the rate
+    limiter, cache, circuit breakers and proxy pool are shared. One instance can
+    serve a web app's worker threads or a ``ThreadPoolExecutor``.
+    """
 
     def __init__(
         self,
@@ -38,27 +91,66 @@ class SofascoreClient:
         timeout: int = 30,
         retries: int = 3,
         cache=None,  # Optional[DiskCache] — avoid import cycle
+        offline: Optional[bool] = None,
+        failover: Optional[bool] = None,
+        proxies=None,  # Optional[ProxyPool | list of proxy URLs]
     ) -> None:
         self._min_interval = 1.0 / rate_limit if rate_limit > 0 else 0.0
         self._timeout = timeout
         self._retries = retries
         self._cache = cache if cache is not None else get_default_cache()
-        self._session = cf_requests.Session(impersonate="chrome124")
-        self._session.headers.update(SOFASCORE_HEADERS)
+        self._offline = (
+            offline if offline is not None else bool(getattr(self._cache, "offline", False))
+        )
+        self._failover = failover if failover is not None else get_failover()[0]
+        self._proxies = as_proxy_pool(
+            proxies if proxies is not None else get_default_proxy_pool(), rate_limit,
+        )
+        self._local = threading.local()
+        self._sessions: List[cf_requests.Session] = []
+        self._sessions_lock = threading.Lock()
+
+    @property
+    def cache(self):
+        """The DiskCache used by this client, or None."""
+        return self._cache
+
+    @property
+    def offline(self) -> bool:
+        return self._offline
+
+    def _get_session(self) -> cf_requests.Session:
+        shared = shared_session.get()
+        if shared is not None:
+            return shared.get()
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = _new_session()
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
 
     def _rate_limit_wait(self) -> None:
-        with SofascoreClient._class_lock:
-            elapsed = time.monotonic() - SofascoreClient._class_last_request_time
-            if elapsed < self._min_interval:
-                time.sleep(self._min_interval - elapsed)
-            SofascoreClient._class_last_request_time = time.monotonic()
+        rate_limiter.wait(self._min_interval)
+
+    def _throttle(self) -> Optional[str]:
+        """Wait for a request slot; return the proxy to send through, if any."""
+        if self._proxies is None:
+            self._rate_limit_wait()
+            return None
+        proxy, delay = self._proxies.acquire()
+        if delay > 0:
+            time.sleep(delay)
+        return proxy
 
     def get(self, url: str) -> dict:
         """
         Perform a GET request with optional caching, rate limiting, and retry logic.
 
         Cached responses are returned immediately without counting against the rate
-        limit or consuming a retry attempt.
+        limit or consuming a retry attempt. With failover enabled, host-level
+        failures are retried once on the mirror host.
 
         Args:
             url: Full URL to request.
@@ -67,67 +159,144 @@ class SofascoreClient:
             Parsed JSON response as a dict.
 
         Raises:
+            CacheMissError: In offline mode, if the URL is not cached.
+            CircuitOpenError: If the host's circuit breaker is open.
             RateLimitError: If the API returns 429 after all retries.
             ServerError: If the API returns a 5xx error after all retries.
             APIError: For other non-200 HTTP responses.
         """
+        # Expired entries with validators are revalidated instead of re-downloaded.
+        stale = None
         if self._cache is not None:
-            cached = self._cache.get(url)
+            cached, stale = self._cache.get(url, ignore_ttl=self._offline, return_stale=True)
             if cached is not None:
                 logger.debug("Cache hit: %s", url)
                 return cached
 
-        last_exc: Optional[Exception] = None
+        if self._offline:
+            raise CacheMissError(url)
 
-        for attempt in range(1, self._retries + 1):
-            self._rate_limit_wait()
+        try:
+            return self._request(url, url, stale)
+        except APIError as exc:
+            mirror = mirror_url(url) if self._failover else None
+            if mirror is None or not is_failover_error(exc):
+                raise
+            logger.warning("Request to %s failed (%s). Failing over to %s", url, exc, mirror)
+            return self._request(url, mirror, stale)
 
-            try:
-                response = self._session.get(url, timeout=self._timeout)
+    def _request(self, url: str, target: str, stale: Optional[dict]) -> dict:
+        """Fetch ``target`` with retries; cache the result under ``url``."""
+        headers = conditional_headers(stale)
+        session = self._get_session()
+        breaker = get_circuit_breaker(urlparse(target).netloc)
+        last_exc: Optional[Exception] = None
+        attempt = 0
 
-                if response.status_code == 200:
-                    data = response.json()
-                    if not isinstance(data, dict):
-                        raise APIError(200, url, f"Non-dict JSON response ({type(data).__name__})")
-                    if self._cache is not None:
-                        self._cache.set(url, data)
-                    return data
+        probing = False
+        try:
+            for attempt in range(1, self._retries + 1):
+                allowed, probing = breaker.allow()
+                if not allowed:
+                    raise CircuitOpenError(target, breaker.retry_after()) from last_exc
+                proxy = self._throttle()
 
-                if response.status_code == 429:
-                    wait = 2 ** attempt
-                    logger.warning(
-                        "Rate limited (429). Waiting %ds before retry %d/%d. URL: %s",
-                        wait, attempt, self._retries, url,
+                try:
+                    started = time.monotonic()
+                    response = session.get(
+                        target, timeout=self._timeout, headers=headers or None, proxy=proxy,
                     )
-                    time.sleep(wait)
-                    last_exc = RateLimitError(429, url)
-                    continue
 
-                if response.status_code in (500, 502, 503, 504):
-                    wait = 2 ** attempt
-                    logger.warning(
-                        "Server error %d. Waiting %ds before retry %d/%d. URL: %s",
-                        response.status_code, wait, attempt, self._retries, url,
-                    )
-                    time.sleep(wait)
-                    last_exc = ServerError(response.status_code, url)
-                    continue
+                    if response.status_code == 429 or response.status_code in (500, 502, 503, 504):
+                        breaker.record_failure()
+                        if proxy is not None:
+                            self._proxies.record_failure(proxy)
+                    else:
+                        breaker.record_success()
+                        if proxy is not None:
+                            self._proxies.record_success(proxy)
+                    # The outcome is recorded; the probe slot is no longer ours.
+                    probing = False
 
-                raise APIError(response.status_code, url)
+                    if response.status_code == 304 and stale is not None:
+                        latency_tracker.record(target, time.monotonic() - started)
+                        logger.debug("Not modified, cache revalidated: %s", url)
+                        self._cache.touch(url)
+                        return stale["data"]
 
-            except (APIError, RateLimitError, ServerError):
-                raise
-            except Exception as exc:
-                logger.warning("Request failed (attempt %d/%d): %s", attempt, self._retries, exc)
-                last_exc = exc
-                time.sleep(2 ** attempt)
+                    if response.status_code == 200:
+                        latency_tracker.record(target, time.monotonic() - started)
+                        data = response.json()
+                        if not isinstance(data, dict):
+                            raise APIError(
+                                200, target, f"Non-dict JSON response ({type(data).__name__})",
+                            )
+                        if self._cache is not None:
+                            self._cache.set(
+                                url, data,
+                                etag=response.headers.get("ETag"),
+                                last_modified=response.headers.get("Last-Modified"),
+                            )
+                        return data
+
+                    if response.status_code == 429:
+                        last_exc = RateLimitError(429, target)
+                        if breaker.state == OPEN:
+                            break
+                        wait = 2 ** attempt
+                        logger.warning(
+                            "Rate limited (429). Waiting %ds before retry %d/%d. URL: %s",
+                            wait, attempt, self._retries, target,
+                        )
+                        time.sleep(wait)
+                        continue
+
+                    if response.status_code in (500, 502, 503, 504):
+                        last_exc = ServerError(response.status_code, target)
+                        if breaker.state == OPEN:
+                            break
+                        wait = 2 ** attempt
+                        logger.warning(
+                            "Server error %d. Waiting %ds before retry %d/%d. URL: %s",
+                            response.status_code, wait, attempt, self._retries, target,
+                        )
+                        time.sleep(wait)
+                        continue
+
+                    raise APIError(response.status_code, target)
+
+                except (APIError, RateLimitError, ServerError):
+                    raise
+                except Exception as exc:
+                    logger.warning(
+                        "Request failed (attempt %d/%d): %s", attempt, self._retries, exc,
+                    )
+                    breaker.record_failure()
+                    probing = False
+                    if proxy is not None:
+                        self._proxies.record_failure(proxy)
+                    last_exc = exc
+                    if breaker.state == OPEN:
+                        break
+                    time.sleep(2 ** attempt)
+        finally:
+            # A probe we own that ended without recording an outcome (cancelled
+            # by a hedge or deadline, KeyboardInterrupt) must not hold the
+            # circuit half-open forever.
+            if probing:
+                breaker.release_probe()
 
         if isinstance(last_exc, (RateLimitError, ServerError, APIError)):
             raise last_exc
-        raise APIError(0, url, f"All {self._retries} attempts failed") from last_exc
+        raise APIError(0, target, f"All {attempt} attempts failed") from last_exc
 
     def close(self) -> None:
-        self._session.close()
+        """Close the sessions of all threads; later calls open new ones."""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+            self._local = threading.local()
+        for session in sessions:
+            session.close()
 
     def __enter__(self) -> "SofascoreClient":
         return self
@@ -0,0 +1,96 @@
+"""
+Column-oriented record container used by the response parsers.
+
+Building a list of dicts costs one dict per row, with the same keys (``country``,
+``tournament``, ``season``, ``week``, ``game_id``, ...) repeated on every row,
+and ``pd.DataFrame(records)`` then has to walk every dict again to line the
+keys up. A ``ColumnBatch`` is a plain ``{column: [values]}`` dict instead:
+parsers append straight into per-column lists (constant columns are a single
+``[value] * n``), batches from many matches are concatenated list by list, and
+``pd.DataFrame(batch)`` takes the fast dict-of-lists constructor.
+
+Because it is a dict of equal-length lists, a batch can be passed anywhere a
+DataFrame constructor argument is expected.
+"""
+
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Union
+
+
+class ColumnBatch(dict):
+    """
+    ``{column: [values]}`` with one equal-length list per column.
+
+    Args:
+        columns: Column names in output order; each starts as an empty list.
+    """
+
+    def __init__(self, columns: Sequence[str] = ()) -> None:
+        super().__init__((column, []) for column in columns)
+
+    @property
+    def num_rows(self) -> int:
+        return max(map(len, self.values()), default=0)
+
+    def column_lists(self, *columns: str) -> List[list]:
+        """Return the value lists of ``columns``, for appending in a loop."""
+        return [self[column] for column in columns]
+
+    def broadcast(self, **values: Any) -> "ColumnBatch":
+        """Set each named column to its value repeated for every row; return self."""
+        n = self.num_rows
+        for column, value in values.items():
+            self[column] = [value] * n
+        return self
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Add one row given as a dict; missing columns are filled with None."""
+        n = self.num_rows
+        for column, value in record.items():
+            values = self.get(column)
+            if values is None:
+                values = self[column] = [None] * n
+            values.append(value)
+        if len(record) != len(self):
+            for values in self.values():
+                if len(values) == n:
+                    values.append(None)
+
+    def extend(self, other: Union["ColumnBatch", Iterable[Dict[str, Any]]]) -> None:
+        """Append the rows of another batch, or of an iterable of dict records."""
+        if not isinstance(other, dict):
+            for record in other:
+                self.append(record)
+            return
+        n, m = self.num_rows, ColumnBatch.num_rows.fget(other)  # type: ignore[attr-defined]
+        if not m:
+            return
+        for column, values in other.items():
+            mine = self.get(column)
+            if mine is None:
+                mine = self[column] = [None] * n
+            mine.extend(values)
+        if len(other) != len(self):
+            for column, values in self.items():
+                if column not in other:
+                    values.extend([None] * m)
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """Yield the rows as dicts (the list-of-dicts view)."""
+        columns = list(self)
+        for row in zip(*self.values()):
+            yield dict(zip(columns, row))
+
+    def intern_strings(self) -> "ColumnBatch":
+        """Replace every str value with its interned copy, in place; return self.
+
+        Each decoded response holds its own copies of labels such as stat
+        names, incident types or player names; after interning, all rows of
+        all matches share one object per distinct string.
+        """
+        intern = sys.intern
+        for values in self.values():
+            for i, value in enumerate(values):
+                if type(value) is str:
+                    values[i] = intern(value)
+        return self
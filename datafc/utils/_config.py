@@ -2,6 +2,9 @@ from typing import Optional
 
 ALLOWED_SOURCES = {"sofavpn", "sofascore"}
 
+# Row layouts of the per-player statistics functions: one row per stat or per player.
+ALLOWED_FORMATS = {"long", "wide"}
+
 SOFASCORE_HEADERS = {
     "Accept": "*/*",
     "Accept-Language": "en-US,en;q=0.9",
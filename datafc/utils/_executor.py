@@ -0,0 +1,121 @@
+"""
+Executor offload for CPU-bound work in the async API.
+
+JSON decoding and record parsing run synchronously on the event loop by
+default, so a large response (season-scale lineups, heatmaps) stalls every
+other in-flight request while it is being processed. With a parse executor
+set, ``AsyncSofascoreClient`` decodes large bodies and the ``aio`` functions
+run their parsers in a thread or process pool instead, and network I/O keeps
+flowing on the loop.
+
+A process pool gives real parallelism for the pure-Python parsers, at the cost
+of pickling the response into the worker and the records back. A thread pool
+avoids the copying but shares the GIL, so it mainly keeps the loop responsive.
+
+Usage:
+    from datafc import set_parse_executor
+
+    set_parse_executor("process", max_workers=4)
+    set_parse_executor("thread")
+    set_parse_executor(None)                    # parse on the loop (default)
+"""
+
+import asyncio
+import atexit
+import functools
+import json
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Union
+
+from datafc.exceptions import InvalidParameterError
+
+_executor: Optional[Executor] = None
+_owned: bool = False
+_min_json_bytes: int = 64 * 1024
+_lock = threading.Lock()
+
+
+def get_parse_executor() -> Optional[Executor]:
+    """Return the executor used for decoding/parsing in the async API, or None."""
+    return _executor
+
+
+def set_parse_executor(
+    executor: Union[str, Executor, None] = "thread",
+    max_workers: Optional[int] = None,
+    min_json_bytes: int = 64 * 1024,
+) -> None:
+    """
+    Run JSON decoding and response parsing of the async API in an executor.
+
+    Args:
+        executor: ``"thread"`` or ``"process"`` to create a pool owned by datafc,
+            an existing ``concurrent.futures.Executor`` to use as-is, or None to
+            parse on the event loop.
+        max_workers: Pool size when ``executor`` is a string. Defaults to the
+            ``concurrent.futures`` default.
+        min_json_bytes: Response bodies smaller than this are decoded on the loop,
+            where the hand-off would cost more than it saves. Defaults to 64 KiB.
+
+    Raises:
+        InvalidParameterError: If ``executor`` is an unknown string.
+    """
+    global _executor, _owned, _min_json_bytes
+    if isinstance(executor, str):
+        if executor == "thread":
+            new: Optional[Executor] = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="datafc-parse",
+            )
+        elif executor == "process":
+            new = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            raise InvalidParameterError(
+                f"Invalid executor '{executor}'. Must be 'thread', 'process' or an Executor."
+            )
+        owned = True
+    else:
+        new, owned = executor, False
+
+    with _lock:
+        old, old_owned = _executor, _owned
+        _executor, _owned, _min_json_bytes = new, owned, min_json_bytes
+    if old is not None and old_owned:
+        old.shutdown(wait=False)
+
+
+def _shutdown() -> None:
+    if _executor is not None and _owned:
+        _executor.shutdown(wait=False)
+
+
+atexit.register(_shutdown)
+
+
+def _offloadable(fn: Callable) -> bool:
+    """Process pools can only run functions importable by name."""
+    if not isinstance(_executor, ProcessPoolExecutor):
+        return True
+    qualname = getattr(fn, "__qualname__", "<")
+    return "<" not in qualname
+
+
+async def run_parser(fn: Callable[..., Any], *args: Any) -> Any:
+    """Call ``fn(*args)`` in the parse executor, or inline if none is set.
+
+    Closures and lambdas can't be sent to a process pool and run inline.
+    """
+    executor = _executor
+    if executor is None or not _offloadable(fn):
+        return fn(*args)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(fn, *args))
+
+
+async def decode_json(content: bytes) -> Any:
+    """Decode a response body, offloading large ones to the parse executor."""
+    executor = _executor
+    if executor is None or len(content) < _min_json_bytes:
+        return json.loads(content)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, json.loads, content)
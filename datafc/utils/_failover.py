@@ -0,0 +1,113 @@
+"""
+Mirror failover and hedged requests across the sofascore / sofavpn backends.
+
+``API_URLS`` and ``WWW_URLS`` define two equivalent hosts for every endpoint.
+With failover enabled, a request that fails on its host (connection error,
+timeout, 429, 5xx or an open circuit) is retried once on the mirror host.
+
+The async client can additionally hedge: when the primary has not answered
+within the ``hedge_percentile`` of its recent latencies, a second request is
+sent to the mirror and whichever answers first wins.
+
+Responses are always cached under the originally requested URL, so cache hits
+do not depend on which mirror served them.
+
+Usage:
+    from datafc import set_failover
+
+    set_failover(True)                          # fail over on errors
+    set_failover(True, hedge_percentile=95.0)   # + hedge slow async requests
+    set_failover(False)                         # back to single-source
+"""
+
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional
+from urllib.parse import urlparse
+
+from datafc.exceptions import APIError, CircuitOpenError, RateLimitError, ServerError
+from datafc.utils._config import API_URLS, WWW_URLS
+
+# base URL -> equivalent base URL on the other mirror
+_MIRROR_BASES: Dict[str, str] = {}
+for _urls in (API_URLS, WWW_URLS):
+    _MIRROR_BASES[_urls["sofascore"]] = _urls["sofavpn"]
+    _MIRROR_BASES[_urls["sofavpn"]] = _urls["sofascore"]
+
+
+def mirror_url(url: str) -> Optional[str]:
+    """Return ``url`` rewritten to the other mirror, or None if it has no mirror."""
+    for base, other in _MIRROR_BASES.items():
+        if url.startswith(base + "/"):
+            return other + url[len(base):]
+    return None
+
+
+def is_failover_error(exc: Exception) -> bool:
+    """True for errors that say something about the host rather than the resource."""
+    if isinstance(exc, (RateLimitError, ServerError, CircuitOpenError)):
+        return True
+    return isinstance(exc, APIError) and exc.status_code == 0
+
+
+class LatencyTracker:
+    """Rolling window of successful request latencies per host."""
+
+    def __init__(self, window: int = 200, min_samples: int = 10) -> None:
+        self._window = window
+        self._min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, url: str, seconds: float) -> None:
+        host = urlparse(url).netloc
+        with self._lock:
+            samples = self._samples.get(host)
+            if samples is None:
+                samples = self._samples[host] = deque(maxlen=self._window)
+            samples.append(seconds)
+
+    def percentile(self, url: str, pct: float) -> Optional[float]:
+        """Latency percentile for the URL's host, or None until enough samples exist."""
+        host = urlparse(url).netloc
+        with self._lock:
+            samples = sorted(self._samples.get(host, ()))
+        if len(samples) < self._min_samples:
+            return None
+        idx = min(len(samples) - 1, int(round(pct / 100.0 * (len(samples) - 1))))
+        return samples[idx]
+
+
+latency_tracker = LatencyTracker()
+
+# ---------------------------------------------------------------------------
+# Module-level defaults
+# ---------------------------------------------------------------------------
+
+_failover_enabled: bool = False
+_hedge_percentile: Optional[float] = None
+
+
+def get_failover() -> tuple:
+    """Return ``(enabled, hedge_percentile)`` used by clients created without overrides."""
+    return _failover_enabled, _hedge_percentile
+
+
+def set_failover(enabled: bool = True, hedge_percentile: Optional[float] = None) -> None:
+    """
+    Enable or disable multi-source mode for all Sofascore clients.
+
+    Args:
+        enabled: Retry failed requests on the mirror host.
+        hedge_percentile: Async clients only. If set (e.g. ``95.0``), send a second
+            request to the mirror once the primary has been in flight longer than
+            this percentile of the primary host's recent latencies. Requires
+            ``enabled=True``.
+    """
+    global _failover_enabled, _hedge_percentile
+    if hedge_percentile is not None and not 0 < hedge_percentile < 100:
+        raise ValueError("hedge_percentile must be between 0 and 100.")
+    if hedge_percentile is not None and not enabled:
+        raise ValueError("hedge_percentile requires enabled=True.")
+    _failover_enabled = enabled
+    _hedge_percentile = hedge_percentile
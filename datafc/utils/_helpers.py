@@ -18,9 +18,6 @@ def _safe_apply(df: pd.DataFrame, col: str, func: Optional[Callable] = None):
     return df[col].apply(func) if func is not None else df[col]
 
 
-def _cast_int_cols(df: pd.DataFrame, *cols: str) -> pd.DataFrame:
-    """Cast nullable ID columns to Int64 so they stay integer even when NaN is present."""
-    for col in cols:
-        if col in df.columns:
-            df[col] = df[col].astype("Int64")
-    return df
+def _id_or_zero(value) -> int:
+    """Return an ID as int, or 0 when missing (None, NaN or pd.NA)."""
+    return int(value) if pd.notna(value) and value else 0
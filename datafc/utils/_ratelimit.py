@@ -0,0 +1,48 @@
+"""
+Process-wide request rate limiter shared by the sync and async Sofascore clients.
+
+Callers reserve the next request slot under a ``threading.Lock`` and then sleep
+until it arrives — ``time.sleep`` in sync code, ``asyncio.sleep`` in async code.
+No lock is held while sleeping and no asyncio primitive is involved, so the
+limiter works the same from any thread and any event loop: two threads with
+their own loops, a sync client and an async client all draw from one budget.
+"""
+
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Slot-reserving rate limiter.
+
+    Each request starts at least ``min_interval`` seconds (the caller's own
+    interval) after the previously reserved request, so the combined rate never
+    exceeds the most conservative caller's limit.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._last_slot = 0.0
+
+    def reserve(self, min_interval: float) -> float:
+        """Reserve the next slot and return the seconds to wait until it."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._last_slot + min_interval)
+            self._last_slot = slot
+            return slot - now
+
+    def wait(self, min_interval: float) -> None:
+        delay = self.reserve(min_interval)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self, min_interval: float) -> None:
+        delay = self.reserve(min_interval)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+rate_limiter = RateLimiter()
@@ -140,3 +140,25 @@ def save_parquet(
         logger.info("Parquet saved: %s", file_path)
     except OSError as e:
         logger.error("Error saving Parquet to %s: %s", file_path, e)
+
+
+def save_npz(
+    data,
+    fn_name: str,
+    data_source: str,
+    country: str,
+    tournament: str,
+    season=None,
+    week_number=None,
+    output_dir: str = ".",
+) -> None:
+    """Save an array-backed result (e.g. ``HeatmapGrids``) as an uncompressed ``.npz``."""
+    os.makedirs(output_dir, exist_ok=True)
+    file_name = _build_filename("npz", data_source, country, tournament, fn_name, season, week_number)
+    file_path = os.path.join(output_dir, file_name)
+    _warn_overwrite(file_path)
+    try:
+        data.save(file_path)
+        logger.info("NPZ saved: %s", file_path)
+    except OSError as e:
+        logger.error("Error saving NPZ to %s: %s", file_path, e)
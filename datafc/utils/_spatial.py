@@ -0,0 +1,333 @@
+"""
+Memory-mapped columnar store for spatial event data.
+
+``shots_data``, ``coordinates_data``, ``average_positions_data`` and
+``goal_networks_data`` return x/y coordinates that spatial analyses reload
+over and over. Re-reading JSON or Parquet for every query means decoding the
+whole file. A ``SpatialStore`` writes each dataset once as fixed-width NumPy
+columns (``.npy`` files) and memory-maps them on read, so a slice by
+``game_id`` or ``player_id`` only touches the rows it needs.
+
+Layout of a store directory::
+
+    store/
+      shots_data/
+        manifest.json           parts, column kinds and dictionaries
+        part-00000/             one part per ``write`` call (e.g. one season)
+          xg.npy                float64 or float32, as written (NaN for missing)
+          player_id.npy         int64, plus player_id.valid.npy if any is missing
+          player_name.npy       int32 dictionary codes (-1 for missing), for
+                                categoricals and strings alike
+          _game_id.keys.npy     index: sorted distinct keys,
+          _game_id.starts.npy   their offsets into
+          _game_id.order.npy    the row positions sorted by key
+
+Rows of a part are sorted by ``game_id`` when written, so one game's rows
+are a contiguous, zero-copy view of every column. ``player_id`` lookups
+gather the player's rows through the index.
+
+Usage:
+    store = SpatialStore("data/spatial")
+    store.write("shots_data", shots_df)                  # e.g. once per season
+    xy = store.arrays("shots_data", ["player_coordinates_x", "player_coordinates_y"],
+                      game_id=12437786)                   # memory-mapped views
+    df = store.read("coordinates_data", player_id=[12994, 934235])
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from datafc.exceptions import DataNotAvailableError, InvalidParameterError
+from datafc.utils._backend import as_input_frame
+
+INDEX_KEYS = ("game_id", "player_id")
+
+Keys = Union[int, Iterable[int], None]
+
+
+def _encode(values: pd.Series) -> tuple:
+    """Return ``(kind, array, validity or None, meta)`` for one column."""
+    dtype = values.dtype
+    if isinstance(dtype, pd.CategoricalDtype) or not (
+        pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_datetime64_any_dtype(dtype)
+    ):
+        codes, categories = pd.factorize(values, use_na_sentinel=True)
+        return "dictionary", codes.astype(np.int32), None, {
+            "categories": [v.item() if isinstance(v, np.generic) else v for v in categories],
+            "categorical": isinstance(dtype, pd.CategoricalDtype),
+        }
+    valid = values.notna().to_numpy(dtype=bool)
+    validity = None if valid.all() else valid
+    if pd.api.types.is_bool_dtype(dtype):
+        return "bool", values.to_numpy(dtype=np.int8, na_value=0), validity, {}
+    if pd.api.types.is_integer_dtype(dtype):
+        return "int", values.to_numpy(dtype=np.int64, na_value=0), validity, {}
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        stamps = values.to_numpy(dtype="datetime64[ns]", na_value=np.datetime64("NaT"))
+        return "datetime", stamps.view(np.int64), validity, {}
+    width = np.dtype(getattr(dtype, "numpy_dtype", dtype))
+    float_dtype = np.float32 if width == np.float32 else np.float64
+    return "float", values.to_numpy(dtype=float_dtype, na_value=np.nan), None, {}
+
+
+def _decode(kind: str, values: np.ndarray, validity: Optional[np.ndarray], meta: dict):
+    if kind == "dictionary":
+        if meta["categorical"]:
+            return pd.Categorical.from_codes(np.asarray(values), categories=meta["categories"])
+        # Plain strings: look the codes up, with -1 (missing) hitting the trailing None.
+        lookup = np.array(meta["categories"] + [None], dtype=object)
+        return lookup[np.asarray(values)]
+    if kind == "float":
+        return values
+    mask = None if validity is None else ~np.asarray(validity)
+    if kind == "datetime":
+        stamps = np.asarray(values).view("datetime64[ns]").copy()
+        if mask is not None:
+            stamps[mask] = np.datetime64("NaT")
+        return stamps
+    data = np.array(values, dtype=bool if kind == "bool" else np.int64)
+    if mask is None:
+        mask = np.zeros(len(data), dtype=bool)
+    if kind == "bool":
+        return pd.arrays.BooleanArray(data, mask)
+    return pd.arrays.IntegerArray(data, mask)
+
+
+def _as_keys(keys: Keys) -> Optional[np.ndarray]:
+    if keys is None:
+        return None
+    if isinstance(keys, (int, np.integer)):
+        return np.array([keys], dtype=np.int64)
+    return np.asarray(list(keys), dtype=np.int64)
+
+
+class SpatialStore:
+    """
+    Directory of memory-mapped, fixed-width column files, one subdirectory per dataset.
+
+    Args:
+        path: Store directory; created on the first ``write``.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def __repr__(self) -> str:
+        return f"SpatialStore(path={self.path!r}, datasets={self.datasets})"
+
+    @property
+    def datasets(self) -> List[str]:
+        if not os.path.isdir(self.path):
+            return []
+        return sorted(
+            name for name in os.listdir(self.path)
+            if os.path.isfile(os.path.join(self.path, name, "manifest.json"))
+        )
+
+    def _manifest_path(self, name: str) -> str:
+        return os.path.join(self.path, name, "manifest.json")
+
+    def _manifest(self, name: str) -> dict:
+        try:
+            with open(self._manifest_path(name), encoding="utf-8") as f:
+                manifest: dict = json.load(f)
+                return manifest
+        except FileNotFoundError:
+            raise DataNotAvailableError(
+                f"Dataset '{name}' not found in {self.path}. Available: {', '.join(self.datasets) or 'none'}."
+            ) from None
+
+    def num_rows(self, name: str) -> int:
+        return sum(part["rows"] for part in self._manifest(name)["parts"])
+
+    def columns(self, name: str) -> List[str]:
+        parts = self._manifest(name)["parts"]
+        return list(parts[0]["columns"]) if parts else []
+
+    def write(self, name: str, df: Any) -> int:
+        """
+        Add ``df`` to dataset ``name`` as a new part; return the part number.
+
+        ``df`` may be a DataFrame, ``pyarrow.Table`` or ``polars.DataFrame``,
+        usually the output of ``shots_data``, ``coordinates_data``,
+        ``average_positions_data`` or ``goal_networks_data``. Parts of a dataset
+        should share its columns; a column missing from a part reads as missing
+        values in ``arrays`` and is left out of that part in ``read``.
+
+        Raises:
+            InvalidParameterError: If ``df`` is empty.
+        """
+        df = as_input_frame(df)
+        if df is None or df.empty:
+            raise InvalidParameterError("Cannot write an empty frame to a SpatialStore.")
+        if "game_id" in df.columns:
+            df = df.sort_values("game_id", kind="stable")
+        dataset_dir = os.path.join(self.path, name)
+        os.makedirs(dataset_dir, exist_ok=True)
+        manifest: dict = (
+            self._manifest(name) if os.path.exists(self._manifest_path(name))
+            else {"name": name, "parts": []}
+        )
+        number = len(manifest["parts"])
+        part_name = f"part-{number:05d}"
+        part_dir = os.path.join(dataset_dir, part_name)
+        os.makedirs(part_dir, exist_ok=True)
+
+        columns: Dict[str, dict] = {}
+        for column in df.columns:
+            kind, values, validity, meta = _encode(df[column])
+            np.save(os.path.join(part_dir, f"{column}.npy"), values)
+            if validity is not None:
+                np.save(os.path.join(part_dir, f"{column}.valid.npy"), validity)
+            columns[str(column)] = {
+                "kind": kind, "dtype": str(values.dtype), "valid": validity is not None, **meta,
+            }
+
+        indexed, contiguous = [], []
+        for key in INDEX_KEYS:
+            if key not in df.columns or columns[key]["kind"] != "int":
+                continue
+            keys = df[key].to_numpy(dtype=np.int64, na_value=-1)
+            order = np.argsort(keys, kind="stable")
+            distinct, starts = np.unique(keys[order], return_index=True)
+            np.save(os.path.join(part_dir, f"_{key}.keys.npy"), distinct)
+            np.save(os.path.join(part_dir, f"_{key}.starts.npy"), np.append(starts, len(keys)))
+            np.save(os.path.join(part_dir, f"_{key}.order.npy"), order)
+            indexed.append(key)
+            if np.array_equal(order, np.arange(len(keys))):
+                contiguous.append(key)
+
+        manifest["parts"].append({
+            "path": part_name, "rows": len(df), "columns": columns,
+            "index": indexed, "contiguous": contiguous,
+        })
+        tmp = self._manifest_path(name) + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        os.replace(tmp, self._manifest_path(name))
+        return number
+
+    def _load(self, part_dir: str, file_name: str) -> np.ndarray:
+        array: np.ndarray = np.load(os.path.join(part_dir, file_name), mmap_mode="r")
+        return array
+
+    def _rows(self, part: dict, part_dir: str, game_id: Keys, player_id: Keys):
+        """Rows of a part matching the filters: a slice, an index array or None (no match)."""
+        rows: Any = slice(0, part["rows"])
+        for key, wanted in (("game_id", _as_keys(game_id)), ("player_id", _as_keys(player_id))):
+            if wanted is None:
+                continue
+            if key not in part["index"]:
+                raise InvalidParameterError(f"Dataset has no {key} index to filter on.")
+            distinct = self._load(part_dir, f"_{key}.keys.npy")
+            starts = self._load(part_dir, f"_{key}.starts.npy")
+            order = self._load(part_dir, f"_{key}.order.npy")
+            found = np.searchsorted(distinct, wanted)
+            hit = found < len(distinct)
+            hit[hit] = distinct[found[hit]] == wanted[hit]
+            found = found[hit]
+            if not len(found):
+                return None
+            if len(found) == 1 and key in part["contiguous"] and isinstance(rows, slice):
+                # Rows are sorted by this key, so its rows are one contiguous range.
+                rows = slice(int(starts[found[0]]), int(starts[found[0] + 1]))
+                continue
+            positions = np.sort(np.concatenate([order[starts[i]:starts[i + 1]] for i in found]))
+            if isinstance(rows, slice):
+                rows = positions[(positions >= rows.start) & (positions < rows.stop)]
+            else:
+                rows = np.intersect1d(rows, positions, assume_unique=True)
+            if not len(rows):
+                return None
+        return rows
+
+    def _parts(self, name: str, columns: Optional[Sequence[str]], game_id: Keys, player_id: Keys):
+        manifest = self._manifest(name)
+        known = {column for part in manifest["parts"] for column in part["columns"]}
+        unknown = [column for column in (columns or ()) if column not in known]
+        if unknown:
+            raise InvalidParameterError(
+                f"Unknown column(s) for {name}: {', '.join(unknown)}. Must be among: {', '.join(sorted(known))}."
+            )
+        for part in manifest["parts"]:
+            part_dir = os.path.join(self.path, name, part["path"])
+            rows = self._rows(part, part_dir, game_id, player_id)
+            if rows is not None:
+                yield part, part_dir, rows, list(columns) if columns else list(part["columns"])
+
+    def arrays(
+        self,
+        name: str,
+        columns: Optional[Sequence[str]] = None,
+        game_id: Keys = None,
+        player_id: Keys = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Stored values of ``columns`` for the matching rows, as NumPy arrays.
+
+        A single ``game_id`` in a single-part dataset returns read-only views
+        of the memory-mapped files; other selections gather only the matching
+        rows. Values are as stored: floats use NaN for missing, integer and
+        boolean columns hold 0 where missing (see ``read`` for typed output),
+        and dictionary columns are their ``int32`` codes.
+
+        Raises:
+            DataNotAvailableError: If the dataset does not exist or no row matches.
+        """
+        chunks: Dict[str, list] = {}
+        for part, part_dir, rows, names in self._parts(name, columns, game_id, player_id):
+            for column in names:
+                info = part["columns"].get(column)
+                if info is None:
+                    values = np.full(part["rows"], np.nan)
+                else:
+                    values = self._load(part_dir, f"{column}.npy")
+                chunks.setdefault(column, []).append(values[rows])
+        if not chunks:
+            raise DataNotAvailableError(f"No rows of {name} match the given filters.")
+        return {
+            column: parts[0] if len(parts) == 1 else np.concatenate(parts)
+            for column, parts in chunks.items()
+        }
+
+    def read(
+        self,
+        name: str,
+        columns: Optional[Sequence[str]] = None,
+        game_id: Keys = None,
+        player_id: Keys = None,
+    ) -> pd.DataFrame:
+        """
+        Matching rows of dataset ``name`` as a DataFrame with the original dtypes.
+
+        Raises:
+            DataNotAvailableError: If the dataset does not exist or no row matches.
+        """
+        frames = []
+        for part, part_dir, rows, names in self._parts(name, columns, game_id, player_id):
+            data = {}
+            for column in names:
+                info = part["columns"].get(column)
+                if info is None:
+                    continue
+                values = self._load(part_dir, f"{column}.npy")[rows]
+                validity = (
+                    self._load(part_dir, f"{column}.valid.npy")[rows] if info["valid"] else None
+                )
+                data[column] = _decode(info["kind"], values, validity, info)
+            frames.append(pd.DataFrame(data))
+        if not frames:
+            raise DataNotAvailableError(f"No rows of {name} match the given filters.")
+        if len(frames) == 1:
+            return frames[0]
+        df = pd.concat(frames, ignore_index=True)
+        # Parts carry their own dictionaries; concat falls back to object for those.
+        for column in df.columns:
+            if any(isinstance(f[column].dtype, pd.CategoricalDtype) for f in frames if column in f):
+                if not isinstance(df[column].dtype, pd.CategoricalDtype):
+                    df[column] = df[column].astype("category")
+        return df
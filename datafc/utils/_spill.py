@@ -0,0 +1,231 @@
+"""
+Out-of-core record buffering for very large crawls.
+
+Functions like ``coordinates_data`` collect every record as a Python dict
+before building one DataFrame; for a full league that is tens of millions of
+rows and several gigabytes. With ``spill_dir`` set, records are appended to a
+``RecordSpiller`` instead, which converts every ``chunk_rows`` records into a
+Parquet file and drops them from memory. The function then returns a
+``SpilledDataset``: a handle on those files that loads them lazily, chunk by
+chunk or all at once.
+
+Each run writes to its own fresh subdirectory of ``spill_dir``. Files are kept
+until ``SpilledDataset.remove()`` is called.
+
+Columns whose values mix numbers, text and dicts (lineups ``stat_value``) have
+no single Parquet type. The fetch functions name them in ``json_columns``;
+they are stored as JSON text in every chunk and decoded on load, so a spilled
+run returns the same values and dtypes as the in-memory one.
+
+Requires ``pyarrow`` (``pip install datafc[parquet]``).
+
+Usage:
+    ds = coordinates_data(lineups_df, spill_dir="/data/spill")
+    for chunk in ds.iter_frames():          # bounded memory
+        ...
+    df = ds.to_pandas(columns=["player_id", "x", "y"])
+"""
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Union
+
+import pandas as pd
+
+from datafc.utils._columns import ColumnBatch
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_ROWS = 100_000
+
+# Parquet schema metadata key listing a chunk's JSON-encoded columns.
+_JSON_COLUMNS_KEY = b"datafc.json_columns"
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "Spilling to disk requires pyarrow. Install it with: pip install pyarrow"
+        ) from None
+    return pyarrow
+
+
+def _as_str(value):
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+    return str(value)
+
+
+def _to_json(value):
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _from_json(value):
+    return json.loads(value) if isinstance(value, str) else None
+
+
+def _json_columns(schema) -> List[str]:
+    raw = (schema.metadata or {}).get(_JSON_COLUMNS_KEY)
+    return json.loads(raw) if raw else []
+
+
+def _decode_json_columns(df: pd.DataFrame, columns: Iterable[str]) -> pd.DataFrame:
+    # Rebuilt from a list so the dtype is inferred as for the in-memory frame.
+    for col in columns:
+        if col in df.columns:
+            df[col] = pd.Series([_from_json(v) for v in df[col]], index=df.index)
+    return df
+
+
+class SpilledDataset:
+    """
+    Lazily loaded result of a spilled run: a directory of Parquet chunks.
+
+    Chunks are written as records arrive, so their columns can differ slightly
+    (e.g. a statistic no player in a chunk had); loading aligns them the same
+    way ``pd.concat`` does.
+    """
+
+    def __init__(self, path: str, paths: List[str], num_rows: int) -> None:
+        self.path = path
+        self.paths = list(paths)
+        self.num_rows = num_rows
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def __repr__(self) -> str:
+        return f"SpilledDataset(path={self.path!r}, chunks={len(self.paths)}, rows={self.num_rows})"
+
+    def _iter_raw(self, columns: Optional[List[str]]):
+        """Yield ``(frame, json_columns)`` per chunk, JSON columns still encoded."""
+        pq = _require_pyarrow().parquet
+        for chunk_path in self.paths:
+            schema = pq.read_schema(chunk_path)
+            present = None if columns is None else [c for c in columns if c in schema.names]
+            yield pq.read_table(chunk_path, columns=present).to_pandas(), _json_columns(schema)
+
+    def iter_frames(self, columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+        """Yield one DataFrame per chunk, in write order."""
+        for frame, json_cols in self._iter_raw(columns):
+            yield _decode_json_columns(frame, json_cols)
+
+    def to_pandas(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Load every chunk into one DataFrame."""
+        frames, json_cols = [], set()
+        for frame, chunk_json_cols in self._iter_raw(columns):
+            frames.append(frame)
+            json_cols.update(chunk_json_cols)
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        df = pd.concat(frames, ignore_index=True)
+        # Chunks carry their own categories, and concatenating categoricals
+        # with different categories falls back to object; restore them.
+        categorical = {
+            col for frame in frames for col in frame.columns
+            if isinstance(frame[col].dtype, pd.CategoricalDtype)
+        }
+        for col in categorical - json_cols:
+            if not isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype("category")
+        # Decoded over the whole column, so its dtype doesn't depend on chunking.
+        return _decode_json_columns(df, json_cols)
+
+    def remove(self) -> None:
+        """Delete the chunk files and their directory."""
+        shutil.rmtree(self.path, ignore_errors=True)
+        self.paths = []
+
+
+class RecordSpiller:
+    """
+    Accumulates records and writes them to Parquet every ``chunk_rows`` rows.
+
+    Use ``extend`` as a drop-in for ``list.extend`` on the records list, then
+    ``finish()`` to flush the remainder and get the ``SpilledDataset``. Not
+    thread-safe; the sync and async fetch paths call it from one thread.
+
+    Args:
+        spill_dir: Parent directory; a fresh subdirectory is created for this run.
+        prefix: Subdirectory name prefix, usually the function name.
+        chunk_rows: Records per Parquet file. Defaults to 100 000.
+        build: Turns a buffered ``ColumnBatch`` into the chunk's DataFrame.
+            Defaults to ``pd.DataFrame``; the fetch functions pass their
+            schema builder so chunks carry the declared dtypes.
+        json_columns: Mixed-type columns to store as JSON text in every chunk
+            (see ``MIXED_COLUMNS`` in ``datafc.sofascore._schemas``).
+    """
+
+    def __init__(
+        self,
+        spill_dir: str,
+        prefix: str = "datafc",
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        build: Optional[Callable[[ColumnBatch], pd.DataFrame]] = None,
+        json_columns: Sequence[str] = (),
+    ) -> None:
+        self._pa = _require_pyarrow()
+        os.makedirs(spill_dir, exist_ok=True)
+        self.path = tempfile.mkdtemp(prefix=f"{prefix}-", dir=spill_dir)
+        self._chunk_rows = max(1, chunk_rows)
+        self._build = build or pd.DataFrame
+        self._json_columns = list(json_columns)
+        self._buffer = ColumnBatch()
+        self._paths: List[str] = []
+        self.num_rows = 0
+
+    def extend(self, records: Union[ColumnBatch, Iterable[dict]]) -> None:
+        """Add a ``ColumnBatch`` or an iterable of dict records."""
+        self._buffer.extend(records)
+        if self._buffer.num_rows >= self._chunk_rows:
+            self.flush()
+
+    def append(self, record: dict) -> None:
+        self.extend((record,))
+
+    def flush(self) -> None:
+        """Write buffered records to a new chunk file."""
+        if not self._buffer.num_rows:
+            return
+        buffer, self._buffer = self._buffer, ColumnBatch()
+        for col in self._json_columns:
+            if col in buffer:
+                buffer[col] = [_to_json(v) for v in buffer[col]]
+        frame = self._build(buffer)
+        chunk_path = os.path.join(self.path, f"part-{len(self._paths):05d}.parquet")
+        self._pa.parquet.write_table(self._to_table(frame), chunk_path)
+        self._paths.append(chunk_path)
+        self.num_rows += len(frame)
+        logger.debug("Spilled %d rows to %s", len(frame), chunk_path)
+
+    def finish(self) -> SpilledDataset:
+        self.flush()
+        return SpilledDataset(self.path, self._paths, self.num_rows)
+
+    def _to_table(self, frame: pd.DataFrame):
+        pa = self._pa
+        try:
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Undeclared mixed-type object columns (e.g. str and int) have no
+            # Arrow type; store those as strings rather than failing the crawl.
+            for col in frame.select_dtypes(include="object").columns:
+                try:
+                    pa.array(frame[col])
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    frame[col] = frame[col].map(_as_str)
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+        json_cols = [col for col in self._json_columns if col in frame.columns]
+        if not json_cols:
+            return table
+        metadata = dict(table.schema.metadata or {})
+        metadata[_JSON_COLUMNS_KEY] = json.dumps(json_cols).encode()
+        return table.replace_schema_metadata(metadata)
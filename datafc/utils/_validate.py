@@ -5,7 +5,7 @@ Shared validation helpers and utility functions used across all fetch modules.
 from typing import Optional
 import pandas as pd
 from datafc.exceptions import InvalidParameterError
-from datafc.utils._config import ALLOWED_SOURCES, get_tournament_url_patterns
+from datafc.utils._config import ALLOWED_FORMATS, ALLOWED_SOURCES, get_tournament_url_patterns
 
 
 def validate_source(data_source: str) -> None:
@@ -16,6 +16,14 @@ def validate_source(data_source: str) -> None:
         )
 
 
+def validate_format(format: str) -> None:
+    """Raise InvalidParameterError if format is not in ALLOWED_FORMATS."""
+    if format not in ALLOWED_FORMATS:
+        raise InvalidParameterError(
+            f"Invalid format: '{format}'. Must be one of {ALLOWED_FORMATS}."
+        )
+
+
 def validate_df(df: Optional[pd.DataFrame], name: str) -> None:
     """Raise InvalidParameterError if df is None or empty."""
     if df is None or df.empty: